@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+# Synthetic client activity shown on the Client Overview page. Every value is a pure
+# function of (client, month, metric), so it is stable across reruns, sessions and
+# batches, and the same table can be regenerated at any size for load testing.
+ACTIVITY_MONTHS = 12
+
+# Inclusive value ranges per metric; the id keeps each metric's stream independent
+MONTHLY_METRICS = {
+    "CR Requests": (1, 0, 3),
+    "Renewal Likelihood": (2, 60, 100),
+    "Engagement Score": (3, 60, 100),
+}
+CURRENT_ENGAGEMENT = (4, 70, 100)
+SOLUTION_USAGE = (5, 1, 10)
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+# Function to scramble 64-bit keys (SplitMix64 finalizer); equal keys always give equal outputs
+def _mix(keys):
+    z = np.asarray(keys, dtype=np.uint64) + _GOLDEN
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+# Function to hash strings (client or solution names) to stable 64-bit seeds
+def name_seeds(names):
+    return pd.util.hash_array(np.asarray(names, dtype=object))
+
+
+# Function to draw integers in [low, high] for every (seed, key) pair of the broadcast arrays
+def _draw(seeds, keys, metric, low, high):
+    z = _mix(np.asarray(seeds, dtype=np.uint64) ^ _mix(np.asarray(keys, dtype=np.uint64) * np.uint64(8) + np.uint64(metric)))
+    return (low + (z >> np.uint64(11)) % np.uint64(high - low + 1)).astype(np.uint8)
+
+
+# Function to get the last ACTIVITY_MONTHS calendar months up to and including `as_of`
+def activity_months(as_of, periods=ACTIVITY_MONTHS):
+    return pd.period_range(end=pd.Period(as_of, freq="M"), periods=periods, freq="M")
+
+
+# Function to draw each solution's usage count for one client
+def solution_usage(client_name, solutions):
+    metric, low, high = SOLUTION_USAGE
+    return _draw(name_seeds([client_name]), name_seeds(solutions), metric, low, high).tolist()
+
+
+# Columnar activity table: one uint8 matrix (clients x months) per metric plus a name index
+class ActivityTable:
+    def __init__(self, client_names, months, metrics, current_engagement):
+        self.client_names = list(client_names)
+        self.months = months
+        self.metrics = metrics
+        self.current_engagement = current_engagement
+        self._positions = {name: i for i, name in enumerate(self.client_names)}
+
+    # Function to get one client's series as plain lists (month labels plus one list per metric)
+    def client(self, client_name):
+        i = self._positions[client_name]
+        series = {"Month": self.months.strftime("%b %Y").tolist()}
+        for name, values in self.metrics.items():
+            series[name] = values[i].tolist()
+        series["Current Engagement"] = int(self.current_engagement[i])
+        return series
+
+    # Function to flatten the table to one row per (client, month), e.g. for writing to disk
+    def to_frame(self):
+        frame = pd.DataFrame({
+            "Client Name": np.repeat(np.asarray(self.client_names, dtype=object), len(self.months)),
+            "Month": np.tile(self.months.to_timestamp(), len(self.client_names)),
+        })
+        for name, values in self.metrics.items():
+            frame[name] = values.ravel()
+        return frame
+
+
+# Function to generate the activity table for a batch of clients in one vectorized pass
+def generate_activity(client_names, as_of, periods=ACTIVITY_MONTHS):
+    months = activity_months(as_of, periods)
+    seeds = name_seeds(client_names)[:, None]
+    ordinals = months.asi8.astype(np.uint64)[None, :]
+    metrics = {
+        name: _draw(seeds, ordinals, metric, low, high)
+        for name, (metric, low, high) in MONTHLY_METRICS.items()
+    }
+    metric, low, high = CURRENT_ENGAGEMENT
+    current_engagement = _draw(seeds[:, 0], ordinals[0, -1:], metric, low, high)
+    return ActivityTable(client_names, months, metrics, current_engagement)
@@ -0,0 +1,327 @@
+import io
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pricing import (
+    COMPLEXITY_COST, COMPLIANCE_COST, COST_COLUMNS, DEFAULTS, FEATURE_COST, MONITORING_COST,
+    NUMERIC_RANGES, RETENTION_MULTIPLIER, SECURITY_COST, STORAGE_COST, SUPPORT_COST, TRAINING_COST, price_scenarios,
+)
+from prompt_builder import PROMPT_FIELDS
+
+# Batch pricing of a book of Cost Estimator configurations (one row per configuration,
+# columns named like project_params). Input is read and output written chunk by chunk,
+# so memory stays flat whatever the size of the book.
+CHUNK_ROWS = 10_000
+DESCRIPTION_CHUNK_ROWS = 100  # smaller chunks when describing, so checkpoints come often
+DESCRIPTION_CONCURRENCY = 4
+LIST_SEPARATOR = ";"  # separates data_sources in CSV cells
+
+# Allowed values of each categorical field; a missing column or blank cell takes the
+# first value, as the Cost Estimator's widgets do
+CATEGORICAL_FIELDS = {
+    "transformation_complexity": COMPLEXITY_COST,
+    "storage_needs": STORAGE_COST,
+    "data_retention": RETENTION_MULTIPLIER,
+    "security_level": SECURITY_COST,
+    "data_compliance": COMPLIANCE_COST,
+    "monitoring": MONITORING_COST,
+    "support": SUPPORT_COST,
+    "training_sessions": TRAINING_COST,
+}
+NUMERIC_FIELDS = list(NUMERIC_RANGES)  # whole numbers within the widgets' ranges
+BOOLEAN_FIELDS = list(FEATURE_COST)
+TRUE_VALUES = {"true", "t", "yes", "y", "1"}
+FALSE_VALUES = {"false", "f", "no", "n", "0", ""}
+
+# Fields passed to the description prompt
+DESCRIPTION_FIELDS = list(PROMPT_FIELDS)
+
+ROW_COLUMN = "row"  # 0-based position of the configuration in the input
+OUTPUT_COLUMNS = COST_COLUMNS + ["error"]
+DESCRIPTION_COLUMNS = ["description", "description_error"]
+OUTPUT_TYPES = {
+    "data_sources": pa.list_(pa.string()),
+    "error": pa.string(),
+    "description": pa.string(),
+    "description_error": pa.string(),
+}
+
+
+# Function to tell CSV from Parquet by file name
+def file_format(name):
+    extension = os.path.splitext(str(name).rstrip("/"))[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"Unsupported file type {extension or '(none)'}: expected .csv or .parquet")
+
+
+# Function to read configurations in chunks from a CSV or Parquet path or file object.
+# CSV cells are read as text and typed by prepare_configurations.
+def read_chunks(source, name=None, chunk_rows=CHUNK_ROWS):
+    if file_format(name or source) == "csv":
+        yield from pd.read_csv(source, chunksize=chunk_rows, dtype=str, keep_default_na=False)
+    else:
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+
+
+# Function to split a data_sources cell (a separated string or a list) into a list
+def _source_list(value):
+    if isinstance(value, str):
+        return [source.strip() for source in value.split(LIST_SEPARATOR) if source.strip()]
+    if value is None or (np.isscalar(value) and pd.isna(value)):
+        return []
+    return list(value)
+
+
+# Function to type and validate a chunk of configurations. Returns the frame with every
+# pricing field filled in and one error message per row ("" when the row is valid).
+def prepare_configurations(chunk):
+    frame = chunk.copy()
+    errors = pd.Series("", index=frame.index, dtype=object)
+
+    def flag(invalid, message):
+        return errors.where(~invalid, errors + message + "; ")
+
+    # A missing column, a null cell (Parquet) or a blank one (CSV) takes the field's default
+    def cells(field):
+        values = frame[field].astype(object) if field in frame else pd.Series(None, index=frame.index, dtype=object)
+        blank = values.isna() | values.map(lambda value: isinstance(value, str) and not value.strip())
+        return values, blank
+
+    for field, table in CATEGORICAL_FIELDS.items():
+        default = next(iter(table))
+        values, blank = cells(field)
+        values = values.where(~blank, default).astype(str).str.strip()
+        invalid = ~values.isin(list(table))
+        errors = flag(invalid, f"unknown {field}")
+        frame[field] = values.where(~invalid, default)
+
+    for field in NUMERIC_FIELDS:
+        values, blank = cells(field)
+        values = pd.to_numeric(values.where(~blank, DEFAULTS[field]).astype(str).str.strip(), errors="coerce")
+        low, high = NUMERIC_RANGES[field]
+        errors = flag(values.isna() | (values % 1 != 0), f"invalid {field} (expected a whole number)")
+        errors = flag((values < low) | (values > high), f"{field} out of range ({low}-{high})")
+        invalid = values.isna() | (values % 1 != 0) | (values < low) | (values > high)
+        frame[field] = values.where(~invalid, DEFAULTS[field]).astype(np.int64)
+
+    for field in BOOLEAN_FIELDS:
+        values, blank = cells(field)
+        text = values.where(~blank, "").astype(str).str.strip().str.lower()
+        invalid = ~text.isin(TRUE_VALUES | FALSE_VALUES)
+        errors = flag(invalid, f"invalid {field}")
+        frame[field] = text.isin(TRUE_VALUES).where(~blank, DEFAULTS[field])
+
+    sources = frame["data_sources"].map(_source_list) if "data_sources" in frame else pd.Series(
+        [[] for _ in range(len(frame))], index=frame.index, dtype=object,
+    )
+    frame["data_sources"] = sources
+    frame["data_source_count"] = sources.map(len)
+    return frame, errors
+
+
+# Function to price a prepared chunk in one vectorized pass; rows with errors get no costs
+def price_chunk(frame, errors):
+    costs = price_scenarios(frame.drop(columns=["data_sources"]))
+    return costs.mask(errors != "")
+
+
+# Function to generate a group of descriptions, returning (description, error) per configuration
+# instead of raising
+def _describe(generate, group, batch_size):
+    try:
+        results = generate(group, batch_size)
+    except Exception as e:
+        results = [e] * len(group)
+    return [("", f"{type(r).__name__}: {r}") if isinstance(r, Exception) else (r, "") for r in results]
+
+
+# Function to describe every valid row of a chunk through the bounded worker pool, passing
+# batch_size rows per call to `generate` (one completion each with generate_descriptions)
+def describe_chunk(frame, errors, executor, generate, batch_size):
+    columns = [field for field in DESCRIPTION_FIELDS if field in frame]
+    params = [
+        {key: (value.item() if isinstance(value, np.generic) else value) for key, value in row.items()}
+        for row in frame[columns].to_dict("records")
+    ]
+    valid = (errors == "").to_numpy()
+    params = [p for p, ok in zip(params, valid) if ok]
+    groups = [params[start:start + batch_size] for start in range(0, len(params), batch_size)]
+    results = iter([result for group in executor.map(lambda g: _describe(generate, g, batch_size), groups) for result in group])
+    described = [next(results) if ok else ("", "") for ok in valid]
+    return pd.DataFrame(described, columns=DESCRIPTION_COLUMNS, index=frame.index)
+
+
+# Output written chunk by chunk to a CSV file. A checkpoint records the byte offset after
+# each completed chunk, so a resumed run truncates any partly written chunk and appends.
+class CsvOutput:
+    def __init__(self, path, offset=0):
+        self.path = path
+        self._file = open(path, "r+b" if offset else "wb")
+        self._file.truncate(offset)
+        self._file.seek(offset)
+
+    def write(self, frame):
+        frame = frame.assign(data_sources=frame["data_sources"].map(LIST_SEPARATOR.join))
+        self._file.write(frame.to_csv(index=False, header=self._file.tell() == 0).encode("utf-8"))
+        self._file.flush()
+        return {"offset": self._file.tell()}
+
+    def close(self):
+        self._file.close()
+
+
+# Output written as a directory of Parquet part files, one per chunk (each renamed into
+# place once complete), readable as one table with pd.read_parquet(directory)
+class ParquetOutput:
+    def __init__(self, path, parts=0):
+        self.path = path
+        self.parts = parts
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.startswith("part-") and int(name[5:10]) >= parts:
+                os.remove(os.path.join(path, name))
+
+    def write(self, frame):
+        part = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        # Pin the types Arrow cannot infer from an all-empty chunk, so every part shares a schema
+        table = table.cast(pa.schema([pa.field(f.name, OUTPUT_TYPES.get(f.name, f.type)) for f in table.schema]))
+        pq.write_table(table, part + ".tmp")
+        os.replace(part + ".tmp", part)
+        self.parts += 1
+        return {"parts": self.parts}
+
+    def close(self):
+        pass
+
+
+# Function to read a run's checkpoint (None when starting fresh)
+def read_checkpoint(output):
+    try:
+        with open(output.rstrip("/") + ".checkpoint.json") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_checkpoint(output, state):
+    path = output.rstrip("/") + ".checkpoint.json"
+    with open(path + ".tmp", "w") as f:
+        json.dump(state, f)
+    os.replace(path + ".tmp", path)
+
+
+# Function to price a book of configurations and stream the results to `output` (.csv, or
+# a .parquet directory). With describe=True each valid row also gets a solution description
+# from `generate(configurations, batch_size)`, which returns a description (or an exception)
+# for each configuration: descriptions.generate_descriptions by default, cached, rate-limited
+# and batch_size configurations per completion (descriptions.DESCRIPTION_BATCH_SIZE when None),
+# `concurrency` calls at a time. With resume=True a run picks up after its last completed
+# chunk. `progress` is called with the number of rows written after every chunk.
+def run_batch(source, output, name=None, describe=False, concurrency=DESCRIPTION_CONCURRENCY,
+              chunk_rows=None, resume=False, progress=None, generate=None, batch_size=None):
+    started = time.perf_counter()
+    output_format = file_format(output)
+    chunk_rows = chunk_rows or (DESCRIPTION_CHUNK_ROWS if describe else CHUNK_ROWS)
+    source_name = os.path.basename(str(name or source))
+    state = (read_checkpoint(output) if resume else None) or {"rows": 0, "offset": 0, "parts": 0}
+    if state.get("source", source_name) != source_name or state.get("describe", describe) != describe:
+        raise ValueError(f"Cannot resume: {output} was started from another input or describe setting")
+    state.update(source=source_name, describe=describe)
+
+    if describe and generate is None:
+        from descriptions import generate_descriptions as generate
+    if describe and batch_size is None:
+        from descriptions import DESCRIPTION_BATCH_SIZE as batch_size
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch-quote") if describe else None
+    writer = CsvOutput(output, state["offset"]) if output_format == "csv" else ParquetOutput(output, state["parts"])
+    summary = {"rows": 0, "skipped": state["rows"], "invalid": 0, "described": 0, "description_errors": 0}
+    position = 0
+    try:
+        for chunk in read_chunks(source, name, chunk_rows):
+            chunk.index = pd.RangeIndex(position, position + len(chunk))
+            position += len(chunk)
+            chunk = chunk.loc[state["rows"]:].drop(columns=[ROW_COLUMN] + OUTPUT_COLUMNS + DESCRIPTION_COLUMNS, errors="ignore")
+            if chunk.empty:
+                continue
+
+            frame, errors = prepare_configurations(chunk)
+            result = chunk.assign(data_sources=frame["data_sources"])
+            result.insert(0, ROW_COLUMN, chunk.index)
+            result = pd.concat([result, price_chunk(frame, errors)], axis=1).assign(error=errors)
+            if describe:
+                descriptions = describe_chunk(frame, errors, executor, generate, batch_size)
+                result = pd.concat([result, descriptions], axis=1)
+                summary["described"] += int((descriptions["description"] != "").sum())
+                summary["description_errors"] += int((descriptions["description_error"] != "").sum())
+
+            state.update(writer.write(result))
+            state["rows"] = int(chunk.index[-1]) + 1
+            _write_checkpoint(output, state)
+            summary["rows"] += len(chunk)
+            summary["invalid"] += int((errors != "").sum())
+            if progress is not None:
+                progress(state["rows"])
+    finally:
+        writer.close()
+        if executor is not None:
+            executor.shutdown()
+    summary["seconds"] = time.perf_counter() - started
+    return summary
+
+
+# Function to concatenate a .parquet output directory into the bytes of one Parquet file,
+# part by part (each part becomes a row group), without building a DataFrame of the whole book
+def combine_parts(directory):
+    buffer = io.BytesIO()
+    writer = None
+    for name in sorted(os.listdir(directory)):
+        if not (name.startswith("part-") and name.endswith(".parquet")):
+            continue
+        table = pq.read_table(os.path.join(directory, name))
+        if writer is None:
+            writer = pq.ParquetWriter(buffer, table.schema)
+        writer.write_table(table.cast(writer.schema))
+    if writer is not None:
+        writer.close()
+    return buffer.getvalue()
+
+
+# Function to price an uploaded book as a background job (llm_jobs.JobQueue). The job's
+# metadata holds the uploaded file object and its name, the output format ("csv" or
+# "parquet") and whether to describe; metadata["rows"] counts the rows written so far.
+# Cancelling the job stops it after the current chunk. Returns (output file name, output
+# bytes, summary).
+def run_batch_job(job):
+    metadata = job.metadata
+
+    def progress(rows):
+        metadata["rows"] = rows
+        if job.cancel_event.is_set():
+            raise RuntimeError("Batch cancelled")
+
+    # The job keeps the upload only while it reads it
+    source = metadata.pop("source")
+    source.seek(0)
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "quotes." + metadata["output_format"])
+        summary = run_batch(source, output, name=metadata["name"], describe=metadata["describe"], progress=progress)
+        del source
+        if metadata["output_format"] == "csv":
+            with open(output, "rb") as f:
+                data = f.read()
+        else:
+            data = combine_parts(output)
+    return os.path.basename(output), data, summary
@@ -0,0 +1,468 @@
+"""Headless load test of the app's pages with a stubbed OpenAI API.
+
+Drives app.py through Streamlit's AppTest (streamlit.testing.v1, in the Streamlit pinned
+by requirements.txt) and records wall time, peak traced memory and net allocated blocks
+for every rerun. One session first walks each sidebar page, then N concurrent sessions
+make randomized widget interactions. Results are written as JSON; pass an earlier
+result as --baseline to compare. Pass --rev to measure a git revision (checked out in a
+temporary worktree) instead of the working tree, e.g. to record a baseline; revisions from
+before the pages/ layout are driven through their sidebar radio, and interactions with
+widgets a revision does not have yet become plain reruns.
+
+    python benchmarks/bench_app.py --rev d6b7fa0 --out bench-results/baseline.json
+    python benchmarks/bench_app.py --out bench-results/app.json
+    python benchmarks/bench_app.py --sessions 8 --reruns 30 --baseline bench-results/app.json
+"""
+import argparse
+import ast
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import openai
+import streamlit
+from streamlit.runtime import Runtime
+from streamlit.runtime.secrets import Secrets
+from streamlit.testing.v1 import AppTest
+
+from mock_openai import DEFAULT_REPLY, split_tokens
+
+PAGES = ["Home", "Client Overview", "Cost Estimator", "Sales Pipeline"]
+PAGE_FILES = {
+    "Home": "app.py",
+    "Client Overview": "pages/1_Client_Overview.py",
+    "Cost Estimator": "pages/2_Cost_Estimator.py",
+    "Sales Pipeline": "pages/3_Sales_Pipeline.py",
+}
+RERUN_TIMEOUT = 120
+
+
+# Function to replace openai.ChatCompletion.create with a local stub (no network, fixed latency)
+def stub_openai(latency, token_delay):
+    def create(model=None, messages=None, stream=False, **kwargs):
+        time.sleep(latency)
+        if not stream:
+            return {"choices": [{"message": {"role": "assistant", "content": DEFAULT_REPLY}}]}
+
+        def chunks():
+            for token in split_tokens(DEFAULT_REPLY):
+                time.sleep(token_delay)
+                yield {"choices": [{"delta": {"content": token}}]}
+        return chunks()
+
+    openai.ChatCompletion.create = create
+
+
+# Function to serialize ast.parse, which Streamlit calls on every run to compile the
+# script; concurrent calls can fail on CPython 3.11 ("AST constructor recursion depth mismatch")
+def serialize_ast_parse():
+    parse, lock = ast.parse, threading.Lock()
+
+    def locked_parse(*args, **kwargs):
+        with lock:
+            return parse(*args, **kwargs)
+
+    ast.parse = locked_parse
+
+
+# Function to keep a Streamlit runtime in place while any session runs. Each AppTest run
+# installs a mock Runtime and clears it when it ends, which fails the runs still in
+# progress in other sessions ("Runtime hasn't been created!"); those fall back to the
+# runtime most recently installed.
+def share_test_runtime():
+    instance, latest = Runtime.instance, []
+
+    def shared_instance(cls):
+        if cls._instance is not None:
+            latest[:] = [cls._instance]
+        return cls._instance or (latest[0] if latest else instance())
+
+    Runtime.instance = classmethod(shared_instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(latest))
+
+
+# Function to install the app's secrets process-wide. AppTest.secrets would swap
+# st.secrets around every run, which races when sessions run concurrently.
+def install_secrets():
+    try:
+        secrets = Secrets()
+    except TypeError:  # older Streamlit releases take the secrets file paths
+        secrets = Secrets([])
+    secrets._secrets = {"openai": "stub"}
+    streamlit.secrets = secrets
+
+
+# Raised when the current page (e.g. at an older revision) lacks the widget an interaction needs
+class MissingWidget(LookupError):
+    pass
+
+
+# Function to find a widget by type and label prefix on the current page
+def widget(at, kind, label):
+    found = next((w for w in getattr(at, kind) if w.label.startswith(label)), None)
+    if found is None:
+        raise MissingWidget(f"no {kind} {label!r}")
+    return found
+
+
+def pick(rng, options):
+    return options[rng.integers(len(options))]
+
+
+# Randomized interactions per page. Each returns the widget it touched (or None for a plain rerun).
+def rerun_page(at, rng):
+    return None
+
+
+def choose_client(at, rng):
+    select = widget(at, "selectbox", "Select a Client:")
+    select.select_index(int(rng.integers(len(select.options))))
+    return select.label
+
+
+def switch_chart(at, rng):
+    radio = widget(at, "radio", "Chart")
+    radio.set_value(pick(rng, radio.options))
+    return radio.label
+
+
+def change_estimator_select(at, rng):
+    selects = [w for w in at.selectbox if w.label.endswith(":")]
+    if not selects:
+        raise MissingWidget("no estimator selectbox")
+    select = pick(rng, selects)
+    select.select_index(int(rng.integers(len(select.options))))
+    return select.label
+
+
+def change_data_sources(at, rng):
+    multiselect = widget(at, "multiselect", "Select Data Sources:")
+    size = int(rng.integers(len(multiselect.options) + 1))
+    multiselect.set_value(list(rng.choice(multiselect.options, size, replace=False)))
+    return multiselect.label
+
+
+def change_users(at, rng):
+    slider = widget(at, "slider", "Number of Users:")
+    slider.set_value(int(rng.integers(1, 1001)))
+    return slider.label
+
+
+def change_compute_hours(at, rng):
+    number = widget(at, "number_input", "Compute Hours per Month:")
+    number.set_value(int(rng.integers(0, 501)))
+    return number.label
+
+
+def toggle_feature(at, rng):
+    if not len(at.checkbox):
+        raise MissingWidget("no checkbox")
+    checkbox = pick(rng, list(at.checkbox))
+    checkbox.set_value(not checkbox.value)
+    return checkbox.label
+
+
+def generate_description(at, rng):
+    button = widget(at, "button", "Generate Solution Description")
+    button.click()
+    return button.label
+
+
+def change_page_size(at, rng):
+    select = widget(at, "selectbox", "Rows per page")
+    select.select_index(int(rng.integers(len(select.options))))
+    return select.label
+
+
+def change_table_page(at, rng):
+    number = widget(at, "number_input", "Page (of")
+    number.set_value(int(rng.integers(1, int(number.max) + 1)))
+    return number.label
+
+
+def change_slippage(at, rng):
+    slider = widget(at, "slider", "Close-Date Slippage (%)")
+    slider.set_value(int(rng.integers(0, 11)) * 5)
+    return slider.label
+
+
+def change_quota(at, rng):
+    number = widget(at, "number_input", "Revenue Quota ($)")
+    number.set_value(float(number.value) * float(rng.uniform(0.8, 1.2)))
+    return number.label
+
+
+INTERACTIONS = {
+    "Home": [rerun_page],
+    "Client Overview": [choose_client, switch_chart],
+    "Cost Estimator": [
+        change_estimator_select, change_data_sources, change_users, change_compute_hours, toggle_feature,
+    ],
+    "Sales Pipeline": [change_page_size, change_table_page, change_slippage, change_quota],
+}
+
+
+# One simulated user: an AppTest session plus the records of its reruns
+class Session:
+    def __init__(self, root, session_id, seed, trace_memory, records, lock):
+        self.root = root
+        self.id = session_id
+        self.rng = np.random.default_rng(seed)
+        self.trace_memory = trace_memory
+        self.records = records
+        self.lock = lock
+        self.page = None
+        self.at = None
+
+    # Function to run the script once and record what the rerun cost
+    def run(self, phase, page, action, target=None):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        blocks_before = sys.getallocatedblocks()
+        started = time.perf_counter()
+        self.at.run()
+        wall_ms = (time.perf_counter() - started) * 1000
+        record = {
+            "phase": phase,
+            "session": self.id,
+            "page": page,
+            "action": action,
+            "target": target,
+            "wall_ms": round(wall_ms, 3),
+            "alloc_blocks": sys.getallocatedblocks() - blocks_before,
+            "exceptions": [str(e.value) for e in self.at.exception],
+        }
+        if self.trace_memory:
+            record["peak_kib"] = round((tracemalloc.get_traced_memory()[1] - traced_before) / 1024, 1)
+        with self.lock:
+            self.records.append(record)
+        return record
+
+    # Function to open the app in a fresh AppTest (the first run, on the Home page)
+    def start(self, phase):
+        self.at = AppTest.from_file(os.path.join(self.root, "app.py"), default_timeout=RERUN_TIMEOUT)
+        self.page = PAGES[0]
+        return self.run(phase, self.page, "first run")
+
+    def open_page(self, phase, page):
+        if os.path.isdir(os.path.join(self.root, "pages")):
+            self.at.switch_page(PAGE_FILES[page])
+        else:
+            self.at.sidebar.radio[0].set_value(page)  # revisions from before the pages/ layout
+        self.page = page
+        return self.run(phase, page, "open page")
+
+    def interact(self, phase, page, interactions):
+        interaction = pick(self.rng, interactions)
+        try:
+            target = interaction(self.at, self.rng)
+        except MissingWidget:
+            interaction, target = rerun_page, None
+        return self.run(phase, page, interaction.__name__, target)
+
+
+# Function to walk every page in one session: a cold open, then randomized reruns
+def run_page_walk(root, reruns, seed, trace_memory, records, lock, descriptions):
+    session = Session(root, 0, seed, trace_memory, records, lock)
+    session.start("pages")
+    for page in PAGES:
+        session.open_page("pages", page)
+        interactions = INTERACTIONS[page] + ([generate_description] if descriptions and page == "Cost Estimator" else [])
+        for _ in range(reruns):
+            session.interact("pages", page, interactions)
+
+
+# Function to run concurrent sessions that hop between pages and interact at random
+def run_load(root, sessions, reruns, seed, records, lock, descriptions):
+    def user(session_id):
+        session = Session(root, session_id, seed + session_id, False, records, lock)
+        session.start("load")
+        for _ in range(reruns):
+            page = pick(session.rng, PAGES)
+            try:
+                if page != session.page:
+                    session.open_page("load", page)
+                interactions = INTERACTIONS[page] + ([generate_description] if descriptions and page == "Cost Estimator" else [])
+                session.interact("load", page, interactions)
+            except Exception as e:
+                # AppTest is not built for concurrent use and now and then loses a session's
+                # widget state; record it and carry on in a fresh session
+                with lock:
+                    records.append({"phase": "load", "session": session_id, "page": page, "error": repr(e)})
+                session.start("load")
+
+    threads = [threading.Thread(target=user, args=(i + 1,)) for i in range(sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def distribution(values):
+    if not values:
+        return None
+    values = np.asarray(values, dtype=float)
+    return {
+        "mean": round(float(values.mean()), 3),
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p95": round(float(np.percentile(values, 95)), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+# Function to summarize records per page: every rerun, and cold page opens separately
+def summarize(records):
+    summary = {}
+    for page in PAGES:
+        failed = [r for r in records if r["page"] == page and "error" in r]
+        page_records = [r for r in records if r["page"] == page and "error" not in r]
+        warm = [r for r in page_records if r["action"] not in ("first run", "open page")]
+        summary[page] = {
+            "reruns": len(page_records),
+            "open_ms": distribution([r["wall_ms"] for r in page_records if r["action"] == "open page"]),
+            "wall_ms": distribution([r["wall_ms"] for r in warm]),
+            "peak_kib": distribution([r["peak_kib"] for r in warm if "peak_kib" in r]),
+            "alloc_blocks": distribution([r["alloc_blocks"] for r in warm]),
+            "exceptions": sum(bool(r["exceptions"]) for r in page_records),
+            "errors": len(failed),
+        }
+    return summary
+
+
+def git_commit(root):
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Function to print the p50/p95 change of every page against a baseline result file
+def compare(result, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nvs baseline {baseline['meta'].get('commit')} ({baseline_path})")
+    for phase in ("pages", "load"):
+        for page in PAGES:
+            for metric in ("wall_ms", "peak_kib"):
+                old = (baseline[phase].get(page) or {}).get(metric)
+                new = (result[phase].get(page) or {}).get(metric)
+                if not old or not new:
+                    continue
+                changes = "  ".join(
+                    f"{stat} {old[stat]:10.1f} -> {new[stat]:10.1f} ({(new[stat] / old[stat] - 1) if old[stat] else 0:+7.1%})"
+                    for stat in ("p50", "p95")
+                )
+                print(f"{phase:<6} {page:<16} {metric:<9} {changes}")
+
+
+# Function to run both phases against the app checked out at root and write the results
+def benchmark(args, root):
+    # The app's own modules are imported from root, ahead of the working tree's
+    os.chdir(root)
+    sys.path.insert(0, root)
+    stub_openai(args.llm_latency, args.token_delay)
+    install_secrets()
+    serialize_ast_parse()
+    share_test_runtime()
+    records, lock = [], threading.Lock()
+
+    trace_memory = not args.no_trace
+    if trace_memory:
+        tracemalloc.start()
+    run_page_walk(root, args.reruns, args.seed, trace_memory, records, lock, args.descriptions)
+    if trace_memory:
+        tracemalloc.stop()
+    walk_records = list(records)
+
+    load_seconds = None
+    if args.sessions:
+        load_seconds = run_load(root, args.sessions, args.reruns, args.seed, records, lock, args.descriptions)
+    load_records = records[len(walk_records):]
+
+    result = {
+        "meta": {
+            "commit": git_commit(root),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "cpus": os.cpu_count(),
+            "args": vars(args),
+        },
+        "pages": summarize(walk_records),
+        "load": summarize(load_records),
+        "load_phase": {
+            "sessions": args.sessions,
+            "reruns": sum("error" not in r for r in load_records),
+            "seconds": load_seconds and round(load_seconds, 3),
+            "reruns_per_second": load_seconds and round(sum("error" not in r for r in load_records) / load_seconds, 2),
+            "wall_ms": distribution([r["wall_ms"] for r in load_records if "error" not in r]),
+        },
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "reruns": records,
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w") as f:
+        json.dump(result, f, indent=2)
+
+    for phase in ("pages", "load"):
+        for page, stats in result[phase].items():
+            if stats["wall_ms"]:
+                peak = f"  peak {stats['peak_kib']['p50']:9.1f} KiB" if stats["peak_kib"] else ""
+                print(f"{phase:<6} {page:<16} {stats['reruns']:4d} reruns  p50 {stats['wall_ms']['p50']:8.1f} ms  "
+                      f"p95 {stats['wall_ms']['p95']:8.1f} ms{peak}  exceptions {stats['exceptions']}  errors {stats['errors']}")
+    if load_seconds:
+        print(f"load: {args.sessions} sessions, {result['load_phase']['reruns_per_second']} reruns/s")
+    print(f"wrote {args.out}")
+    if args.baseline:
+        compare(result, args.baseline)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=10, help="randomized reruns per page (walk) and per session (load)")
+    parser.add_argument("--sessions", type=int, default=4, help="concurrent sessions in the load phase (0 to skip)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="stubbed time to first token (s)")
+    parser.add_argument("--token-delay", type=float, default=0.005, help="stubbed delay per streamed token (s)")
+    parser.add_argument("--descriptions", action="store_true", help="also click Generate Solution Description")
+    parser.add_argument("--no-trace", action="store_true", help="skip tracemalloc (faster reruns, no peak memory)")
+    parser.add_argument("--out", default="bench-results/app.json")
+    parser.add_argument("--baseline", help="earlier result file to compare against")
+    parser.add_argument("--rev", help="git revision to measure instead of the working tree")
+    args = parser.parse_args()
+    # Result paths are relative to the repository, whichever revision is measured
+    args.out = os.path.join(ROOT, args.out)
+    args.baseline = args.baseline and os.path.join(ROOT, args.baseline)
+
+    if not args.rev:
+        benchmark(args, ROOT)
+        return
+    with tempfile.TemporaryDirectory() as worktree:
+        subprocess.run(["git", "-C", ROOT, "worktree", "add", "--detach", worktree, args.rev],
+                       check=True, capture_output=True)
+        try:
+            benchmark(args, worktree)
+        finally:
+            subprocess.run(["git", "-C", ROOT, "worktree", "remove", "--force", worktree], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Batch quotes: streaming throughput and peak memory, and description concurrency with a stub.
+
+    python benchmarks/bench_batch_quotes.py [rows] [described rows]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from bench_pricing import random_configurations
+from batch_quotes import LIST_SEPARATOR, run_batch
+from pricing import DATA_SOURCES
+STUB_LATENCY = 0.05
+
+
+# Function to write a book of n random configurations as CSV and Parquet files
+def write_book(directory, rows):
+    frame = random_configurations(rows)
+    frame["data_sources"] = [LIST_SEPARATOR.join(DATA_SOURCES[:k]) for k in frame.pop("data_source_count")]
+    paths = {"csv": os.path.join(directory, "book.csv"), "parquet": os.path.join(directory, "book.parquet")}
+    frame.to_csv(paths["csv"], index=False)
+    frame.to_parquet(paths["parquet"], index=False)
+    return paths
+
+
+# Function to run a batch under tracemalloc, returning the summary and peak traced memory (MiB)
+def traced(func):
+    tracemalloc.start()
+    try:
+        summary = func()
+        return summary, tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+# Stub for descriptions.generate_descriptions: one round trip per batch_size configurations
+def stub_descriptions(scenarios, batch_size):
+    time.sleep(STUB_LATENCY * -(-len(scenarios) // batch_size))
+    return [f"{project_params['storage_needs']} solution" for project_params in scenarios]
+
+
+def main(rows, described_rows):
+    with tempfile.TemporaryDirectory() as directory:
+        book = write_book(directory, rows)
+        print(f"{rows:,} configurations: CSV {os.path.getsize(book['csv']) / 2**20:.1f} MiB, "
+              f"Parquet {os.path.getsize(book['parquet']) / 2**20:.1f} MiB\n")
+        for source in ("csv", "parquet"):
+            for target in ("csv", "parquet"):
+                output = os.path.join(directory, f"quotes-from-{source}.{target}")
+                summary = run_batch(book[source], output)
+                print(f"{source:>7} -> {target:<7} {summary['seconds']:6.2f} s  "
+                      f"{summary['rows'] / summary['seconds']:>10,.0f} rows/s")
+        # tracemalloc slows the run several times over, so memory is measured in separate runs
+        for source in ("csv", "parquet"):
+            _, peak = traced(lambda: run_batch(book[source], os.path.join(directory, f"traced.{source}")))
+            print(f"{source:>7} -> {source:<7} peak traced memory {peak:6.1f} MiB")
+
+        small = write_book(directory, described_rows)["csv"]
+        print(f"\ndescriptions for {described_rows} rows, stubbed at {STUB_LATENCY * 1000:.0f} ms per request")
+        for batch_size in (1, 5):
+            for concurrency in (1, 4, 16):
+                output = os.path.join(directory, f"described-{batch_size}-{concurrency}.csv")
+                summary = run_batch(small, output, describe=True, concurrency=concurrency,
+                                    generate=stub_descriptions, batch_size=batch_size)
+                print(f"  batch {batch_size}  concurrency {concurrency:>2}  {summary['seconds']:6.2f} s  "
+                      f"({summary['described']} described, {summary['description_errors']} failed)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,74 @@
+"""Figure-build time per rerun: Client Overview / Sales Pipeline charts, before and after the chart factory.
+
+"eager" rebuilds every chart with Plotly Express on each rerun (the old tabs layout);
+"factory" builds only the visible chart through the memoized jll_figure.
+Both include the JSON serialization st.plotly_chart performs for each rendered figure.
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import plotly.express as px
+import plotly.utils
+
+from charts import JLL_COLOR_SCALE, jll_colors, jll_figure
+from data_access import SAMPLE_PIPELINE
+
+MONTHS = [f"M{i}" for i in range(12)]
+VALUES = [3, 1, 0, 2, 3, 1, 2, 0, 1, 3, 2, 1]
+SOLUTIONS = ["Data Warehouse", "Tableau Dashboards"]
+
+
+def serialize(fig):
+    return json.dumps(fig.to_dict(), cls=plotly.utils.PlotlyJSONEncoder)
+
+
+def eager_client_overview():
+    layout = dict(title_x=0.5, template="simple_white", font=dict(size=12))
+    figs = [
+        px.line(x=MONTHS, y=VALUES, markers=True, title="Monthly CR Requests", color_discrete_sequence=[jll_colors["red"]]),
+        px.bar(x=SOLUTIONS, y=[4, 7], title="Solution Usage", color=[4, 7], color_continuous_scale=JLL_COLOR_SCALE),
+        px.area(x=MONTHS, y=VALUES, title="Renewal Likelihood Trend", color_discrete_sequence=[jll_colors["red"]]),
+        px.bar(x=MONTHS, y=VALUES, title="Engagement Score Trend", color=VALUES, color_continuous_scale=JLL_COLOR_SCALE),
+    ]
+    for fig in figs:
+        fig.update_layout(**layout)
+        serialize(fig)
+
+
+def factory_client_overview():
+    fig = jll_figure("line", x=MONTHS, y=VALUES, markers=True, title="Monthly CR Requests", xaxis_title="Month", yaxis_title="CR Count")
+    serialize(fig)
+
+
+def pipeline_figures(frame):
+    summary = frame.groupby("Stage").agg({"Estimated Value": "sum"}).reset_index()
+    fig = jll_figure("bar", summary, x="Stage", y="Estimated Value", color="Stage", title="Estimated Value by Stage")
+    serialize(fig)
+
+
+def timed(label, func, runs=20):
+    func()  # warm-up (first call populates the factory cache)
+    started = time.perf_counter()
+    for _ in range(runs):
+        func()
+    print(f"{label:<40} {(time.perf_counter() - started) / runs * 1000:7.2f} ms per rerun")
+
+
+def main():
+    started = time.perf_counter()
+    jll_figure.clear()
+    factory_client_overview()
+    print(f"{'client overview, factory (cold)':<40} {(time.perf_counter() - started) * 1000:7.2f} ms")
+    timed("client overview, eager (4 figures)", eager_client_overview)
+    timed("client overview, factory (warm)", factory_client_overview)
+    frame = pd.DataFrame(SAMPLE_PIPELINE)
+    timed("pipeline by stage, factory (warm)", lambda: pipeline_figures(frame))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Monte Carlo pipeline forecast: chunked 16-bit-uniform engine vs a naive float Bernoulli simulation.
+
+    python benchmarks/bench_forecast.py [opportunities] [trials]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import numpy as np
+
+from data_access import _prepare_pipeline
+from forecast import CHUNK_ELEMENTS, simulate_pipeline
+from generate_synthetic_data import generate_pipeline
+
+NAIVE_TRIALS = 500
+
+
+def timed(label, func, runs=3):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    print(f"{label:<50} best {min(timings) * 1000:9.1f} ms  median {sorted(timings)[runs // 2] * 1000:9.1f} ms")
+    return result
+
+
+# One trial matrix of float64 uniforms per call, aggregated per month with a one-hot matmul
+def naive_simulation(pipeline_df, trials, seed=0):
+    rng = np.random.default_rng(seed)
+    months, month_index = np.unique(pipeline_df["Month"].to_numpy(), return_inverse=True)
+    weights = np.zeros((len(pipeline_df), len(months)))
+    weights[np.arange(len(pipeline_df)), month_index] = pipeline_df["Estimated Value"].to_numpy()
+    probability = pipeline_df["Probability (%)"].to_numpy() / 100
+    won = rng.random((trials, len(pipeline_df))) < probability
+    return won @ weights
+
+
+def main(opportunities, trials):
+    rng = np.random.default_rng(0)
+    pipeline_df = _prepare_pipeline(generate_pipeline(rng, opportunities, max(10, opportunities // 10)))
+    open_deals = int(((pipeline_df["Probability (%)"] > 0) & (pipeline_df["Probability (%)"] < 100)).sum())
+    print(f"{opportunities:,} opportunities ({open_deals:,} open), {trials:,} trials, "
+          f"chunks of {CHUNK_ELEMENTS // open_deals:,} trials\n")
+
+    timed(f"naive float Bernoulli, {NAIVE_TRIALS} trials", lambda: naive_simulation(pipeline_df, NAIVE_TRIALS), runs=1)
+    print(f"{'':<50} (its trial matrix would need {trials * len(pipeline_df) * 9 / 2**30:.1f} GB at {trials:,} trials)")
+    timed(f"engine, {NAIVE_TRIALS} trials", lambda: simulate_pipeline(pipeline_df, NAIVE_TRIALS))
+    forecast = timed(f"engine, {trials:,} trials", lambda: simulate_pipeline(pipeline_df, trials))
+    timed(f"engine, {trials:,} trials, 20% slippage", lambda: simulate_pipeline(pipeline_df, trials, slip_rate=0.2))
+    timed("bands + quota probability", lambda: (forecast.bands(), forecast.quota_probability(0)), runs=5)
+
+    expected = pipeline_df["Weighted Value"].sum()
+    print(f"\nmean simulated total {forecast.totals.mean():,.0f} vs weighted value {expected:,.0f} "
+          f"({forecast.totals.mean() / expected - 1:+.4%})")
+    print({name: f"{value:,.0f}" for name, value in forecast.total_bands().items()})
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10_000,
+    )
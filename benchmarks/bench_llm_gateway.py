@@ -0,0 +1,68 @@
+"""LLM gateway under a burst of concurrent sessions against a flaky local mock server.
+
+Half of the sessions ask for the same description (coalesced into one upstream
+call); the mock fails a share of requests with HTTP 429 to exercise retries.
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import openai
+
+from llm_gateway import LLMGateway
+from mock_openai import start_mock_server
+
+
+def describe(gateway, key):
+    return gateway.call(key, lambda: openai.ChatCompletion.create(
+        model="gpt-4",
+        messages=[{"role": "user", "content": key}],
+        max_tokens=300,
+        temperature=0.5,
+        request_timeout=gateway.request_timeout,
+    )["choices"][0]["message"]["content"])
+
+
+def main(sessions=40, distinct=10, failure_rate=0.3):
+    server, base_url = start_mock_server(token_delay=0.005, failure_rate=failure_rate)
+    openai.api_base = base_url
+    openai.api_key = "mock"
+    gateway = LLMGateway(max_concurrency=4, requests_per_second=20, burst=8, base_delay=0.05, max_delay=1.0)
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def session(i):
+        key = "shared preset" if i % 2 == 0 else f"custom {(i // 2) % distinct}"
+        started = time.perf_counter()
+        try:
+            describe(gateway, key)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+        with lock:
+            latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = np.asarray(latencies) * 1000
+    print(f"{sessions} sessions in {elapsed:.2f} s, {len(errors)} errors")
+    print(f"latency p50 {np.percentile(latencies, 50):.0f} ms  p99 {np.percentile(latencies, 99):.0f} ms")
+    print(f"upstream requests {server.request_count}, peak concurrent {server.peak_active}")
+    print(f"gateway stats {gateway.stats()}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
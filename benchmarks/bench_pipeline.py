@@ -0,0 +1,96 @@
+"""Sales Pipeline page cost at 1M opportunities: full-frame aggregation and Styler vs rollups and pagination.
+
+    python benchmarks/bench_pipeline.py [rows]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import numpy as np
+import pyarrow as pa
+
+from data_access import TOP_OPPORTUNITIES, _prepare_pipeline, format_pipeline_rows
+from generate_synthetic_data import generate_pipeline
+from pipeline_rollups import PipelineRollup
+
+PAGE_SIZE = 50
+APPEND_ROWS = 10_000
+
+
+def timed(label, func, runs=5):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    print(f"{label:<50} best {min(timings) * 1000:9.2f} ms  median {sorted(timings)[runs // 2] * 1000:9.2f} ms")
+    return result
+
+
+def full_summary(pipeline_df):
+    return {
+        "total_estimated_value": pipeline_df["Estimated Value"].sum(),
+        "total_weighted_value": pipeline_df["Weighted Value"].sum(),
+        "stage_summary": pipeline_df.groupby("Stage").agg({"Estimated Value": "sum"}).reset_index(),
+        "monthly_forecast": pipeline_df.groupby("Month").agg({"Weighted Value": "sum"}).reset_index(),
+        "top_opportunities": pipeline_df.nlargest(TOP_OPPORTUNITIES, "Weighted Value"),
+    }
+
+
+def styled_table(pipeline_df):
+    styler = pipeline_df.drop(columns=["Month"]).style.format({
+        "Estimated Value": "${:,.2f}",
+        "Weighted Value": "${:,.2f}",
+        "Probability (%)": "{:.0f}%",
+        "Expected Close Date": "{:%Y-%m-%d}",
+    })
+    styler._compute()
+    return styler._translate(False, False)
+
+
+def page_table(pipeline_df, page_number):
+    start = page_number * PAGE_SIZE
+    return pa.Table.from_pandas(format_pipeline_rows(pipeline_df.iloc[start:start + PAGE_SIZE]))
+
+
+def build_rollup(pipeline_df):
+    rollup = PipelineRollup(TOP_OPPORTUNITIES)
+    rollup.add(pipeline_df, ["base"])
+    return rollup
+
+
+def main(rows):
+    rng = np.random.default_rng(0)
+    pipeline_df = _prepare_pipeline(generate_pipeline(rng, rows, max(10, rows // 10)))
+    appended = _prepare_pipeline(generate_pipeline(rng, APPEND_ROWS, max(10, rows // 10)))
+    print(f"{rows:,} pipeline rows, {APPEND_ROWS:,}-row appends, {PAGE_SIZE}-row pages\n")
+
+    timed("full groupby summary (per data change)", lambda: full_summary(pipeline_df))
+    rollup = timed("rollup build from scratch", lambda: build_rollup(pipeline_df), runs=3)
+    expected = full_summary(pipeline_df)
+    summary = rollup.summary()
+    assert np.isclose(summary["total_weighted_value"], expected["total_weighted_value"])
+    assert summary["stage_summary"].equals(expected["stage_summary"])
+
+    batches = iter(range(1_000_000))
+    timed("rollup incremental append + summary", lambda: (
+        rollup.add(appended, [next(batches)]), rollup.summary()
+    ))
+    timed("rollup summary (warm)", rollup.summary, runs=50)
+    client_name = pipeline_df["Client Name"].iloc[0]
+    timed("client cube compaction (first lookup)", rollup.cube, runs=1)
+    timed("client lookup (warm cube)", lambda: rollup.client_summary(client_name), runs=50)
+
+    print()
+    timed("detailed table: full-frame Styler", lambda: styled_table(pipeline_df), runs=1)
+    timed("detailed table: full frame to Arrow", lambda: pa.Table.from_pandas(pipeline_df), runs=3)
+    pages = iter(range(1_000_000))
+    timed("detailed table: one formatted page to Arrow", lambda: page_table(pipeline_df, next(pages)), runs=50)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
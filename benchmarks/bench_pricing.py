@@ -0,0 +1,112 @@
+"""Vectorized pricing engine: throughput at 1M rows and parity with the scalar estimator."""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from pricing import (
+    COMPLEXITY_COST, COMPLIANCE_COST, DATA_SOURCES, MONITORING_COST, RETENTION_MULTIPLIER,
+    SECURITY_COST, STORAGE_COST, SUPPORT_COST, TRAINING_COST, estimate_cost, price_scenarios, sweep,
+)
+
+
+# The Cost Estimator's original inline rules, kept verbatim as the reference
+def reference_estimate(project_params):
+    total_cost = 5000
+    total_cost += 500 * len(project_params.get("data_sources", []))
+    total_cost += 1000 * (["Simple", "Moderate", "Complex"].index(project_params["transformation_complexity"]) + 1)
+    total_cost += 100 * project_params.get("compute_hours", 0)
+    total_cost += [10, 100, 1000, 10000][["10 GB", "100 GB", "1 TB", "10 TB"].index(project_params["storage_needs"])]
+    total_cost *= [1, 1.5, 2][["3 Months", "1 Year", "5 Years"].index(project_params["data_retention"])]
+    total_cost += 10 * project_params.get("users", 1)
+    if project_params["security_level"] == "Enhanced":
+        total_cost += 2000
+    elif project_params["security_level"] == "Enterprise":
+        total_cost += 5000
+    if project_params["data_compliance"] != "None":
+        total_cost += 1500
+    if project_params.get("data_encryption", False):
+        total_cost += 1000
+    if project_params.get("ai_integration", False):
+        total_cost += 3000
+    if project_params.get("api_access", False):
+        total_cost += 1000
+    if project_params["monitoring"] == "Advanced":
+        total_cost += 2000
+    if project_params["support"] == "Premium":
+        total_cost += 5000
+    elif project_params["support"] == "Enterprise":
+        total_cost += 10000
+    if project_params["training_sessions"] != "None":
+        total_cost += 1000
+    monthly_opex = (
+        (500 * project_params.get("compute_hours", 0) / 100) +
+        (200 * (["10 GB", "100 GB", "1 TB", "10 TB"].index(project_params["storage_needs"]) + 1))
+    )
+    return total_cost, monthly_opex, monthly_opex * 12
+
+
+# Function to draw n random configurations as a frame with categorical columns
+def random_configurations(n, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def pick(table):
+        return pd.Categorical.from_codes(rng.integers(0, len(table), n), categories=list(table))
+
+    return pd.DataFrame({
+        "data_source_count": rng.integers(0, 6, n),
+        "transformation_complexity": pick(COMPLEXITY_COST),
+        "compute_hours": rng.integers(0, 501, n),
+        "storage_needs": pick(STORAGE_COST),
+        "data_retention": pick(RETENTION_MULTIPLIER),
+        "users": rng.integers(1, 1001, n),
+        "support": pick(SUPPORT_COST),
+        "security_level": pick(SECURITY_COST),
+        "data_compliance": pick(COMPLIANCE_COST),
+        "monitoring": pick(MONITORING_COST),
+        "training_sessions": pick(TRAINING_COST),
+        "data_encryption": rng.integers(0, 2, n).astype(bool),
+        "ai_integration": rng.integers(0, 2, n).astype(bool),
+        "api_access": rng.integers(0, 2, n).astype(bool),
+    })
+
+
+def check_parity(frame, costs, sample=2000):
+    for i in range(min(sample, len(frame))):
+        row = frame.iloc[i].to_dict()
+        params = {k: v for k, v in row.items() if k != "data_source_count"}
+        params["data_sources"] = DATA_SOURCES[:row["data_source_count"]]
+        expected = reference_estimate(params)
+        actual = tuple(costs.iloc[i])
+        assert actual == expected, (params, actual, expected)
+        assert estimate_cost(params) == expected
+
+
+def main(rows=1_000_000, runs=5):
+    frame = random_configurations(rows)
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        costs = price_scenarios(frame)
+        timings.append(time.perf_counter() - started)
+    check_parity(frame, costs)
+    print(f"price_scenarios: {rows:,} rows, best {min(timings) * 1000:.1f} ms, median {sorted(timings)[runs // 2] * 1000:.1f} ms")
+
+    base = frame.iloc[0].to_dict()
+    started = time.perf_counter()
+    grid = sweep(
+        base,
+        storage_needs=list(STORAGE_COST),
+        data_retention=list(RETENTION_MULTIPLIER),
+        support=list(SUPPORT_COST),
+        compute_hours=range(0, 501),
+    )
+    print(f"sweep: {len(grid):,} scenarios in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
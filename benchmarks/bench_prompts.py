@@ -0,0 +1,109 @@
+"""Description prompts: input tokens and round trips per description, verbose template vs compact vs batched.
+
+Tokens are counted locally (exactly with tiktoken installed, estimated otherwise). "verbose"
+is the previous f-string template, which also left out refresh frequency, retention,
+compliance, encryption, training and the IoT fields; "compact" encodes every non-default
+field; "batch N" asks for N descriptions in one completion.
+
+    python benchmarks/bench_prompts.py [configurations]
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import numpy as np
+
+from bench_shared_cache import configurations
+from pricing import (
+    DASHBOARD_OPTIONS, DATA_WAREHOUSES, DEVICE_COUNTS, ETL_TYPES, IOT_SOLUTIONS, REFRESH_FREQUENCIES, SOLUTION_TYPES,
+)
+from prompt_builder import (
+    _encoding, build_batch_messages, build_messages, canonical_params, count_message_tokens, plan_batches,
+)
+
+CONTEXT_TOKENS = 8192
+COMPLETION_TOKENS = 320
+VERBOSE_SYSTEM_PROMPT = "You are an expert in creating concise architecture documentation based on project specifications.Max 1000 characters."
+VERBOSE_TEMPLATE = """
+            Create a high-level solution architecture description based on the following project parameters:
+            - Data Sources: {data_sources}
+            - ETL Type: {etl_type}
+            - Data Warehouse: {data_warehouse}
+            - Solution Type: {solution_type}
+            - BI Dashboard: {dashboard_required}
+            - Storage Requirements: {storage_needs}
+            - Compute Hours: {compute_hours}
+            - Security Level: {security_level}
+            - AI Integration: {ai_integration}
+            - API Access Required: {api_access}
+            - Monitoring: {monitoring}
+            - Support: {support}
+            """
+
+
+# Function to build the previous, verbose chat messages for one description
+def verbose_messages(project_params):
+    prompt = VERBOSE_TEMPLATE.format(
+        data_sources=', '.join(project_params.get('data_sources', [])) or 'None',
+        etl_type=project_params.get('etl_type', 'N/A'),
+        data_warehouse=project_params.get('data_warehouse', 'N/A'),
+        solution_type=project_params.get('solution_type', 'N/A'),
+        dashboard_required=project_params.get('dashboard_required', 'N/A'),
+        storage_needs=project_params.get('storage_needs', 'N/A'),
+        compute_hours=project_params.get('compute_hours', 'N/A'),
+        security_level=project_params.get('security_level', 'N/A'),
+        ai_integration='Yes' if project_params.get('ai_integration') else 'No',
+        api_access='Yes' if project_params.get('api_access') else 'No',
+        monitoring=project_params.get('monitoring', 'N/A'),
+        support=project_params.get('support', 'N/A'),
+    )
+    return [{"role": "system", "content": VERBOSE_SYSTEM_PROMPT}, {"role": "user", "content": prompt}]
+
+
+# Function to add the Cost Estimator fields the shared-cache pool leaves out
+def estimator_configurations(n, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def pick(options):
+        return options[rng.integers(0, len(options))]
+
+    pool = configurations(n, seed)
+    for params in pool:
+        params.update({
+            "etl_type": pick(ETL_TYPES),
+            "refresh_frequency": pick(REFRESH_FREQUENCIES),
+            "data_warehouse": pick(DATA_WAREHOUSES),
+            "solution_type": pick(SOLUTION_TYPES),
+            "dashboard_required": pick(DASHBOARD_OPTIONS),
+        })
+        if params["solution_type"] == "IoT":
+            params["iot_solution"] = pick(IOT_SOLUTIONS)
+            params["number_of_devices"] = pick(DEVICE_COUNTS)
+    return pool
+
+
+def main(n):
+    pool = estimator_configurations(n)
+    counter = "tiktoken" if _encoding("gpt-4") is not None else "estimated"
+    print(f"{n:,} configurations, {counter} token counts\n")
+    print(f"{'prompt':<10} {'fields':>7} {'tokens/description':>19} {'requests':>9}")
+
+    verbose = [count_message_tokens(verbose_messages(p)) for p in pool]
+    print(f"{'verbose':<10} {12:>7} {np.mean(verbose):>19.1f} {n:>9,}")
+    compact = [count_message_tokens(build_messages(p)) for p in pool]
+    fields = np.mean([len(canonical_params(p)) for p in pool])
+    print(f"{'compact':<10} {fields:>7.1f} {np.mean(compact):>19.1f} {n:>9,}")
+    for size in (5, 10, 20):
+        batches = plan_batches(pool, size, CONTEXT_TOKENS, COMPLETION_TOKENS)
+        tokens = sum(count_message_tokens(build_batch_messages([pool[i] for i in batch])) for batch in batches)
+        print(f"{f'batch {size}':<10} {fields:>7.1f} {tokens / n:>19.1f} {len(batches):>9,}")
+
+    reordered = dict(pool[0], data_sources=list(reversed(pool[0]["data_sources"])))
+    print(f"\nreordered sources encode identically: {canonical_params(reordered) == canonical_params(pool[0])}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
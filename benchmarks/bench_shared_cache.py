@@ -0,0 +1,160 @@
+"""Node-wide shared cache across replica processes: hit rate, latency and stampede protection.
+
+Each of N processes (replicas) serves a stream of Cost Estimator sensitivity sweeps for
+configurations drawn with Zipf-like popularity, keeping its own per-process memo as
+st.cache_data does. "per-process" computes every configuration once per replica;
+"shared" puts the SQLite WAL SharedCache behind the memo. A final phase releases all
+replicas at once on one cold key with a slow computation (a stand-in for a forecast or
+an LLM call) and counts how many of them computed it.
+
+    python benchmarks/bench_shared_cache.py [--replicas 4] [--requests 400] [--configs 200]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from pricing import (
+    COMPLEXITY_COST, COMPLIANCE_COST, DATA_SOURCES, MONITORING_COST, PRICING_VERSION,
+    RETENTION_MULTIPLIER, SECURITY_COST, STORAGE_COST, SUPPORT_COST, TRAINING_COST, sensitivity,
+)
+from shared_cache import SharedCache, make_key
+
+ZIPF_EXPONENT = 1.2
+
+
+# Function to draw the pool of configurations the replicas are asked about (same in every process)
+def configurations(n, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def pick(table):
+        return list(table)[rng.integers(0, len(table))]
+
+    return [
+        {
+            "data_sources": sorted(set(pick(DATA_SOURCES) for _ in range(rng.integers(1, 4)))),
+            "transformation_complexity": pick(COMPLEXITY_COST),
+            "compute_hours": int(rng.integers(0, 501)),
+            "storage_needs": pick(STORAGE_COST),
+            "data_retention": pick(RETENTION_MULTIPLIER),
+            "users": int(rng.integers(1, 1001)),
+            "security_level": pick(SECURITY_COST),
+            "data_compliance": pick(COMPLIANCE_COST),
+            "data_encryption": bool(rng.integers(0, 2)),
+            "ai_integration": bool(rng.integers(0, 2)),
+            "api_access": bool(rng.integers(0, 2)),
+            "monitoring": pick(MONITORING_COST),
+            "support": pick(SUPPORT_COST),
+            "training_sessions": pick(TRAINING_COST),
+        }
+        for _ in range(n)
+    ]
+
+
+# Function run in each replica: serve the request stream and report per-request latency and source
+def replica(replica_id, mode, path, requests, configs, slow_seconds, barrier, results):
+    cache = SharedCache(path) if mode == "shared" else None
+    pool = configurations(configs)
+    rng = np.random.default_rng(1000 + replica_id)
+    picks = np.minimum(rng.zipf(ZIPF_EXPONENT, requests), configs) - 1
+    memo = {}
+    latencies, sources = [], []
+
+    barrier.wait()
+    for index in picks:
+        started = time.perf_counter()
+        computed = []
+        if index in memo:
+            source = "memo"
+        else:
+            config = pool[index]
+
+            def compute():
+                computed.append(True)
+                return sensitivity(config)
+
+            memo[index] = cache.get_or_compute("sensitivity", make_key(PRICING_VERSION, config), compute) if cache else compute()
+            source = "computed" if computed else "shared"
+        latencies.append(time.perf_counter() - started)
+        sources.append(source)
+
+    # Stampede: every replica misses on the same cold key at the same moment
+    stampede_computed = []
+
+    def slow_compute():
+        stampede_computed.append(True)
+        time.sleep(slow_seconds)
+        return "forecast"
+
+    barrier.wait()
+    started = time.perf_counter()
+    if cache:
+        cache.get_or_compute("stampede", "cold-key", slow_compute)
+    else:
+        slow_compute()
+    results.put({
+        "latencies": latencies,
+        "sources": sources,
+        "stampede_seconds": time.perf_counter() - started,
+        "stampede_computed": len(stampede_computed),
+    })
+
+
+def run(mode, replicas, requests, configs, slow_seconds):
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(replicas)
+    results = context.Queue()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "shared.sqlite3")
+        SharedCache(path)  # create the schema once, before the replicas race for it
+        processes = [
+            context.Process(target=replica, args=(i, mode, path, requests, configs, slow_seconds, barrier, results))
+            for i in range(replicas)
+        ]
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+        reports = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+        wall = time.perf_counter() - started
+
+    latencies = np.array([latency for report in reports for latency in report["latencies"]]) * 1000
+    sources = [source for report in reports for source in report["sources"]]
+    counts = {source: sources.count(source) for source in ("memo", "shared", "computed")}
+    by_source = {
+        source: np.array([l for l, s in zip(latencies, sources) if s == source])
+        for source in counts if counts[source]
+    }
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"\n{mode} ({replicas} replicas x {requests} requests over {configs} configurations, {wall:.1f} s wall)")
+    print(f"  hit rate {(counts['memo'] + counts['shared']) / len(sources):6.1%}   "
+          f"memo {counts['memo']:,}  shared {counts['shared']:,}  computed {counts['computed']:,}")
+    print(f"  latency  p50 {p50:7.2f} ms  p95 {p95:7.2f} ms  p99 {p99:7.2f} ms  total compute "
+          f"{by_source.get('computed', np.zeros(1)).sum() / 1000:.2f} s")
+    for source, values in by_source.items():
+        print(f"    {source:<9} p50 {np.percentile(values, 50):7.2f} ms  p95 {np.percentile(values, 95):7.2f} ms")
+    print(f"  stampede: {sum(r['stampede_computed'] for r in reports)} of {replicas} replicas computed the cold key, "
+          f"slowest replica waited {max(r['stampede_seconds'] for r in reports) * 1000:.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=400, help="requests per replica")
+    parser.add_argument("--configs", type=int, default=200, help="distinct configurations")
+    parser.add_argument("--slow-ms", type=float, default=500, help="duration of the stampede computation")
+    args = parser.parse_args()
+    for mode in ("per-process", "shared"):
+        run(mode, args.replicas, args.requests, args.configs, args.slow_ms / 1000)
+
+
+if __name__ == "__main__":
+    main()
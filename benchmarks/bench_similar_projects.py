@@ -0,0 +1,52 @@
+"""Similar-project retrieval latency against a synthetic 100k-project corpus."""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from similar_projects import ProjectIndex, encode_projects, generate_corpus
+
+
+def timed_queries(index, vectors, k=3):
+    timings = []
+    results = []
+    for vector in vectors:
+        started = time.perf_counter()
+        results.append(index.search(vector, k))
+        timings.append(time.perf_counter() - started)
+    timings = np.asarray(timings) * 1000
+    return results, np.percentile(timings, 50), np.percentile(timings, 99)
+
+
+def main(corpus_size=100_000, queries=500, k=3):
+    corpus = generate_corpus(corpus_size)
+    vectors = encode_projects(generate_corpus(queries, seed=1))
+
+    started = time.perf_counter()
+    exact = ProjectIndex(corpus, approximate=False)
+    print(f"exact index build: {(time.perf_counter() - started) * 1000:.0f} ms ({exact.matrix.nbytes / 1e6:.1f} MB)")
+    exact_results, p50, p99 = timed_queries(exact, vectors, k)
+    print(f"exact search:       p50 {p50:.2f} ms  p99 {p99:.2f} ms")
+    _, p50, p99 = timed_queries(exact, vectors, k)
+    print(f"cached search:      p50 {p50:.3f} ms  p99 {p99:.3f} ms")
+
+    started = time.perf_counter()
+    approximate = ProjectIndex(corpus, approximate=True)
+    print(f"approx index build: {(time.perf_counter() - started) * 1000:.0f} ms")
+    approximate_results, p50, p99 = timed_queries(approximate, vectors, k)
+    # Recall measured on distances, since one-hot encodings produce many exact ties
+    recall = np.mean([
+        np.isclose(
+            np.sort(((exact.matrix[a] - v) ** 2).sum(axis=1)),
+            np.sort(((exact.matrix[e] - v) ** 2).sum(axis=1)),
+        ).all()
+        for a, e, v in zip(approximate_results, exact_results, vectors)
+    ])
+    print(f"approx search:      p50 {p50:.2f} ms  p99 {p99:.2f} ms  exact top-{k} match {recall:.0%}")
+
+
+if __name__ == "__main__":
+    main()
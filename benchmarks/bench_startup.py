@@ -0,0 +1,128 @@
+"""Cold start: time to first paint and to each page's first visit, in a fresh interpreter per run.
+
+Every run starts a new Python process (like a container scaled up from zero), imports
+Streamlit, renders the Home page through AppTest and then switches to one page. Pass
+--rev to measure a git revision (checked out in a temporary worktree) alongside the
+working tree.
+
+    python benchmarks/bench_startup.py [--runs 5] [--rev HEAD~1]
+
+Exits with an error when the modules Home imports load pandas, numpy or pyarrow.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = {
+    "Client Overview": "pages/1_Client_Overview.py",
+    "Cost Estimator": "pages/2_Cost_Estimator.py",
+    "Sales Pipeline": "pages/3_Sales_Pipeline.py",
+}
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "pyarrow.dataset", "plotly.express", "openai"]
+# Modules the app's own Home imports (layout and what it imports) must not load; they are
+# only needed by the other pages. Streamlit itself may still load numpy (st.image does).
+HOME_FORBIDDEN = ["pandas", "numpy", "pyarrow"]
+IMPORTS_CHECK = ":imports"  # child argument in place of a page name
+
+
+# Function run in the child process: returns the timings and heavy modules loaded per phase
+def measure(root, page):
+    started = time.perf_counter()
+    import streamlit
+    from streamlit.testing.v1 import AppTest
+    result = {"import_streamlit": time.perf_counter() - started}
+
+    os.chdir(root)
+    sys.path.insert(0, root)
+    at = AppTest.from_file(os.path.join(root, "app.py"), default_timeout=120)
+    at.secrets["openai"] = "stub"
+    started = time.perf_counter()
+    at.run()
+    result["first_paint"] = time.perf_counter() - started
+    result["home_modules"] = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    started = time.perf_counter()
+    if os.path.exists(os.path.join(root, PAGES[page])):
+        at.switch_page(PAGES[page]).run()
+    else:
+        at.sidebar.radio[0].set_value(page).run()  # revisions from before the pages/ layout
+    result["first_visit"] = time.perf_counter() - started
+    result["errors"] = [str(e.value) for e in at.exception]
+    return result
+
+
+# Function run in the child process: returns the forbidden modules loaded by importing
+# the modules app.py imports, on top of Streamlit
+def measure_imports(root):
+    import streamlit
+    sys.path.insert(0, root)
+    loaded = [name for name in HOME_FORBIDDEN if name in sys.modules]
+    import layout
+    return [name for name in HOME_FORBIDDEN if name in sys.modules and name not in loaded]
+
+
+# Function to run one measurement in a fresh interpreter
+def run_child(root, *args):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", root, *args],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def median(values):
+    return sorted(values)[len(values) // 2]
+
+
+def report(label, root, runs):
+    print(f"\n{label}")
+    for page in PAGES:
+        results = [run_child(root, page) for _ in range(runs)]
+        errors = sorted({error for result in results for error in result["errors"]})
+        print(
+            f"  {page:<16} import streamlit {median([r['import_streamlit'] for r in results]) * 1000:7.0f} ms"
+            f"  first paint {median([r['first_paint'] for r in results]) * 1000:7.0f} ms"
+            f"  first visit {median([r['first_visit'] for r in results]) * 1000:7.0f} ms"
+            + (f"  ERRORS {errors}" if errors else "")
+        )
+    print(f"  modules loaded for Home: {', '.join(results[0]['home_modules']) or '(none)'}")
+    if not os.path.exists(os.path.join(root, "layout.py")):
+        return []  # revisions from before the shared layout module
+    forbidden = run_child(root, IMPORTS_CHECK)
+    print(f"  of which by the app's Home imports: {', '.join(forbidden) or '(none)'}")
+    return forbidden
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per page (median reported)")
+    parser.add_argument("--rev", help="git revision to compare against the working tree")
+    parser.add_argument("--child", nargs=2, metavar=("ROOT", "PAGE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        root, page = args.child
+        print(json.dumps(measure_imports(root) if page == IMPORTS_CHECK else measure(root, page)))
+        return
+
+    if args.rev:
+        with tempfile.TemporaryDirectory() as worktree:
+            subprocess.run(["git", "-C", ROOT, "worktree", "add", "--detach", worktree, args.rev],
+                           check=True, capture_output=True)
+            try:
+                report(f"{args.rev}", worktree, args.runs)
+            finally:
+                subprocess.run(["git", "-C", ROOT, "worktree", "remove", "--force", worktree], check=True)
+    forbidden = report("working tree", ROOT, args.runs)
+    if forbidden:
+        sys.exit(f"FAIL: Home loads {', '.join(forbidden)} before first paint")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Cold-load and per-client filter latency: partitioned Parquet vs a flat CSV export.
+
+    python scripts/generate_synthetic_data.py --rows 1000000 --out data/1m
+    python benchmarks/bench_storage.py data/1m
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+import storage
+from data_access import PIPELINE_COLUMNS
+
+
+def timed(label, func, runs=5):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    print(f"{label:<45} best {min(timings) * 1000:9.1f} ms  median {sorted(timings)[runs // 2] * 1000:9.1f} ms")
+    return result
+
+
+def main(root):
+    pipeline_root = os.path.join(root, "pipeline")
+    clients_root = os.path.join(root, "clients")
+    csv_path = os.path.join(root, "pipeline.csv")
+    if not os.path.exists(csv_path):
+        storage.read_dataset(pipeline_root).to_csv(csv_path, index=False)
+
+    rows = len(timed("parquet: full pipeline load", lambda: storage.read_dataset(pipeline_root, PIPELINE_COLUMNS)))
+    timed("csv: full pipeline load", lambda: pd.read_csv(csv_path, usecols=PIPELINE_COLUMNS), runs=3)
+    timed("parquet: 2-column projection", lambda: storage.read_dataset(pipeline_root, ["Stage", "Estimated Value"]))
+
+    names = storage.read_client_names(clients_root)
+    client_name = names[len(names) // 2]
+    timed("parquet: one client's opportunities", lambda: storage.read_client_rows(pipeline_root, client_name))
+    timed("csv: one client's opportunities", lambda: (lambda df: df[df["Client Name"] == client_name])(pd.read_csv(csv_path)), runs=3)
+    timed("parquet: one client record", lambda: storage.read_client_rows(clients_root, client_name))
+    timed("parquet: client name list", lambda: storage.read_client_names(clients_root))
+    print(f"{rows:,} pipeline rows")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "data/synthetic")
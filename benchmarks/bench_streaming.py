@@ -0,0 +1,42 @@
+"""Time to first token: streaming vs blocking completions against the local mock server."""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openai
+
+from llm_stream import stream_chat_completion
+from mock_openai import start_mock_server
+
+MESSAGES = [{"role": "user", "content": "Describe the solution."}]
+
+
+def main(token_delay=0.02, runs=5):
+    server, base_url = start_mock_server(token_delay=token_delay)
+    openai.api_base = base_url
+    openai.api_key = "mock"
+
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = openai.ChatCompletion.create(model="gpt-4", messages=MESSAGES, max_tokens=300, temperature=0.5)
+        response["choices"][0]["message"]["content"]
+        blocking = time.perf_counter() - started
+
+        started = time.perf_counter()
+        first_token = None
+        for _chunk in stream_chat_completion(MESSAGES, "gpt-4", 300, 0.5):
+            if first_token is None:
+                first_token = time.perf_counter() - started
+        streaming_total = time.perf_counter() - started
+
+        print(
+            f"blocking first content {blocking * 1000:7.1f} ms | "
+            f"streaming first token {first_token * 1000:7.1f} ms, total {streaming_total * 1000:7.1f} ms"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+# Set corporate colors for JLL
+jll_colors = {
+    "red": "#bf1e2e",
+    "grey": "#555555",
+    "white": "#ffffff",
+    "black": "#000000"
+}
+
+# Shared JLL layout, registered once as a Plotly template and layered on simple_white
+pio.templates["jll"] = go.layout.Template(
+    layout=go.Layout(
+        font=dict(size=12),
+        title_x=0.5,
+        colorway=[jll_colors["red"], jll_colors["grey"], jll_colors["black"]],
+    )
+)
+JLL_TEMPLATE = "simple_white+jll"
+JLL_COLOR_SCALE = [[0, jll_colors["grey"]], [1, jll_colors["red"]]]
+
+PLOTLY_EXPRESS = {"line": px.line, "bar": px.bar, "area": px.area}
+
+
+# Function to build a JLL-styled Plotly Express figure. Figures are memoized on
+# their inputs (hashed by Streamlit), so an unchanged chart is never rebuilt.
+# color_by_value shades bars from grey to red by their y value.
+@st.cache_resource(max_entries=256, show_spinner=False)
+def jll_figure(kind, data_frame=None, x=None, y=None, title=None, xaxis_title=None, yaxis_title=None,
+               color_by_value=False, layout=None, **px_options):
+    if color_by_value:
+        px_options.update(color=y, color_continuous_scale=JLL_COLOR_SCALE)
+    elif "color" not in px_options and "color_discrete_sequence" not in px_options:
+        px_options["color_discrete_sequence"] = [jll_colors["red"]]
+    fig = PLOTLY_EXPRESS[kind](data_frame, x=x, y=y, title=title, template=JLL_TEMPLATE, **px_options)
+    fig.update_layout(xaxis_title=xaxis_title, yaxis_title=yaxis_title, **(layout or {}))
+    if color_by_value:
+        fig.update_layout(coloraxis_showscale=False)
+    return fig
+
+
+# Function to build a tornado chart of low/high swings per input (memoized like jll_figure)
+@st.cache_resource(max_entries=64, show_spinner=False)
+def jll_tornado(labels, low, high, title, xaxis_title):
+    fig = go.Figure([
+        go.Bar(y=labels, x=low, orientation="h", name="Low", marker_color=jll_colors["grey"]),
+        go.Bar(y=labels, x=high, orientation="h", name="High", marker_color=jll_colors["red"]),
+    ])
+    fig.update_layout(title=title, xaxis_title=xaxis_title, barmode="overlay", template=JLL_TEMPLATE)
+    return fig
+
+
+# Function to build a fan chart of P10-P90 bands around a median line (memoized like jll_figure).
+# bands has "Month", "P10", "P50" and "P90" columns; reference is an optional (label, values) line.
+@st.cache_resource(max_entries=64, show_spinner=False)
+def jll_fan_chart(bands, title, xaxis_title, yaxis_title, reference=None):
+    fig = go.Figure([
+        go.Scatter(x=bands["Month"], y=bands["P90"], name="P90", mode="lines",
+                   line=dict(width=0.5, color=jll_colors["red"])),
+        go.Scatter(x=bands["Month"], y=bands["P10"], name="P10", mode="lines", fill="tonexty",
+                   fillcolor="rgba(191, 30, 46, 0.2)", line=dict(width=0.5, color=jll_colors["red"])),
+        go.Scatter(x=bands["Month"], y=bands["P50"], name="P50", mode="lines+markers",
+                   line=dict(width=2, color=jll_colors["red"])),
+    ])
+    if reference is not None:
+        label, values = reference
+        fig.add_trace(go.Scatter(x=bands["Month"], y=values, name=label, mode="lines",
+                                 line=dict(dash="dash", color=jll_colors["grey"])))
+    fig.update_layout(title=title, xaxis_title=xaxis_title, yaxis_title=yaxis_title,
+                      xaxis_tickformat="%b %Y", hovermode="x unified", template=JLL_TEMPLATE)
+    return fig
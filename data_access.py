@@ -0,0 +1,361 @@
+import datetime
+import os
+
+import pandas as pd
+import streamlit as st
+
+import storage
+from activity import generate_activity
+from forecast import FORECAST_VERSION, simulate_pipeline
+from pipeline_rollups import ROLLUP_VERSION, PipelineRollup
+from shared_cache import default_cache, make_key
+from similar_projects import ProjectIndex, generate_corpus
+
+# Optional CSV/Parquet exports to load instead of the built-in sample data
+CLIENTS_PATH_ENV = "JLL_CLIENTS_PATH"
+PIPELINE_PATH_ENV = "JLL_PIPELINE_PATH"
+PROJECTS_PATH_ENV = "JLL_PROJECTS_PATH"
+
+# Session state entries holding values derived from the data (the Cost Estimator's
+# memoized graph), dropped along with the caches on Reload Data
+ESTIMATOR_STATE_KEY = "estimator_graph"
+DERIVED_STATE_KEYS = [ESTIMATOR_STATE_KEY]
+
+# Size of the synthetic past-project corpus used when no export is configured
+SAMPLE_PROJECT_COUNT = 2000
+
+# Sample data for clients
+SAMPLE_CLIENTS = {
+    "Client Name": [
+        "ACME Corp", "Globex Inc", "Initech", "Umbrella Corp", "Hooli",
+        "Stark Industries", "Wayne Enterprises", "Soylent Corp", "Massive Dynamic", "Vandelay Industries"
+    ],
+    "Contract Start": [
+        "2022-01-01", "2021-06-15", "2023-03-01", "2020-11-11", "2022-05-20",
+        "2021-09-30", "2022-01-15", "2023-02-01", "2020-07-01", "2021-12-01"
+    ],
+    "Contract End": [
+        "2024-12-31", "2023-06-14", "2025-03-01", "2023-11-10", "2024-05-19",
+        "2024-09-29", "2025-01-14", "2024-02-01", "2023-07-01", "2023-12-01"
+    ],
+    "Solutions": [
+        ["Data Warehouse", "Tableau Dashboards"], ["ETL Pipeline", "Real-time Data Sync"],
+        ["Operational Reporting", "Machine Learning"], ["IoT Integration", "Data Lake"],
+        ["Data Pipeline", "Custom Visualizations"], ["AI/ML Integration", "Data Warehouse"],
+        ["Real-time Data Sync", "IoT Integration"], ["Data Lake", "ETL Pipeline"],
+        ["Machine Learning", "Custom Visualizations"], ["Operational Reporting", "Data Lake"]
+    ],
+    "CR Count": [5, 3, 7, 4, 6, 8, 2, 3, 5, 4],
+    "Renewal Likelihood": ["High", "Medium", "High", "Low", "Medium", "High", "Medium", "Low", "Medium", "Low"]
+}
+
+# Sample data for sales pipeline
+SAMPLE_PIPELINE = {
+    "Client Name": [
+        "ACME Corp", "Globex Inc", "Initech", "Umbrella Corp", "Hooli",
+        "Stark Industries", "Wayne Enterprises", "Soylent Corp", "Massive Dynamic", "Vandelay Industries"
+    ],
+    "Stage": [
+        "Proposal", "Negotiation", "Prospecting", "Closed Won", "Proposal",
+        "Negotiation", "Prospecting", "Closed Lost", "Proposal", "Negotiation"
+    ],
+    "Estimated Value": [
+        100000, 150000, 80000, 200000, 120000,
+        160000, 90000, 75000, 110000, 130000
+    ],
+    "Probability (%)": [
+        60, 70, 30, 100, 60,
+        70, 30, 0, 60, 70
+    ],
+    "Expected Close Date": [
+        "2023-12-15", "2023-11-30", "2024-01-20", "2023-10-01", "2023-12-31",
+        "2023-11-25", "2024-02-10", "2023-09-15", "2023-12-20", "2023-11-10"
+    ]
+}
+
+# Columns the Sales Pipeline page reads from a pipeline export
+PIPELINE_COLUMNS = ["Client Name", "Stage", "Estimated Value", "Probability (%)", "Expected Close Date"]
+
+RENEWAL_LEAD_TIME = datetime.timedelta(days=90)
+TOP_OPPORTUNITIES = 5
+FORECAST_SEED = 0  # fixed so a pipeline snapshot always yields the same forecast
+
+# Namespaces of the results this module shares through the node-wide cache
+FORECAST_NAMESPACE = "pipeline_forecast"
+SUMMARY_NAMESPACE = "pipeline_summary"
+
+
+# Function to read a CSV or Parquet export into a DataFrame.
+# Directories are partitioned datasets written by storage.write_dataset.
+def read_table(path, columns=None):
+    if os.path.isdir(path):
+        return storage.read_dataset(path, columns=columns)
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns)
+
+
+# Function to identify a data file version, so edits to the file invalidate the cache.
+# A dataset directory's version lists its part files, so appended parts count as edits.
+# Listing a directory stats every part, so pages take a source once per rerun (from
+# clients_source/pipeline_source) and pass it to the accessors below.
+def _source_version(env_var):
+    path = os.environ.get(env_var)
+    if not path:
+        return None, None
+    if os.path.isdir(path):
+        return path, tuple(storage.dataset_files(path))
+    return path, os.path.getmtime(path)
+
+
+# Function to add the derived contract columns to a client frame, indexed by client name
+def _prepare_clients(clients_df, as_of):
+    if len(clients_df) and isinstance(clients_df["Solutions"].iloc[0], str):
+        # CSV exports store the solution list as "A; B"
+        clients_df["Solutions"] = clients_df["Solutions"].str.split(r"\s*;\s*")
+    clients_df["Contract Start"] = pd.to_datetime(clients_df["Contract Start"])
+    clients_df["Contract End"] = pd.to_datetime(clients_df["Contract End"])
+    clients_df["Contract Status"] = (clients_df["Contract End"] > pd.Timestamp(as_of)).map(
+        {True: "Active", False: "Expired"}
+    )
+    clients_df["Suggested Renewal Date"] = clients_df["Contract End"] - RENEWAL_LEAD_TIME
+    clients_df["Solutions Used"] = clients_df["Solutions"].map(len)
+    return clients_df.set_index("Client Name", drop=False)
+
+
+# Function to build the client table with derived contract columns
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_clients(path, version, as_of):
+    clients_df = read_table(path) if path else pd.DataFrame(SAMPLE_CLIENTS)
+    return _prepare_clients(clients_df, as_of)
+
+
+# Function to list client names, reading only the name column from a dataset directory
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_client_names(path, version, as_of):
+    if path and os.path.isdir(path):
+        return storage.read_client_names(path)
+    return _load_clients(path, version, as_of).index.tolist()
+
+
+# Function to load one client from a dataset directory via partition and predicate pushdown
+@st.cache_data(show_spinner=False, max_entries=1024)
+def _load_client_from_dataset(path, version, as_of, client_name):
+    return _prepare_clients(storage.read_client_rows(path, client_name), as_of).iloc[0]
+
+
+# Function to add weighted values and close months to pipeline rows
+def _prepare_pipeline(pipeline_df):
+    pipeline_df["Expected Close Date"] = pd.to_datetime(pipeline_df["Expected Close Date"])
+    pipeline_df["Weighted Value"] = pipeline_df["Estimated Value"] * pipeline_df["Probability (%)"] / 100
+    pipeline_df["Month"] = pipeline_df["Expected Close Date"].dt.to_period("M").dt.to_timestamp()
+    return pipeline_df
+
+
+# Function to generate the activity table for every client in one batch.
+# as_of_month (not the date) is the key, so the table is rebuilt once a month.
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_activity(path, version, as_of_month):
+    return generate_activity(_load_client_names(path, version, datetime.date.today()), as_of_month)
+
+
+# Function to build the pipeline table with weighted values and close months
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_pipeline(path, version):
+    pipeline_df = read_table(path, PIPELINE_COLUMNS) if path else pd.DataFrame(SAMPLE_PIPELINE)
+    return _prepare_pipeline(pipeline_df)
+
+
+# Function to get the shared pipeline rollup for a source (kept across source versions)
+@st.cache_resource(show_spinner=False)
+def _pipeline_rollup(path):
+    return PipelineRollup(TOP_OPPORTUNITIES)
+
+
+# Function to bring the pipeline rollup up to date with its source. New part files of a
+# dataset directory are read and folded in on their own; any other change rebuilds it.
+def _refresh_pipeline_rollup(path, version):
+    rollup = _pipeline_rollup(path)
+    is_dataset = path is not None and os.path.isdir(path)
+    sources = list(version) if is_dataset else [(path, version)]
+    with rollup.lock:
+        if not rollup.sources.issubset(sources):
+            rollup.reset()
+        new_sources = [source for source in sources if source not in rollup.sources]
+        if new_sources:
+            if is_dataset:
+                files = [file for file, _ in new_sources]
+                pipeline_df = _prepare_pipeline(storage.read_dataset(path, PIPELINE_COLUMNS, files=files))
+            else:
+                pipeline_df = _load_pipeline(path, version)
+            rollup.add(pipeline_df, new_sources)
+    return rollup
+
+
+# The cached objects above are shared by every session and keyed by source version, so each
+# keeps only its latest version (max_entries=1).
+
+# Function to copy a cached frame (or list or dict of them) before handing it to a session,
+# so an in-place edit in one session cannot leak into the cache and every other session
+def _private_copy(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {key: _private_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+# Function to get the current (path, version) of the client data
+def clients_source():
+    return _source_version(CLIENTS_PATH_ENV)
+
+
+# Function to get the current (path, version) of the pipeline data
+def pipeline_source():
+    return _source_version(PIPELINE_PATH_ENV)
+
+
+# Function to get the client table (one row per client, indexed by "Client Name")
+def load_clients(source=None):
+    path, version = source or clients_source()
+    return _private_copy(_load_clients(path, version, datetime.date.today()))
+
+
+# Function to get the names of all clients
+def load_client_names(source=None):
+    path, version = source or clients_source()
+    return _private_copy(_load_client_names(path, version, datetime.date.today()))
+
+
+# Function to get one client's row; dataset directories read only that client's data
+def load_client(client_name, source=None):
+    path, version = source or clients_source()
+    as_of = datetime.date.today()
+    if path and os.path.isdir(path):
+        return _load_client_from_dataset(path, version, as_of, client_name)
+    return _private_copy(_load_clients(path, version, as_of).loc[client_name])
+
+
+# Function to get one client's 12-month activity series and current engagement score.
+# The series end with the last month that has finished (its month-end is on or before today).
+def load_client_activity(client_name, source=None):
+    path, version = source or clients_source()
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    as_of_month = (pd.Period(tomorrow, freq="M") - 1).to_timestamp()
+    return _load_activity(path, version, as_of_month).client(client_name)
+
+
+# Function to get the pipeline table with "Weighted Value" and "Month" columns
+def load_pipeline(source=None):
+    return _private_copy(_load_pipeline(*(source or pipeline_source())))
+
+
+# Function to run the Monte Carlo revenue forecast for one pipeline snapshot. The result is
+# shared with the other processes on the node, so each snapshot is simulated only once.
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _forecast_pipeline(path, version, trials, slip_rate):
+    forecast = default_cache().get_or_compute(
+        FORECAST_NAMESPACE, make_key(FORECAST_VERSION, path, version, trials, slip_rate, FORECAST_SEED),
+        lambda: simulate_pipeline(_load_pipeline(path, version), trials=trials, slip_rate=slip_rate, seed=FORECAST_SEED),
+    )
+    # Shared by every session, so its arrays are made read-only
+    forecast.revenue.flags.writeable = False
+    forecast.totals.flags.writeable = False
+    return forecast
+
+
+# Function to get the simulated revenue forecast (memoized per pipeline snapshot and settings)
+def load_pipeline_forecast(trials, slip_rate=0.0, source=None):
+    return _forecast_pipeline(*(source or pipeline_source()), trials, slip_rate)
+
+
+# Function to format pipeline rows as display strings (applied per page, never to the full table)
+def format_pipeline_rows(rows):
+    return pd.DataFrame({
+        "Client Name": rows["Client Name"],
+        "Stage": rows["Stage"],
+        "Estimated Value": rows["Estimated Value"].map("${:,.2f}".format),
+        "Probability (%)": rows["Probability (%)"].map("{:.0f}%".format),
+        "Expected Close Date": rows["Expected Close Date"].dt.strftime("%Y-%m-%d"),
+        "Weighted Value": rows["Weighted Value"].map("${:,.2f}".format),
+    })
+
+
+# Function to get one page (1-based) of the pipeline table, formatted for display. From a
+# dataset directory only the row groups holding the page are read; single files are read whole.
+def load_pipeline_page(page_number, page_size, source=None):
+    path, version = source or pipeline_source()
+    start = (page_number - 1) * page_size
+    if path and os.path.isdir(path):
+        rows = _prepare_pipeline(storage.read_dataset_rows(version, start, start + page_size, PIPELINE_COLUMNS))
+    else:
+        rows = _load_pipeline(path, version).iloc[start:start + page_size]
+    return format_pipeline_rows(rows)
+
+
+# Function to get the pipeline summary of one source version, computed by the first process
+# on the node that needs it and shared with the others
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _pipeline_summary(path, version):
+    return default_cache().get_or_compute(
+        SUMMARY_NAMESPACE, make_key(ROLLUP_VERSION, path, version),
+        lambda: _refresh_pipeline_rollup(path, version).summary(),
+    )
+
+
+# Function to get the precomputed row count, totals, stage/month rollups and top opportunities
+def load_pipeline_summary(source=None):
+    return _private_copy(_pipeline_summary(*(source or pipeline_source())))
+
+
+# Function to get one client's pipeline rolled up by stage
+def load_client_pipeline(client_name, source=None):
+    return _refresh_pipeline_rollup(*(source or pipeline_source())).client_summary(client_name)
+
+
+# Function to load the corpus of past projects used for similar-project retrieval
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_project_corpus(path, version):
+    return read_table(path) if path else generate_corpus(SAMPLE_PROJECT_COUNT)
+
+
+# Function to build the nearest-neighbour index over the past-project corpus
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_project_index(path, version):
+    return ProjectIndex(_load_project_corpus(path, version))
+
+
+# Function to get the current (path, version) of the past-project corpus
+def projects_source():
+    return _source_version(PROJECTS_PATH_ENV)
+
+
+# Function to get the past-project corpus (name, link and project_params fields)
+def load_project_corpus(source=None):
+    return _private_copy(_load_project_corpus(*(source or projects_source())))
+
+
+# Function to get the shared similar-project index
+def load_project_index(source=None):
+    return _load_project_index(*(source or projects_source()))
+
+
+# Function to drop all cached datasets so the next access reloads them, including the
+# results shared with the other processes on the node
+def clear_data_cache():
+    _load_clients.clear()
+    _load_client_names.clear()
+    _load_client_from_dataset.clear()
+    _load_activity.clear()
+    _load_pipeline.clear()
+    _pipeline_rollup.clear()
+    _pipeline_summary.clear()
+    _forecast_pipeline.clear()
+    _load_project_corpus.clear()
+    _load_project_index.clear()
+    default_cache().clear(FORECAST_NAMESPACE)
+    default_cache().clear(SUMMARY_NAMESPACE)
+    for key in DERIVED_STATE_KEYS:
+        st.session_state.pop(key, None)
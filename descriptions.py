@@ -0,0 +1,281 @@
+import os
+from concurrent.futures import wait
+
+import streamlit as st
+
+from instrumentation import section
+from llm_cache import ResponseCache, make_cache_key
+from llm_jobs import JobQueue
+from prompt_builder import (
+    BASELINE_NOTE, SYSTEM_PROMPT, build_batch_messages, build_messages, canonical_params, plan_batches,
+    split_batch_response,
+)
+from shared_cache import default_cache
+
+# Settings for the solution description completion
+DESCRIPTION_MODEL = "gpt-4"
+DESCRIPTION_TEMPERATURE = 0.5
+DESCRIPTION_MAX_TOKENS = 300
+DESCRIPTION_STREAMING = True  # Set to False to always wait for the full completion
+DESCRIPTION_WORKERS = 4
+DESCRIPTION_LEASE_SECONDS = 120  # how long other processes wait on one process's request
+FOLLOW_POLL_SECONDS = 0.2  # how often a coalesced request checks its own cancel
+DESCRIPTION_BATCH_SIZE = 5  # default scenarios per completion in generate_descriptions
+DESCRIPTION_BATCH_MAX_TOKENS = DESCRIPTION_MAX_TOKENS + 20  # per scenario, with room for the JSON around it
+DESCRIPTION_CONTEXT_TOKENS = 8192  # context window of DESCRIPTION_MODEL
+
+
+# OpenAI client, imported and given its API key on first use (the Cost Estimator page)
+@st.cache_resource
+def get_openai():
+    import openai
+    # Ensure your API key is stored securely in Streamlit secrets (or OPENAI_API_KEY for scripts)
+    openai.api_key = os.environ.get("OPENAI_API_KEY") or st.secrets["openai"]
+    return openai
+
+
+# Response cache so identical estimates skip the OpenAI round trip; backed by the
+# node-wide shared cache, so every process on the machine reuses the same responses
+@st.cache_resource
+def get_response_cache():
+    return ResponseCache(default_cache())
+
+
+# Function to build the chat messages for a solution description (compact, non-default fields only)
+def build_description_messages(project_params):
+    return build_messages(project_params)
+
+
+# Process-wide gateway shared by every session's OpenAI calls
+@st.cache_resource
+def get_llm_gateway():
+    from llm_gateway import LLMGateway
+    return LLMGateway()
+
+
+# Background worker pool for description jobs, shared by every session
+@st.cache_resource
+def get_job_queue():
+    return JobQueue(max_workers=DESCRIPTION_WORKERS)
+
+
+# Raised inside stream_description when the user interrupts a streaming description
+class DescriptionCancelled(Exception):
+    pass
+
+
+# Function to compute the response cache key for a description request
+def description_cache_key(project_params):
+    return make_cache_key(
+        canonical_params(project_params), DESCRIPTION_MODEL, DESCRIPTION_TEMPERATURE,
+        SYSTEM_PROMPT + BASELINE_NOTE,
+    )
+
+
+# Function to request a description from OpenAI in a single blocking call
+def request_description(project_params, request_timeout=None):
+    with section("llm"):
+        response = get_openai().ChatCompletion.create(
+            model=DESCRIPTION_MODEL,
+            messages=build_description_messages(project_params),
+            max_tokens=DESCRIPTION_MAX_TOKENS,
+            temperature=DESCRIPTION_TEMPERATURE,
+            request_timeout=request_timeout,
+        )
+    return response['choices'][0]['message']['content'].strip()
+
+
+# Function to generate a solution architecture description (blocking; raises on failure)
+def generate_description(project_params):
+    cache = get_response_cache()
+    key = description_cache_key(project_params)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Another process is already requesting this description: wait for its response
+    owner = cache.try_lease(key, DESCRIPTION_LEASE_SECONDS)
+    if owner is None:
+        description = cache.wait(key)
+        if description is not None:
+            return description
+
+    gateway = get_llm_gateway()
+    try:
+        description = gateway.call(key, lambda: request_description(project_params, gateway.request_timeout))
+        cache.set(key, description)
+    finally:
+        cache.release_lease(key, owner)
+    return description
+
+
+# Function to request several descriptions in one completion, split back per scenario
+# (None for any the response leaves out)
+def request_descriptions(scenarios, request_timeout=None):
+    with section("llm"):
+        response = get_openai().ChatCompletion.create(
+            model=DESCRIPTION_MODEL,
+            messages=build_batch_messages(scenarios),
+            max_tokens=DESCRIPTION_BATCH_MAX_TOKENS * len(scenarios),
+            temperature=DESCRIPTION_TEMPERATURE,
+            request_timeout=request_timeout,
+        )
+    return split_batch_response(response['choices'][0]['message']['content'], len(scenarios))
+
+
+# Function to generate descriptions for several configurations with few round trips: cached
+# ones are reused and the rest requested up to batch_size per completion, in batches that
+# fit the context window. Batches of one (always, with batch_size=1), scenarios a batched
+# response leaves out and scenarios another process is already requesting go through
+# generate_description one by one, with the single-description prompt.
+# Returns one entry per configuration, in order: the description, or the exception raised
+# for it (as asyncio.gather does with return_exceptions=True).
+def generate_descriptions(scenarios, batch_size=DESCRIPTION_BATCH_SIZE):
+    cache = get_response_cache()
+    keys = [description_cache_key(project_params) for project_params in scenarios]
+    results, pending = {}, {}
+    for key, project_params in zip(keys, scenarios):
+        if key in results or key in pending:
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            results[key] = cached
+        else:
+            pending[key] = project_params
+
+    owners = {key: cache.try_lease(key, DESCRIPTION_LEASE_SECONDS) for key in pending}
+    requested = [key for key, owner in owners.items() if owner is not None]
+    gateway = get_llm_gateway()
+    try:
+        for batch in plan_batches(
+            [pending[key] for key in requested], batch_size,
+            DESCRIPTION_CONTEXT_TOKENS, DESCRIPTION_BATCH_MAX_TOKENS, DESCRIPTION_MODEL,
+        ):
+            if len(batch) == 1:
+                continue
+            batch_keys = [requested[position] for position in batch]
+            batch_params = [pending[key] for key in batch_keys]
+            try:
+                descriptions = gateway.run(lambda: request_descriptions(batch_params, gateway.request_timeout))
+            except Exception as e:
+                results.update((key, e) for key in batch_keys)
+                continue
+            for key, description in zip(batch_keys, descriptions):
+                if description is not None:
+                    cache.set(key, description)
+                    results[key] = description
+    finally:
+        for key, owner in owners.items():
+            cache.release_lease(key, owner)
+
+    for key, project_params in pending.items():
+        if key not in results:
+            try:
+                results[key] = generate_description(project_params)
+            except Exception as e:
+                results[key] = e
+    return [results[key] for key in keys]
+
+
+# Function to stream a solution architecture description chunk by chunk (raises on failure).
+# Falls back to the blocking call when streaming is unavailable, and waits for
+# the shared result when an identical description is already being generated,
+# in this process or in another one on the node.
+def stream_description(project_params, cancel_event=None):
+    from llm_stream import stream_chat_completion
+    cache = get_response_cache()
+    key = description_cache_key(project_params)
+    cached = cache.get(key)
+    if cached is not None:
+        yield cached
+        return
+
+    # Follow an identical request already in flight in this process. If the session that
+    # leads it cancels, that cancel is not passed on: the next follower claims the key and
+    # requests the description itself.
+    gateway = get_llm_gateway()
+    while True:
+        future, leader = gateway.claim(key)
+        if leader:
+            break
+        while not future.done():
+            if cancel_event is not None and cancel_event.is_set():
+                raise DescriptionCancelled("The description request was cancelled")
+            wait([future], timeout=FOLLOW_POLL_SECONDS)
+        try:
+            description = future.result()
+        except DescriptionCancelled:
+            continue
+        yield description
+        return
+
+    owner = cache.try_lease(key, DESCRIPTION_LEASE_SECONDS)
+    if owner is None:
+        description = cache.wait(key)
+        if description is not None:
+            gateway.resolve(key, future, result=description)
+            yield description
+            return
+
+    parts = []
+    try:
+        try:
+            try:
+                with section("llm"), gateway.slot():
+                    for chunk in stream_chat_completion(
+                        build_description_messages(project_params),
+                        DESCRIPTION_MODEL,
+                        DESCRIPTION_MAX_TOKENS,
+                        DESCRIPTION_TEMPERATURE,
+                        cancel_event,
+                        gateway.request_timeout,
+                    ):
+                        parts.append(chunk)
+                        yield chunk
+                if cancel_event is not None and cancel_event.is_set():
+                    raise DescriptionCancelled("The description request was cancelled")
+                description = "".join(parts).strip()
+            except DescriptionCancelled:
+                raise
+            except Exception:
+                if parts:
+                    raise
+                description = gateway.run(lambda: request_description(project_params, gateway.request_timeout))
+                yield description
+        except BaseException as e:
+            # Includes the generator being closed mid-stream; release any waiting callers
+            error = e if isinstance(e, Exception) else DescriptionCancelled("The description request was cancelled")
+            gateway.resolve(key, future, error=error)
+            raise
+        gateway.resolve(key, future, result=description)
+        cache.set(key, description)
+    finally:
+        cache.release_lease(key, owner)
+
+
+# Function run on a background worker to produce one description job
+def run_description_job(job):
+    project_params = job.metadata["project_params"]
+    if not DESCRIPTION_STREAMING:
+        return generate_description(project_params)
+    for chunk in stream_description(project_params, job.cancel_event):
+        job.append(chunk)
+    return job.text.strip()
+
+
+# Function to get this session's description jobs, dropping any the queue has forgotten
+def session_description_jobs():
+    job_queue = get_job_queue()
+    jobs = [job for job in map(job_queue.get, st.session_state.get("description_jobs", [])) if job is not None]
+    st.session_state["description_jobs"] = [job.id for job in jobs]
+    return jobs
+
+
+# Function to summarize a configuration as a short job label
+def describe_configuration(project_params):
+    return " · ".join([
+        project_params["solution_type"],
+        project_params["data_warehouse"],
+        project_params["etl_type"],
+        project_params["dashboard_required"],
+    ])
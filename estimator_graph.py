@@ -0,0 +1,71 @@
+import time
+from collections import namedtuple
+
+# Result of evaluating the graph: node values plus the (name, milliseconds)
+# of every node that had to be recomputed on this run
+Evaluation = namedtuple("Evaluation", ["values", "recomputed"])
+
+
+# Function to turn parameter values into comparable, hashable keys
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# A memoized derived value. func receives the declared subset of project_params
+# (or all of them when params is None) followed by the values of depends_on, and the
+# declared context values (versions of the data or code the node reads) as keyword
+# arguments. A node is recomputed when any of them changes.
+class Node:
+    def __init__(self, name, func, params=None, depends_on=(), context=()):
+        self.name = name
+        self.func = func
+        self.params = params
+        self.depends_on = tuple(depends_on)
+        self.context = tuple(context)
+
+
+# Dependency graph of derived values; only nodes whose inputs changed are recomputed
+class DependencyGraph:
+    def __init__(self, nodes):
+        seen = set()
+        for node in nodes:
+            missing = [name for name in node.depends_on if name not in seen]
+            if missing:
+                raise ValueError(f"Node {node.name!r} depends on {missing} which are not defined before it")
+            seen.add(node.name)
+        self.nodes = list(nodes)
+
+    # Function to evaluate every node, reusing cached values from state.
+    # state is any dict that persists between reruns, e.g. an st.session_state entry;
+    # context maps the names nodes declare in `context` to their current values.
+    def evaluate(self, project_params, state, context=None):
+        context = context or {}
+        values = {}
+        recomputed = []
+        for node in self.nodes:
+            if node.params is None:
+                inputs = dict(project_params)
+            else:
+                inputs = {name: project_params.get(name) for name in node.params}
+            node_context = {name: context[name] for name in node.context}
+            key = (
+                _freeze(inputs),
+                tuple(state[name]["version"] for name in node.depends_on),
+                _freeze(node_context),
+            )
+
+            entry = state.get(node.name)
+            if entry is None or entry["key"] != key:
+                started = time.perf_counter()
+                value = node.func(inputs, *(values[name] for name in node.depends_on), **node_context)
+                elapsed = (time.perf_counter() - started) * 1000
+                version = entry["version"] + 1 if entry else 0
+                entry = {"key": key, "value": value, "version": version}
+                state[node.name] = entry
+                recomputed.append((node.name, elapsed))
+            values[node.name] = entry["value"]
+        return Evaluation(values, recomputed)
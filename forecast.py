@@ -0,0 +1,116 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Monte Carlo settings for the pipeline revenue forecast
+DEFAULT_TRIALS = 10_000
+MAX_SLIP_MONTHS = 3
+CHUNK_ELEMENTS = 1 << 24  # opportunities x trials simulated at once (~16M, bounds memory per worker)
+BANDS = {"P10": 10, "P50": 50, "P90": 90}
+FORECAST_VERSION = 1  # bump when the simulation or PipelineForecast changes (keys cached forecasts)
+
+# Outcomes are drawn as 16-bit uniforms: four per 64-bit generator output
+_UNIFORM_LEVELS = 1 << 16
+
+
+# Function to get P(a won deal closes exactly k months late) for k = 0..max_months.
+# Each further month of delay is slip_rate times as likely as the one before.
+def slip_distribution(slip_rate, max_months=MAX_SLIP_MONTHS):
+    if not slip_rate:
+        return np.ones(1)
+    return np.array([(1 - slip_rate) * slip_rate ** k for k in range(max_months)] + [slip_rate ** max_months])
+
+
+# Simulated revenue per trial and month, with the summaries the Sales Pipeline page shows
+class PipelineForecast:
+    def __init__(self, months, revenue):
+        self.months = months
+        self.revenue = revenue
+        self.totals = revenue.sum(axis=1)
+
+    @property
+    def trials(self):
+        return len(self.totals)
+
+    # Function to get the P10/P50/P90 and mean revenue of every month
+    def bands(self):
+        quantiles = np.percentile(self.revenue, list(BANDS.values()), axis=0)
+        frame = pd.DataFrame(dict(zip(BANDS, quantiles)))
+        frame.insert(0, "Month", self.months)
+        frame["Mean"] = self.revenue.mean(axis=0)
+        return frame
+
+    # Function to get the P10/P50/P90 of total revenue over the whole horizon
+    def total_bands(self):
+        return dict(zip(BANDS, np.percentile(self.totals, list(BANDS.values()))))
+
+    # Function to get the share of trials whose total revenue reaches the quota
+    def quota_probability(self, quota):
+        return float(np.mean(self.totals >= quota))
+
+
+# Function to simulate one chunk of trials. Each opportunity draws one uniform u per trial:
+# it is won with slip k when bounds[k] <= u < bounds[k + 1], so win and slippage share a draw.
+# Revenue with u < bounds[k] is booked k - 1 months late and taken back from k months late,
+# which leaves every deal in its own slip month with one comparison per slip level.
+def _simulate_chunk(seed, trials, bounds, values, month_slices, n_months):
+    rng = np.random.default_rng(seed)
+    n = values.size
+    raw = rng.bit_generator.random_raw(-(-trials * n // 4))
+    uniforms = raw.view(np.uint16)[:trials * n].reshape(trials, n)
+    revenue = np.zeros((trials, n_months))
+    for k in range(1, len(bounds)):
+        hits = (uniforms < bounds[k]).view(np.uint8)
+        for month, (start, stop) in enumerate(month_slices):
+            if stop > start:
+                won = hits[:, start:stop].astype(float) @ values[start:stop]
+                revenue[:, month + k - 1] += won
+                if k < len(bounds) - 1:
+                    revenue[:, month + k] -= won
+    return revenue
+
+
+# Function to run a vectorized Monte Carlo forecast over a pipeline frame with
+# "Estimated Value", "Probability (%)" and "Month" columns. Every open opportunity is
+# a Bernoulli outcome with its stated probability; won deals slip by up to
+# MAX_SLIP_MONTHS months (see slip_distribution). Trials run in chunks of at most
+# CHUNK_ELEMENTS draws, spread over `workers` threads; results depend only on `seed`.
+def simulate_pipeline(pipeline_df, trials=DEFAULT_TRIALS, slip_rate=0.0, seed=0, workers=None):
+    if pipeline_df.empty:
+        return PipelineForecast(pd.DatetimeIndex([]), np.zeros((trials, 0)))
+    slips = slip_distribution(slip_rate)
+    probability = pipeline_df["Probability (%)"].to_numpy(dtype=float) / 100
+    month_number = pipeline_df["Month"].dt.year.to_numpy() * 12 + pipeline_df["Month"].dt.month.to_numpy() - 1
+    first_month = int(month_number.min())
+    month_index = month_number - first_month
+    n_months = int(month_index.max()) + len(slips)
+    months = pd.date_range(
+        pd.Timestamp(year=first_month // 12, month=first_month % 12 + 1, day=1), periods=n_months, freq="MS"
+    )
+
+    # Closed deals are certain: count the won ones in every trial and drop the lost ones
+    values = pipeline_df["Estimated Value"].to_numpy(dtype=float)
+    certain = np.bincount(month_index[probability >= 1], values[probability >= 1], minlength=n_months)
+    open_deals = (probability > 0) & (probability < 1)
+    order = np.argsort(month_index[open_deals], kind="stable")
+    open_values = values[open_deals][order]
+    open_months = month_index[open_deals][order]
+    edges = np.searchsorted(open_months, np.arange(n_months - len(slips) + 2))
+    month_slices = list(zip(edges[:-1], edges[1:]))
+    thresholds = np.minimum(probability[open_deals][order] * _UNIFORM_LEVELS, _UNIFORM_LEVELS - 1)
+    cumulative = np.concatenate([[0], np.cumsum(slips)])
+    bounds = np.rint(np.outer(cumulative, thresholds)).astype(np.uint16)
+
+    chunk = max(1, CHUNK_ELEMENTS // max(1, open_values.size))
+    sizes = [min(chunk, trials - start) for start in range(0, trials, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=min(workers, len(sizes))) as executor:
+        parts = executor.map(
+            lambda args: _simulate_chunk(*args, bounds, open_values, month_slices, n_months),
+            zip(seeds, sizes),
+        )
+        revenue = np.concatenate(list(parts)) + certain
+    return PipelineForecast(months, revenue)
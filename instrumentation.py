@@ -0,0 +1,236 @@
+"""Opt-in timing of app reruns, exported as Prometheus text.
+
+    JLL_PROFILE=1 JLL_PROFILE_SAMPLE_RATE=0.05 JLL_METRICS_PORT=9464 streamlit run app.py
+
+With JLL_PROFILE unset every hook is a no-op.
+"""
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("JLL_PROFILE", "").lower() in ("1", "true", "yes")
+SAMPLE_RATE = float(os.environ.get("JLL_PROFILE_SAMPLE_RATE", "0"))  # share of reruns run under cProfile + tracemalloc
+METRICS_PATH = os.environ.get("JLL_METRICS_PATH", ".cache/metrics.prom")
+METRICS_PORT = os.environ.get("JLL_METRICS_PORT")
+
+# Histogram buckets (seconds), sampled reruns kept for the debug panel, and rows shown per sample
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SAMPLE_HISTORY = 5
+TOP_ENTRIES = 25
+
+# Session-state keys holding the rerun in progress and the last finished one
+ACTIVE_KEY = "_instrumentation_active"
+LAST_KEY = "_instrumentation_last"
+
+_local = threading.local()
+_sampling = threading.Lock()  # cProfile and tracemalloc sample one rerun at a time
+_disabled = nullcontext()
+
+
+# Process-wide counters and histograms, rendered in the Prometheus text format
+class MetricsRegistry:
+    def __init__(self):
+        self._histograms = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self.samples = deque(maxlen=SAMPLE_HISTORY)
+
+    def observe(self, name, labels, seconds):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            counts, total = self._histograms.get(key, ([0] * len(BUCKETS), 0.0))
+            counts = [count + (seconds <= bound) for count, bound in zip(counts, BUCKETS)]
+            self._histograms[key] = (counts, total + seconds)
+            self._increment(name + "_count", key[1])
+
+    def increment(self, name, labels):
+        with self._lock:
+            self._increment(name, tuple(sorted(labels.items())))
+
+    def _increment(self, name, labels):
+        self._counters[(name, labels)] = self._counters.get((name, labels), 0) + 1
+
+    def render(self):
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = dict(self._counters)
+        lines = []
+        previous = None
+        for (name, labels), (counts, total) in histograms:
+            if name != previous:
+                lines.append(f"# TYPE {name} histogram")
+                previous = name
+            for bound, count in zip(BUCKETS, counts):
+                lines.append(f"{name}_bucket{_labels(labels + (('le', bound),))} {count}")
+            count = counters[(name + "_count", labels)]
+            lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {count}")
+            lines.append(f"{name}_sum{_labels(labels)} {total:.6f}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+        for (name, labels), value in sorted(counters.items()):
+            if name.endswith("_count"):
+                continue
+            if name != previous:
+                lines.append(f"# TYPE {name} counter")
+                previous = name
+            lines.append(f"{name}{_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    # Function to write the metrics file atomically, so scrapers never read a partial file
+    def write(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "w") as f:
+            f.write(self.render())
+        os.replace(temporary, path)
+
+
+def _labels(labels):
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}" if labels else ""
+
+
+REGISTRY = MetricsRegistry()
+
+
+# Timings of one rerun, section by section; sampled reruns also carry cProfile/tracemalloc output
+class RerunProfile:
+    def __init__(self, sampled):
+        self.page = None
+        self.sections = {}
+        self.sampled = sampled
+        self.finished = False
+        self.total_ms = None
+        self.profile_text = None
+        self.memory_text = None
+        self._profiler = cProfile.Profile() if sampled else None
+        self._tracing = False
+        if sampled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+                self._tracing = True
+            self._profiler.enable()
+        self.started = time.perf_counter()
+
+    def add(self, name, seconds):
+        self.sections[name] = self.sections.get(name, 0.0) + seconds * 1000
+
+    # Function to stop sampling and keep the top cumulative-time functions and allocation sites
+    def _stop_sampling(self):
+        self._profiler.disable()
+        stream = io.StringIO()
+        pstats.Stats(self._profiler, stream=stream).sort_stats("cumulative").print_stats(TOP_ENTRIES)
+        self.profile_text = stream.getvalue()
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics("lineno")[:TOP_ENTRIES]
+            self.memory_text = "\n".join(
+                [f"traced {current / 2**20:.1f} MiB, peak {peak / 2**20:.1f} MiB"] + [str(stat) for stat in top]
+            )
+            if self._tracing:
+                tracemalloc.stop()
+
+
+# Function to time a block of the current rerun (or of a background job) under `name`
+@contextmanager
+def _timed(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        profile = getattr(_local, "profile", None)
+        page = profile.page if profile is not None and profile.page else "background"
+        REGISTRY.observe("jll_section_seconds", {"page": page, "section": name}, seconds)
+        if profile is not None:
+            profile.add(name, seconds)
+
+
+def section(name):
+    return _timed(name) if ENABLED else _disabled
+
+
+# Function to start timing a rerun; state is the session state, used to close a rerun
+# that was cut short (st.rerun, a widget change) before it reached finish_rerun
+def begin_rerun(state):
+    if not ENABLED:
+        return None
+    previous = state.get(ACTIVE_KEY)
+    if previous is not None and not previous.finished:
+        _finish(previous, "interrupted")
+    sampled = SAMPLE_RATE > 0 and random.random() < SAMPLE_RATE and _sampling.acquire(blocking=False)
+    profile = RerunProfile(sampled)
+    _local.profile = profile
+    state[ACTIVE_KEY] = profile
+    return profile
+
+
+def set_page(profile, page):
+    if profile is not None:
+        profile.page = page
+
+
+# Function to close a rerun: record its metrics and refresh the metrics file. outcome is
+# "completed", or e.g. "failed" when the page raised before its end
+def finish_rerun(state, profile, outcome="completed"):
+    if profile is None or profile.finished:
+        return
+    _finish(profile, outcome)
+    if outcome == "completed":
+        state[LAST_KEY] = profile
+    REGISTRY.write(METRICS_PATH)
+
+
+def _finish(profile, outcome):
+    profile.finished = True
+    profile.total_ms = (time.perf_counter() - profile.started) * 1000
+    if getattr(_local, "profile", None) is profile:
+        _local.profile = None
+    if profile.sampled:
+        try:
+            profile._stop_sampling()
+        finally:
+            _sampling.release()
+        REGISTRY.samples.append(profile)
+    page = profile.page or "unknown"
+    REGISTRY.increment("jll_reruns_total", {"page": page, "outcome": outcome})
+    if outcome == "completed":
+        REGISTRY.observe("jll_rerun_seconds", {"page": page}, profile.total_ms / 1000)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+# Function to serve the metrics over HTTP on JLL_METRICS_PORT (once per process)
+def serve_metrics():
+    global _server
+    if not ENABLED or not METRICS_PORT:
+        return None
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer(("0.0.0.0", int(METRICS_PORT)), _MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+
+import streamlit as st
+
+from descriptions import session_description_jobs
+from instrumentation import REGISTRY, begin_rerun, finish_rerun, section, serve_metrics, set_page
+
+# st.experimental_rerun was renamed to st.rerun in later Streamlit releases
+rerun = getattr(st, "rerun", None) or st.experimental_rerun
+
+
+# Function to start a page: begin its rerun timings (JLL_PROFILE=1, see instrumentation.py)
+# and draw the sidebar shared by every page, below Streamlit's page navigation
+def start_page(page):
+    rerun_profile = begin_rerun(st.session_state)
+    set_page(rerun_profile, page)
+    serve_metrics()
+
+    with section("sidebar"), st.sidebar:
+        st.image("jll_logo.png", use_column_width=True)
+        st.markdown("---")
+        st.markdown("**Client Overview**")
+        st.caption("Contracts, Change Requests, Current Products")
+        st.markdown("**Cost Estimator**")
+        st.caption("Simulate Project Implementation & Ongoing Costs")
+        st.markdown("**Sales Pipeline**")
+        st.caption("Opportunities & Sales Activities Overview")
+        st.markdown("---")
+        if st.button("Reload Data"):
+            from data_access import clear_data_cache
+            clear_data_cache()
+        running_jobs = sum(not job.finished for job in session_description_jobs())
+        if running_jobs:
+            st.caption(f"{running_jobs} solution description(s) generating")
+    return rerun_profile
+
+
+# Function to finish a page: close its rerun timings and, when profiling, show the debug
+# panel with this rerun's section timings, process-wide totals and the latest sampled
+# cProfile/tracemalloc output
+def end_page(rerun_profile):
+    finish_rerun(st.session_state, rerun_profile)
+    if rerun_profile is None:
+        return
+    import pandas as pd
+    with st.expander("Performance Debug"):
+        st.caption(f"{rerun_profile.page} rerun: {rerun_profile.total_ms:,.1f} ms")
+        st.table(pd.DataFrame(
+            {"Time (ms)": [f"{ms:,.1f}" for ms in rerun_profile.sections.values()]},
+            index=list(rerun_profile.sections),
+        ))
+        st.code(REGISTRY.render(), language="text")
+        if REGISTRY.samples:
+            latest_sample = REGISTRY.samples[-1]
+            st.markdown(f"**Latest sampled rerun** ({latest_sample.page}, {latest_sample.total_ms:,.1f} ms)")
+            st.code(latest_sample.profile_text, language="text")
+            st.code(latest_sample.memory_text or "tracemalloc unavailable", language="text")
+
+
+# Context manager around a page's body: starts the page and always closes its rerun, also
+# when the body raises, calls st.stop() or triggers a rerun, so a sampled rerun never leaves
+# the process-wide profiler (and tracemalloc) running
+@contextmanager
+def page(name):
+    rerun_profile = start_page(name)
+    try:
+        yield rerun_profile
+    except Exception:
+        finish_rerun(st.session_state, rerun_profile, "failed")
+        raise
+    except BaseException:
+        # st.stop() and st.rerun() end the script with control-flow exceptions
+        finish_rerun(st.session_state, rerun_profile, "interrupted")
+        raise
+    end_page(rerun_profile)
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from shared_cache import MISSING
+
+# Limits for the response cache, and its namespace in the shared cache
+NAMESPACE = "llm"
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+# Function to normalize project parameters so equivalent selections hash identically
+def normalize_params(project_params):
+    normalized = {}
+    for key, value in project_params.items():
+        if isinstance(value, (list, tuple, set)):
+            value = sorted(value)
+        normalized[key] = value
+    return normalized
+
+
+# Function to build a content-addressed key for a completion request
+def make_cache_key(project_params, model, temperature, prompt_template):
+    payload = json.dumps(
+        {
+            "params": normalize_params(project_params),
+            "model": model,
+            "temperature": temperature,
+            "template": prompt_template,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Two-tier (in-process LRU + node-wide SharedCache) cache for generated descriptions
+class ResponseCache:
+    def __init__(self, store=None, max_entries=DEFAULT_MAX_ENTRIES, ttl_seconds=DEFAULT_TTL_SECONDS):
+        self.store = store
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expired(self, created_at, now):
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, key, value, created_at):
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._memory[key]
+
+        # Entries written by any process on this node (expiry is enforced by the store). They
+        # are remembered with their original creation time, so they expire here when they
+        # expire in the store rather than getting a new lifetime.
+        if self.store is not None:
+            entry = self.store.get_entry(NAMESPACE, key)
+            if entry is not MISSING:
+                value, created_at = entry
+                with self._lock:
+                    self._remember(key, value, created_at)
+                    self.hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._remember(key, value, time.time())
+        if self.store is not None:
+            self.store.set(NAMESPACE, key, value, self.ttl_seconds)
+
+    # Function to take the node-wide lease on a key before calling the API, so other
+    # processes wait for this one's response (returns an owner token, or None if taken)
+    def try_lease(self, key, lease_seconds=None):
+        return self.store.try_lease(NAMESPACE, key, lease_seconds) if self.store is not None else "local"
+
+    def release_lease(self, key, owner):
+        if self.store is not None:
+            self.store.release_lease(NAMESPACE, key, owner)
+
+    # Function to wait for the response another process holds the lease for (None if it gave up)
+    def wait(self, key, timeout=None):
+        if self.store is None:
+            return None
+        value = self.store.wait(NAMESPACE, key, timeout)
+        if value is MISSING:
+            return None
+        with self._lock:
+            self._remember(key, value, time.time())
+        return value
+
+    def purge_expired(self):
+        if self.ttl_seconds is None:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            for key in [k for k, (_, created_at) in self._memory.items() if created_at < cutoff]:
+                del self._memory[key]
+        return self.store.purge_expired() if self.store is not None else 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "memory_entries": len(self._memory),
+            }
@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+import openai
+import openai.error
+
+# Upstream errors worth retrying; anything else (bad request, auth) fails immediately
+RETRYABLE_ERRORS = (
+    openai.error.RateLimitError,
+    openai.error.APIError,
+    openai.error.APIConnectionError,
+    openai.error.ServiceUnavailableError,
+    openai.error.Timeout,
+    openai.error.TryAgain,
+)
+
+
+# Raised when no upstream slot frees up within the gateway's queue timeout
+class GatewayBusyError(RuntimeError):
+    pass
+
+
+# Token-bucket rate limiter: `rate` requests per second with bursts up to `capacity`
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    # Function to take one token, waiting up to `timeout` seconds; returns False on timeout
+    def acquire(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+# Process-wide gateway in front of the OpenAI API: single-flight coalescing of
+# identical requests, a bounded number of concurrent upstream calls, token-bucket
+# rate limiting and jittered exponential-backoff retries with per-request timeouts.
+class LLMGateway:
+    def __init__(
+        self,
+        max_concurrency=4,
+        requests_per_second=2.0,
+        burst=4,
+        max_retries=4,
+        base_delay=0.5,
+        max_delay=8.0,
+        request_timeout=30,
+        queue_timeout=60,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.request_timeout = request_timeout
+        self.queue_timeout = queue_timeout
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._bucket = TokenBucket(requests_per_second, burst)
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "coalesced": 0, "upstream_calls": 0, "retries": 0, "failures": 0}
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._inflight))
+
+    # Context manager holding one upstream slot: a concurrency permit plus a rate-limit token
+    @contextmanager
+    def slot(self):
+        started = time.monotonic()
+        if not self._semaphore.acquire(timeout=self.queue_timeout):
+            raise GatewayBusyError("Timed out waiting for a free LLM request slot")
+        try:
+            remaining = max(0.0, self.queue_timeout - (time.monotonic() - started))
+            if not self._bucket.acquire(timeout=remaining):
+                raise GatewayBusyError("Timed out waiting for the LLM rate limit")
+            self._count("upstream_calls")
+            yield
+        finally:
+            self._semaphore.release()
+
+    # Function to compute the full-jitter backoff delay before retry number `attempt`
+    def backoff_delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    # Function to run func() in an upstream slot, retrying transient upstream errors
+    def run(self, func):
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.slot():
+                    return func()
+            except RETRYABLE_ERRORS:
+                if attempt == self.max_retries:
+                    raise
+                self._count("retries")
+                time.sleep(self.backoff_delay(attempt))
+
+    # Function to claim a key: returns (future, True) for the caller that must do the work,
+    # or (future, False) when an identical request is already in flight
+    def claim(self, key):
+        with self._lock:
+            self._stats["requests"] += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    # Function to publish the leader's result (or error) to every waiting caller
+    def resolve(self, key, future, result=None, error=None):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if error is not None:
+                self._stats["failures"] += 1
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    # Function to run func() once per key: concurrent callers with the same key
+    # wait for and share the leader's result (or exception)
+    def call(self, key, func):
+        future, leader = self.claim(key)
+        if not leader:
+            return future.result()
+        try:
+            result = self.run(func)
+        except BaseException as e:
+            self.resolve(key, future, error=e)
+            raise
+        self.resolve(key, future, result=result)
+        return result
@@ -0,0 +1,96 @@
+import itertools
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+# One background job; the worker appends streamed chunks so pages can show partial output
+class Job:
+    def __init__(self, job_id, label, metadata):
+        self.id = job_id
+        self.label = label
+        self.metadata = metadata
+        self.status = PENDING
+        self.chunks = []
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+
+    def append(self, chunk):
+        self.chunks.append(chunk)
+
+    @property
+    def text(self):
+        return self.result if self.result is not None else "".join(self.chunks)
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+
+# Thread pool that runs jobs in the background and keeps their state for polling
+class JobQueue:
+    def __init__(self, max_workers=4, max_finished_jobs=500):
+        self.max_finished_jobs = max_finished_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-job")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    # Function to queue func(job) and return the new job's id
+    def submit(self, func, label=None, **metadata):
+        job_id = uuid.uuid4().hex
+        job = Job(job_id, label or f"Job {next(self._sequence)}", metadata)
+        with self._lock:
+            self._jobs[job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job, func)
+        return job_id
+
+    def _run(self, job, func):
+        if job.cancel_event.is_set():
+            job.status = CANCELLED
+            job.finished_at = time.time()
+            return
+        job.status = RUNNING
+        try:
+            result = func(job)
+        except Exception as e:
+            job.error = e
+            job.status = CANCELLED if job.cancel_event.is_set() else FAILED
+        else:
+            job.result = result
+            job.status = CANCELLED if job.cancel_event.is_set() else DONE
+        job.finished_at = time.time()
+
+    # Function to drop the oldest finished jobs beyond the retention limit
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel_event.set()
+
+    def forget(self, job_id):
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is not None:
+            job.cancel_event.set()
@@ -0,0 +1,28 @@
+import openai
+
+
+# Function to stream a chat completion as an incremental generator of text chunks.
+# Stops early (without raising) once cancel_event is set.
+def stream_chat_completion(messages, model, max_tokens, temperature, cancel_event=None, request_timeout=None):
+    response = openai.ChatCompletion.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        stream=True,
+        request_timeout=request_timeout,
+    )
+    try:
+        for chunk in response:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            choices = chunk.get("choices") or []
+            if not choices:
+                continue
+            content = choices[0].get("delta", {}).get("content")
+            if content:
+                yield content
+    finally:
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()
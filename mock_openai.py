@@ -0,0 +1,159 @@
+"""Local stand-in for the OpenAI chat completions endpoint.
+
+Run it and point the app at it, no network or API key required:
+
+    python mock_openai.py --port 8001 --token-delay 0.05
+    OPENAI_API_BASE=http://127.0.0.1:8001/v1 streamlit run app.py
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_REPLY = (
+    "The solution ingests the selected sources through a managed ETL layer into the "
+    "chosen data warehouse, applies the required transformations and exposes curated "
+    "models to the BI dashboard, with monitoring, security and support matched to the "
+    "project parameters."
+)
+
+
+# Function to split a reply into word-sized tokens, keeping the separating spaces
+def split_tokens(text):
+    words = text.split(" ")
+    return [word if i == 0 else " " + word for i, word in enumerate(words)]
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if not self.path.endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+            failing = server.request_count <= server.fail_first or server.random.random() < server.failure_rate
+            server.active += 1
+            server.peak_active = max(server.peak_active, server.active)
+        try:
+            self._respond(body, failing)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _respond(self, body, failing):
+        server = self.server
+        model = body.get("model", "mock")
+        if server.first_token_delay:
+            time.sleep(server.first_token_delay)
+
+        if failing:
+            self._send_json(
+                {"error": {"message": "Mock upstream failure", "type": "server_error", "code": None}},
+                status=server.failure_status,
+            )
+        elif body.get("stream"):
+            self._stream(model)
+        else:
+            time.sleep(server.token_delay * len(split_tokens(server.reply)))
+            self._send_json({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": server.reply},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            })
+
+    def _send_json(self, payload, status=200):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, model):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            for token in split_tokens(self.server.reply):
+                chunk = {
+                    "id": "chatcmpl-mock",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(self.server.token_delay)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client cancelled the stream
+            pass
+
+
+# Function to start the mock server on a background thread; returns (server, base_url).
+# fail_first / failure_rate make requests fail with failure_status (e.g. 429 or 503).
+def start_mock_server(
+    host="127.0.0.1", port=0, reply=DEFAULT_REPLY, token_delay=0.02, first_token_delay=0.0,
+    fail_first=0, failure_rate=0.0, failure_status=429, seed=0,
+):
+    server = ThreadingHTTPServer((host, port), MockOpenAIHandler)
+    server.daemon_threads = True
+    server.reply = reply
+    server.token_delay = token_delay
+    server.first_token_delay = first_token_delay
+    server.fail_first = fail_first
+    server.failure_rate = failure_rate
+    server.failure_status = failure_status
+    server.random = random.Random(seed)
+    server.lock = threading.Lock()
+    server.request_count = 0
+    server.active = 0
+    server.peak_active = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--token-delay", type=float, default=0.02)
+    parser.add_argument("--first-token-delay", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=429)
+    args = parser.parse_args()
+    server, base_url = start_mock_server(
+        args.host, args.port,
+        token_delay=args.token_delay,
+        first_token_delay=args.first_token_delay,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+    )
+    print(f"Mock OpenAI server listening on {base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,100 @@
+import streamlit as st
+
+from activity import solution_usage
+from charts import jll_figure
+from data_access import (
+    clients_source, load_client, load_client_activity, load_client_names, load_client_pipeline,
+)
+from instrumentation import section
+from layout import page
+
+with page("Client Overview"):
+    st.title("Client Relationship Overview")
+
+    # Client Filter Dropdown (the client data is looked up once per rerun)
+    clients = clients_source()
+    client_name = st.selectbox("Select a Client:", load_client_names(clients))
+
+    # Look up the selected client and its (deterministic) activity history
+    with section("data"):
+        client_data = load_client(client_name, clients)
+        client_activity = load_client_activity(client_name, clients)
+
+    # Display Tiles for Key Metrics
+    st.subheader(f"Overview for {client_name}")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Contract Start Date", client_data["Contract Start"].strftime("%Y-%m-%d"))
+        st.metric("Contract End Date", client_data["Contract End"].strftime("%Y-%m-%d"))
+        st.metric("CRs Last Year", client_data["CR Count"])
+
+    with col2:
+        st.metric("Solutions Used", client_data["Solutions Used"])
+        st.metric("Renewal Likelihood", client_data["Renewal Likelihood"])
+        st.metric("Current Status", client_data["Contract Status"])
+
+    with col3:
+        engagement_score = client_activity["Current Engagement"]
+        st.metric("Client Engagement Score", f"{engagement_score}%")
+        st.metric("Suggested Renewal Date", client_data["Suggested Renewal Date"].strftime("%Y-%m-%d"))
+        st.metric("Data Retention Plan", "5 Years")
+
+    # Descriptive Textual Insights
+    st.subheader("Client Insights")
+    st.write(
+        f"""
+        **{client_name}** is currently utilizing the following solutions: {', '.join(client_data['Solutions'])}.
+        Based on recent engagements, the client's renewal likelihood is marked as **{client_data['Renewal Likelihood']}**.
+        """
+    )
+    with section("data"):
+        client_pipeline = load_client_pipeline(client_name)
+    if len(client_pipeline):
+        st.write(
+            f"The pipeline holds **{int(client_pipeline['Opportunities'].sum())}** opportunities for this client "
+            f"with a weighted value of **${client_pipeline['Weighted Value'].sum():,.2f}**."
+        )
+    st.info("AI-driven insights suggest focusing on customization to increase engagement.")
+
+    # Graph Data
+    months = client_activity["Month"]
+    cr_counts = client_activity["CR Requests"]
+    solutions = list(client_data["Solutions"])
+    with section("data"):
+        usage = solution_usage(client_name, solutions)
+    renewal_likelihood = client_activity["Renewal Likelihood"]
+    engagement_scores = client_activity["Engagement Score"]
+
+    # Graphs (only the selected chart is built)
+    st.subheader("Client Engagement Over Time")
+    engagement_view = st.radio(
+        "Chart",
+        ["CR Requests", "Solution Usage", "Renewal Likelihood", "Engagement Score"],
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+
+    with section("figures"):
+        if engagement_view == "CR Requests":
+            fig = jll_figure(
+                "line", x=months, y=cr_counts, markers=True,
+                title="Monthly CR Requests", xaxis_title="Month", yaxis_title="CR Count",
+            )
+        elif engagement_view == "Solution Usage":
+            fig = jll_figure(
+                "bar", x=solutions, y=usage, color_by_value=True,
+                title="Solution Usage", xaxis_title="Solutions", yaxis_title="Usage Count",
+            )
+        elif engagement_view == "Renewal Likelihood":
+            fig = jll_figure(
+                "area", x=months, y=renewal_likelihood,
+                title="Renewal Likelihood Trend", xaxis_title="Month", yaxis_title="Likelihood (%)",
+            )
+        else:
+            fig = jll_figure(
+                "bar", x=months, y=engagement_scores, color_by_value=True,
+                title="Engagement Score Trend", xaxis_title="Month", yaxis_title="Engagement Score (%)",
+            )
+    with section("render"):
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,321 @@
+import streamlit as st
+import pandas as pd
+import time
+
+from batch_quotes import LIST_SEPARATOR, run_batch_job
+from charts import jll_figure, jll_tornado
+from data_access import ESTIMATOR_STATE_KEY, load_project_index, projects_source
+from descriptions import (
+    describe_configuration, get_job_queue, get_openai, get_response_cache, run_description_job,
+    session_description_jobs,
+)
+from estimator_graph import DependencyGraph, Node
+from instrumentation import section
+from layout import page, rerun
+from llm_jobs import DONE, FAILED, PENDING, JobQueue
+from pricing import (
+    COMPLEXITY_COST, COMPLIANCE_COST, DASHBOARD_OPTIONS, DATA_SOURCES, DATA_WAREHOUSES, DEFAULTS,
+    DEVICE_COUNTS, ETL_TYPES, IOT_SOLUTIONS, MONITORING_COST, NUMERIC_RANGES, PRICING_FIELDS,
+    PRICING_VERSION, REFRESH_FREQUENCIES, RETENTION_MULTIPLIER, SECURITY_COST, SENSITIVITY_AXES,
+    SOLUTION_TYPES, STORAGE_COST, SUPPORT_COST, TRAINING_COST, estimate_cost, pricing_inputs,
+    sensitivity, tornado,
+)
+from shared_cache import default_cache, make_key
+
+# Function to display section headers with styled background
+def section_header(title):
+    st.markdown(f"### {title}")
+    st.markdown("---")
+
+# Function to sweep every sensitivity input around a configuration (memoized per
+# configuration and pricing version in this process, and shared with the other processes
+# on the node, so results from older pricing code are never reused)
+@st.cache_data
+def compute_sensitivity(base_params, pricing_version):
+    return default_cache().get_or_compute(
+        "sensitivity", make_key(pricing_version, base_params), lambda: sensitivity(base_params),
+    )
+
+# Function to fetch the past projects most similar to the current configuration
+def fetch_similar_projects(project_params, k=3, source=None):
+    return load_project_index(source).query(project_params, k)
+
+# Function to recommend a project team for the configuration
+def recommend_team(project_params):
+    team = ["1 Project Manager", "1 Business Analyst"]
+    if project_params.get("ai_integration", False):
+        team.append("1 AI/ML Specialist")
+    if project_params.get("dashboard_required") != "None":
+        team.append("1 Front-end Developer")
+    if project_params.get("etl_type") == "Batch":
+        team.append("1 Backend Developer (Batch Processing)")
+    else:
+        team.append("1 Backend Developer (Streaming Processing)")
+    return team
+
+# Function to format the cost summary table
+def format_cost_summary(costs):
+    total_cost, monthly_opex, yearly_opex = costs
+    cost_summary_data = {
+        "Total Implementation Cost": f"${total_cost:,.2f}",
+        "Estimated Monthly OpEx": f"${monthly_opex:,.2f}",
+        "Estimated Yearly OpEx": f"${yearly_opex:,.2f}",
+    }
+    return pd.DataFrame.from_dict(cost_summary_data, orient='index', columns=['Cost'])
+
+# Derived values of the Cost Estimator. A widget change recomputes only the nodes
+# that (transitively) depend on it; everything else is reused from session state. The
+# pricing version and the project corpus's source version are graph inputs too, so new
+# pricing code or a new corpus also recomputes what was derived from the old one.
+ESTIMATOR_GRAPH = DependencyGraph([
+    Node("pricing_inputs", lambda params, pricing_version: pricing_inputs(params), params=PRICING_FIELDS,
+         context=["pricing_version"]),
+    Node("costs", lambda params, inputs: estimate_cost(inputs), params=(), depends_on=["pricing_inputs"]),
+    Node("cost_summary", lambda params, costs: format_cost_summary(costs), params=(), depends_on=["costs"]),
+    Node("sensitivity", lambda params, inputs, pricing_version: compute_sensitivity(inputs, pricing_version),
+         params=(), depends_on=["pricing_inputs"], context=["pricing_version"]),
+    Node("team", recommend_team, params=("ai_integration", "dashboard_required", "etl_type")),
+    Node("similar_projects", lambda params, projects_source: fetch_similar_projects(params, source=projects_source),
+         context=["projects_source"]),
+])
+ESTIMATOR_LOG_SIZE = 10
+
+JOB_POLL_SECONDS = 1.0
+DESCRIPTIONS_PER_ROW = 3
+BATCH_WORKERS = 2
+
+# Background worker pool for batch quotes, shared by every session. It is separate from the
+# description jobs' pool, so large books never hold up anyone's descriptions.
+@st.cache_resource
+def get_batch_queue():
+    return JobQueue(max_workers=BATCH_WORKERS)
+
+with page("Cost Estimator"):
+    get_openai()  # configure the API key here, before any background description job needs it
+
+    st.title("Project Cost Estimator")
+
+    # Define sections and organize parameters
+    section_header("Source Data Requirements")
+    project_params = {
+        "data_sources": st.multiselect("Select Data Sources:", DATA_SOURCES),
+        "etl_type": st.selectbox("Select Load Type:", ETL_TYPES),
+        "refresh_frequency": st.selectbox("Select Refresh Frequency:", REFRESH_FREQUENCIES),
+        "data_warehouse": st.selectbox("Select Data Warehouse:", DATA_WAREHOUSES),
+    }
+
+    section_header("Solution Requirements")
+    project_params.update({
+        "solution_type": st.selectbox("Select Solution Type:", SOLUTION_TYPES),
+        "dashboard_required": st.selectbox("BI Dashboard Required:", DASHBOARD_OPTIONS)
+    })
+
+    section_header("Additional Requirements")
+    project_params.update({
+        "transformation_complexity": st.selectbox("Data Transformation Complexity:", list(COMPLEXITY_COST)),
+        "compute_hours": st.number_input("Compute Hours per Month:", *NUMERIC_RANGES["compute_hours"], 50),
+        "storage_needs": st.selectbox("Storage Requirements:", list(STORAGE_COST)),
+        "data_retention": st.selectbox("Data Retention Policy:", list(RETENTION_MULTIPLIER)),
+        "users": st.slider("Number of Users:", *NUMERIC_RANGES["users"], 50),
+        "support": st.selectbox("Support Level:", list(SUPPORT_COST)),
+        "security_level": st.selectbox("Security Level:", list(SECURITY_COST)),
+        "data_compliance": st.selectbox("Data Compliance:", list(COMPLIANCE_COST)),
+        "monitoring": st.selectbox("Monitoring Level:", list(MONITORING_COST)),
+        "training_sessions": st.selectbox("Training Sessions:", list(TRAINING_COST)),
+        "data_encryption": st.checkbox("Enable Data Encryption"),
+        "ai_integration": st.checkbox("Include AI/ML Integration"),
+        "api_access": st.checkbox("API Access Required"),
+    })
+    st.markdown("---")
+
+    # Conditional fields based on IoT solution type
+    if project_params["solution_type"] == "IoT":
+        st.subheader("IoT Specific Requirements")
+        iot_params = {
+            "iot_solution": st.selectbox("Select IoT Solution:", IOT_SOLUTIONS),
+            "number_of_devices": st.selectbox("Number of Devices:", DEVICE_COUNTS),
+        }
+        project_params.update(iot_params)
+
+    # Recompute only the derived values downstream of the widgets that changed
+    with section("compute"):
+        estimator = ESTIMATOR_GRAPH.evaluate(
+            project_params, st.session_state.setdefault(ESTIMATOR_STATE_KEY, {}),
+            context={"pricing_version": PRICING_VERSION, "projects_source": projects_source()},
+        )
+
+    # Estimated Costs Calculation
+    st.subheader("Estimated Costs")
+    total_cost, monthly_opex, yearly_opex = estimator.values["costs"]
+
+    # Display Cost Summary
+    with section("render"):
+        st.table(estimator.values["cost_summary"])
+
+    # Sensitivity of the estimate to each input, swept around the current configuration
+    with st.expander("Sensitivity"):
+        sensitivity_labels = {
+            "compute_hours": "Compute Hours",
+            "users": "Users",
+            "storage_needs": "Storage Tier",
+            "data_retention": "Retention",
+            "support": "Support Level",
+            "security_level": "Security Level",
+        }
+        metric_labels = {
+            "total_cost": "Total Implementation Cost",
+            "monthly_opex": "Monthly OpEx",
+            "yearly_opex": "Yearly OpEx",
+        }
+        metric = st.selectbox("Metric:", list(metric_labels), format_func=metric_labels.get)
+        sweep_df = estimator.values["sensitivity"]
+        base_value = {"total_cost": total_cost, "monthly_opex": monthly_opex, "yearly_opex": yearly_opex}[metric]
+        with section("compute"):
+            swings = tornado(sweep_df, base_value, metric)
+            swings["label"] = swings["input"].map(sensitivity_labels)
+
+        with section("figures"):
+            fig_tornado = jll_tornado(
+                tuple(swings["label"]), tuple(swings["low"]), tuple(swings["high"]),
+                title=f"{metric_labels[metric]} Sensitivity",
+                xaxis_title="Change from Current Estimate ($)",
+            )
+        with section("render"):
+            st.plotly_chart(fig_tornado, use_container_width=True)
+
+        sweep_input = st.selectbox("Partial Dependence for:", list(SENSITIVITY_AXES), format_func=sensitivity_labels.get)
+        curve = sweep_df[sweep_df["input"] == sweep_input]
+        with section("figures"):
+            fig_dependence = jll_figure(
+                "line" if pd.api.types.is_numeric_dtype(curve["value"].infer_objects()) else "bar",
+                curve, x="value", y=metric,
+                title=f"{metric_labels[metric]} by {sensitivity_labels[sweep_input]}",
+                xaxis_title=sensitivity_labels[sweep_input],
+                yaxis_title=f"{metric_labels[metric]} ($)",
+            )
+        with section("render"):
+            st.plotly_chart(fig_dependence, use_container_width=True)
+
+    # Display Recommended Project Team
+    st.subheader("Recommended Project Team")
+    for member in estimator.values["team"]:
+        st.write(f"- {member}")
+
+    # Display Similar Projects
+    st.subheader("Similar Projects for Reference")
+    similar_projects = estimator.values["similar_projects"]
+    if similar_projects:
+        for project in similar_projects:
+            st.write(f"**{project['name']}**: [View Details]({project['link']})")
+
+    # Which derived values each recent interaction recomputed
+    estimator_log = st.session_state.setdefault("estimator_log", [])
+    estimator_log.append(estimator.recomputed)
+    del estimator_log[:-ESTIMATOR_LOG_SIZE]
+    with st.expander("Recomputation Log"):
+        st.table(pd.DataFrame(
+            [
+                {
+                    "Recomputed": ", ".join(name for name, _ in recomputed) or "(nothing)",
+                    "Nodes": f"{len(recomputed)} / {len(ESTIMATOR_GRAPH.nodes)}",
+                    "Time (ms)": f"{sum(ms for _, ms in recomputed):.1f}",
+                }
+                for recomputed in reversed(estimator_log)
+            ],
+        ))
+
+    # Generate Solution Description in the background; each click adds a candidate
+    # so several architectures can be generated in parallel and compared
+    job_queue = get_job_queue()
+    if st.button("Generate Solution Description"):
+        st.session_state.setdefault("description_jobs", []).append(job_queue.submit(
+            run_description_job,
+            label=describe_configuration(project_params),
+            project_params=dict(project_params),
+            total_cost=total_cost,
+        ))
+
+    jobs = session_description_jobs()
+    if jobs:
+        st.subheader("High-Level Solution Description" if len(jobs) == 1 else "Candidate Solution Descriptions")
+        for row_start in range(0, len(jobs), DESCRIPTIONS_PER_ROW):
+            row_jobs = jobs[row_start:row_start + DESCRIPTIONS_PER_ROW]
+            for column, job in zip(st.columns(len(row_jobs)), row_jobs):
+                with column:
+                    st.markdown(f"**{job.label}**")
+                    st.caption(f"Implementation cost ${job.metadata['total_cost']:,.2f}")
+                    if job.status == DONE:
+                        st.write(job.text)
+                    elif job.status == FAILED:
+                        st.error(f"An error occurred while generating the description: {str(job.error)}")
+                    elif job.finished:
+                        st.warning("Cancelled")
+                    else:
+                        st.markdown((job.text + "▌") if job.chunks else "_Generating description..._")
+                        if st.button("Cancel", key=f"cancel_{job.id}"):
+                            job_queue.cancel(job.id)
+                    if job.finished and st.button("Remove", key=f"remove_{job.id}"):
+                        job_queue.forget(job.id)
+                        st.session_state["description_jobs"].remove(job.id)
+                        rerun()
+        cache_stats = get_response_cache().stats()
+        st.caption(f"Response cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
+    # Price a whole book of configurations (e.g. an RFP) from an uploaded CSV or Parquet file,
+    # in the background so the page stays responsive while a large book is priced
+    with st.expander("Batch Quotes"):
+        st.caption(
+            "One configuration per row, with columns named like the estimator's fields "
+            f"(data_sources separated by \"{LIST_SEPARATOR}\" in CSV). Missing columns and blank cells "
+            "do not take the values set above but fixed batch defaults: the first option of each field, "
+            f"{DEFAULTS['compute_hours']} compute hours, {DEFAULTS['users']} user, no data sources and "
+            "every feature off."
+        )
+        uploaded_book = st.file_uploader("Configurations", type=["csv", "parquet"])
+        batch_col1, batch_col2 = st.columns(2)
+        with batch_col1:
+            batch_format = st.selectbox("Output Format", ["CSV", "Parquet"])
+        with batch_col2:
+            batch_describe = st.checkbox("Generate Descriptions", help="One solution description per valid row (cached)")
+        batch_queue = get_batch_queue()
+        if uploaded_book is not None and st.button("Price Batch"):
+            if "batch_job" in st.session_state:
+                batch_queue.cancel(st.session_state["batch_job"])
+                batch_queue.forget(st.session_state["batch_job"])
+            # The job reads the uploaded file object itself, chunk by chunk, rather than a copy of its bytes
+            st.session_state["batch_job"] = batch_queue.submit(
+                run_batch_job,
+                label=f"Batch quotes: {uploaded_book.name}",
+                source=uploaded_book,
+                name=uploaded_book.name,
+                output_format=batch_format.lower(),
+                describe=batch_describe,
+                rows=0,
+            )
+
+        batch_job = batch_queue.get(st.session_state["batch_job"]) if "batch_job" in st.session_state else None
+        if batch_job is not None:
+            if batch_job.status == DONE:
+                batch_name, batch_data, batch_summary = batch_job.result
+                st.write(
+                    f"Priced **{batch_summary['rows']:,}** configurations in {batch_summary['seconds']:.1f} s"
+                    f" ({batch_summary['invalid']:,} with errors"
+                    + (f", {batch_summary['described']:,} described" if batch_summary["described"] else "") + ")."
+                )
+                st.download_button("Download Quotes", batch_data, file_name=batch_name)
+            elif batch_job.status == FAILED:
+                st.error(f"An error occurred while pricing the batch: {str(batch_job.error)}")
+            elif batch_job.finished:
+                st.warning("Cancelled")
+            else:
+                st.caption(
+                    "Waiting for a free worker..." if batch_job.status == PENDING
+                    else f"{batch_job.metadata['rows']:,} configurations priced..."
+                )
+                if st.button("Cancel", key="cancel_batch"):
+                    batch_queue.cancel(batch_job.id)
+
+# Poll running description and batch jobs so their output appears without user interaction
+if any(not job.finished for job in session_description_jobs()) or (batch_job is not None and not batch_job.finished):
+    time.sleep(JOB_POLL_SECONDS)
+    rerun()
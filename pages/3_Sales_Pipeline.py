@@ -0,0 +1,136 @@
+import streamlit as st
+
+from charts import jll_colors, jll_fan_chart, jll_figure
+from data_access import load_pipeline_forecast, load_pipeline_page, load_pipeline_summary, pipeline_source
+from instrumentation import section
+from layout import page
+
+# Row counts offered for each page of the Detailed Pipeline table
+PIPELINE_PAGE_SIZES = [25, 50, 100, 250]
+
+# Trial counts offered for the simulated revenue forecast
+FORECAST_TRIAL_OPTIONS = [10_000, 50_000, 100_000]
+
+with page("Sales Pipeline"):
+    st.title("Sales Pipeline Overview")
+
+    with section("data"):
+        pipeline = pipeline_source()  # one look at the source per rerun, shared by every accessor
+        pipeline_summary = load_pipeline_summary(pipeline)
+        pipeline_rows = pipeline_summary["rows"]
+
+    # Display Pipeline Overview
+    st.subheader("Pipeline Summary")
+
+    # Precomputed total estimated value and weighted value
+    total_estimated_value = pipeline_summary["total_estimated_value"]
+    total_weighted_value = pipeline_summary["total_weighted_value"]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Total Estimated Value", f"${total_estimated_value:,.2f}")
+    with col2:
+        st.metric("Total Weighted Value", f"${total_weighted_value:,.2f}")
+
+    # Display Pipeline Table (one page at a time, formatted per page)
+    st.subheader("Detailed Pipeline")
+    page_col, size_col = st.columns([3, 1])
+    with size_col:
+        page_size = st.selectbox("Rows per page", PIPELINE_PAGE_SIZES, index=1)
+    page_count = max(1, -(-pipeline_rows // page_size))
+    with page_col:
+        page_number = st.number_input(f"Page (of {page_count:,})", min_value=1, max_value=page_count, value=1, step=1)
+    page_start = (page_number - 1) * page_size
+    page_end = min(page_start + page_size, pipeline_rows)
+    with section("data"):
+        pipeline_page = load_pipeline_page(page_number, page_size, pipeline)
+    with section("render"):
+        st.dataframe(pipeline_page, use_container_width=True)
+    st.caption(f"Rows {page_start + 1:,}-{page_end:,} of {pipeline_rows:,}")
+
+
+    # Visualize Pipeline Stages
+    st.subheader("Pipeline by Stage")
+    stage_summary = pipeline_summary["stage_summary"]
+
+    # Define color mapping for stages using JLL colors
+    stage_colors = {
+        "Prospecting": jll_colors["grey"],
+        "Proposal": jll_colors["black"],
+        "Negotiation": jll_colors["grey"],
+        "Closed Won": jll_colors["red"],
+        "Closed Lost": jll_colors["black"]
+    }
+
+    with section("figures"):
+        fig_stage = jll_figure(
+            "bar", stage_summary, x="Stage", y="Estimated Value",
+            color="Stage", color_discrete_map=stage_colors,
+            title="Estimated Value by Stage", xaxis_title="Stage", yaxis_title="Estimated Value ($)",
+            layout=dict(showlegend=False),
+        )
+    with section("render"):
+        st.plotly_chart(fig_stage, use_container_width=True)
+
+    # Forecasted Revenue Over Time
+    st.subheader("Forecasted Revenue Over Time")
+    monthly_forecast = pipeline_summary["monthly_forecast"]
+
+    with section("figures"):
+        fig_forecast = jll_figure(
+            "bar", monthly_forecast, x="Month", y="Weighted Value",
+            title="Monthly Forecasted Revenue", xaxis_title="Month", yaxis_title="Weighted Value ($)",
+            layout=dict(xaxis_tickformat="%b %Y"),
+        )
+    with section("render"):
+        st.plotly_chart(fig_forecast, use_container_width=True)
+
+    # Simulated revenue range: every open opportunity is won or lost at its stated probability
+    st.subheader("Simulated Revenue Range")
+    sim_col1, sim_col2, sim_col3 = st.columns(3)
+    with sim_col1:
+        forecast_trials = st.selectbox("Simulation Trials", FORECAST_TRIAL_OPTIONS, format_func="{:,}".format)
+    with sim_col2:
+        slip_rate = st.slider(
+            "Close-Date Slippage (%)", 0, 50, 0, step=5,
+            help="Chance that a won deal closes a month later than expected (compounding, up to 3 months)",
+        ) / 100
+    with sim_col3:
+        quota = st.number_input("Revenue Quota ($)", min_value=0.0, value=float(round(total_weighted_value, -3)), step=10000.0)
+
+    with st.spinner("Simulating pipeline outcomes..."), section("compute"):
+        forecast = load_pipeline_forecast(forecast_trials, slip_rate, pipeline)
+    total_bands = forecast.total_bands()
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Chance of Hitting Quota", f"{forecast.quota_probability(quota):.0%}")
+    with col2:
+        st.metric("P10 Revenue", f"${total_bands['P10']:,.0f}")
+    with col3:
+        st.metric("P50 Revenue", f"${total_bands['P50']:,.0f}")
+    with col4:
+        st.metric("P90 Revenue", f"${total_bands['P90']:,.0f}")
+
+    with section("figures"):
+        forecast_bands = forecast.bands()
+        weighted_by_month = monthly_forecast.set_index("Month")["Weighted Value"].reindex(forecast_bands["Month"], fill_value=0)
+        fig_fan = jll_fan_chart(
+            forecast_bands,
+            title="Simulated Monthly Revenue (P10-P90)", xaxis_title="Month", yaxis_title="Revenue ($)",
+            reference=("Weighted Value", tuple(weighted_by_month)),
+        )
+    with section("render"):
+        st.plotly_chart(fig_fan, use_container_width=True)
+
+    # Top Opportunities
+    st.subheader("Top Opportunities")
+    top_opportunities = pipeline_summary["top_opportunities"]
+    with section("render"):
+        st.table(top_opportunities[[
+            "Client Name", "Stage", "Estimated Value", "Probability (%)", "Expected Close Date"
+        ]].style.format({
+            "Estimated Value": "${:,.2f}",
+            "Probability (%)": "{:.0f}%",
+            "Expected Close Date": "{:%Y-%m-%d}"
+        }))
@@ -0,0 +1,105 @@
+import threading
+
+import pandas as pd
+
+# Dimensions and measures of the pipeline cube: one row per (client, stage, close month)
+CUBE_KEYS = ["Client Name", "Stage", "Month"]
+MEASURES = ["Estimated Value", "Weighted Value"]
+ROLLUP_VERSION = 2  # bump when the summary's contents change (keys cached summaries)
+
+
+# Function to aggregate pipeline rows into cube cells with summed measures and a row count
+def aggregate(frame, keys):
+    grouped = frame.groupby(keys, observed=True, sort=False)
+    cells = grouped[MEASURES].sum()
+    cells["Opportunities"] = grouped.size()
+    return cells
+
+
+# Pre-aggregated pipeline rollups, maintained incrementally as rows are appended.
+# The stage x month rollup behind the page's charts and totals is updated eagerly;
+# the full client x stage x month cube keeps its per-batch partials and is compacted
+# on the first client lookup after a change. Hold `lock` while checking `sources`
+# and adding, so concurrent sessions never fold the same batch in twice.
+class PipelineRollup:
+    def __init__(self, top_n=5):
+        self.top_n = top_n
+        self.lock = threading.RLock()
+        self.reset()
+
+    # Function to drop all rows so the rollup can be rebuilt from scratch
+    def reset(self):
+        with self.lock:
+            self.sources = set()
+            self.rows = 0
+            self._stage_month = None
+            self._top = None
+            self._cube = None
+            self._cube_parts = []
+            self._summary = None
+
+    # Function to fold a batch of pipeline rows (with "Weighted Value" and "Month") into the rollups.
+    # sources names what the batch was read from (e.g. Parquet part files).
+    def add(self, frame, sources=()):
+        with self.lock:
+            self.sources.update(sources)
+            if frame.empty:
+                return
+            cells = aggregate(frame, CUBE_KEYS)
+            stage_month = aggregate(frame, ["Stage", "Month"])
+            if self._stage_month is not None:
+                stage_month = stage_month.add(self._stage_month, fill_value=0).astype(stage_month.dtypes)
+            top = frame.nlargest(self.top_n, "Weighted Value")
+            if self._top is not None:
+                top = pd.concat([self._top, top]).nlargest(self.top_n, "Weighted Value")
+            self._stage_month = stage_month
+            self._top = top
+            self._cube_parts.append(cells)
+            self.rows += len(frame)
+            self._summary = None
+
+    # Function to get the page-level totals, stage/month rollups and top opportunities
+    def summary(self):
+        with self.lock:
+            if self._summary is None:
+                self._summary = self._build_summary()
+            return self._summary
+
+    def _build_summary(self):
+        stage_month = self._stage_month
+        if stage_month is None:
+            stage_month = pd.DataFrame(
+                {measure: [] for measure in MEASURES + ["Opportunities"]},
+                index=pd.MultiIndex.from_arrays([[], []], names=["Stage", "Month"]),
+            )
+        by_stage = stage_month.groupby(level="Stage", sort=True)[MEASURES].sum()
+        by_month = stage_month.groupby(level="Month", sort=True)[MEASURES].sum()
+        return {
+            "rows": self.rows,
+            "total_estimated_value": stage_month["Estimated Value"].sum(),
+            "total_weighted_value": stage_month["Weighted Value"].sum(),
+            "stage_summary": by_stage[["Estimated Value"]].reset_index(),
+            "monthly_forecast": by_month[["Weighted Value"]].reset_index(),
+            "top_opportunities": self._top if self._top is not None else pd.DataFrame(),
+        }
+
+    # Function to get the full cube, indexed and sorted by (client, stage, month)
+    def cube(self):
+        with self.lock:
+            if self._cube_parts:
+                parts = self._cube_parts if self._cube is None else [self._cube] + self._cube_parts
+                cube = pd.concat(parts) if len(parts) > 1 else parts[0]
+                if len(parts) > 1:
+                    cube = cube.groupby(level=CUBE_KEYS, observed=True).sum()
+                self._cube = cube.sort_index()
+                self._cube_parts = []
+            return self._cube
+
+    # Function to get one client's pipeline rolled up by stage (empty if the client has none)
+    def client_summary(self, client_name):
+        cube = self.cube()
+        try:
+            cells = cube.loc[client_name]
+        except (KeyError, AttributeError):
+            return pd.DataFrame(columns=MEASURES + ["Opportunities"])
+        return cells.groupby(level="Stage").sum()
@@ -0,0 +1,203 @@
+import hashlib
+import itertools
+import json
+
+import numpy as np
+import pandas as pd
+
+# Pricing tables for the Cost Estimator. Widget options are taken from these
+# keys, so the UI and the engine always agree on the allowed values.
+BASE_COST = 5000
+DATA_SOURCE_COST = 500
+COMPUTE_HOUR_COST = 100
+USER_COST = 10
+
+COMPLEXITY_COST = {"Simple": 1000, "Moderate": 2000, "Complex": 3000}
+STORAGE_COST = {"10 GB": 10, "100 GB": 100, "1 TB": 1000, "10 TB": 10000}
+RETENTION_MULTIPLIER = {"3 Months": 1, "1 Year": 1.5, "5 Years": 2}
+SECURITY_COST = {"Standard": 0, "Enhanced": 2000, "Enterprise": 5000}
+COMPLIANCE_COST = {"GDPR": 1500, "HIPAA": 1500, "None": 0}
+MONITORING_COST = {"Basic": 0, "Advanced": 2000}
+SUPPORT_COST = {"Basic": 0, "Premium": 5000, "Enterprise": 10000}
+TRAINING_COST = {"None": 0, "One-Time": 1000, "Ongoing": 1000}
+FEATURE_COST = {"data_encryption": 1000, "ai_integration": 3000, "api_access": 1000}
+
+# Options of the Cost Estimator's remaining widgets, which do not affect the price
+DATA_SOURCES = ["Corrigo", "Property Hub", "Custom Source", "API Integration", "File Upload"]
+ETL_TYPES = ["Batch", "Streaming", "Batch + Streaming"]
+REFRESH_FREQUENCIES = ["Daily", "Weekly", "Monthly"]
+DATA_WAREHOUSES = ["Snowflake", "Databricks"]
+SOLUTION_TYPES = ["Analytical / Operational Reporting", "IoT", "Advanced Analytics"]
+DASHBOARD_OPTIONS = ["PowerBI", "Tableau", "None"]
+IOT_SOLUTIONS = ["VergeSense", "Digital Twins", "Other"]
+DEVICE_COUNTS = ["10-100", "100-1000", "1000-5000"]
+
+# Monthly OpEx rates
+COMPUTE_COST_PER_MONTH = 500
+STORAGE_COST_PER_MONTH = 200
+STORAGE_OPEX_UNITS = {"10 GB": 1, "100 GB": 2, "1 TB": 3, "10 TB": 4}
+
+# Values used when a configuration leaves a field out
+DEFAULTS = {
+    "data_sources": [],
+    "compute_hours": 0,
+    "users": 1,
+    "data_encryption": False,
+    "ai_integration": False,
+    "api_access": False,
+}
+
+# Allowed range (inclusive) of each numeric input, as offered by the Cost Estimator's widgets
+NUMERIC_RANGES = {"compute_hours": (0, 500), "users": (1, 1000)}
+
+COST_COLUMNS = ["total_cost", "monthly_opex", "yearly_opex"]
+
+
+# Function to map a categorical column through a pricing table, vectorized
+def _lookup(frame, column, table):
+    codes = pd.Categorical(frame[column], categories=list(table)).codes
+    if (codes < 0).any():
+        unknown = frame[column][codes < 0].unique()[:5]
+        raise ValueError(f"Unknown value(s) for {column}: {list(unknown)}")
+    return np.asarray(list(table.values()))[codes]
+
+
+# Function to read a numeric column, falling back to its default
+def _numeric(frame, column):
+    if column in frame:
+        return frame[column].to_numpy()
+    return np.full(len(frame), DEFAULTS[column])
+
+
+# Function to count data sources from either a list column or a precomputed count
+def _data_source_count(frame):
+    if "data_source_count" in frame:
+        return frame["data_source_count"].to_numpy()
+    if "data_sources" in frame:
+        return frame["data_sources"].map(len).to_numpy()
+    return np.zeros(len(frame), dtype=np.int64)
+
+
+# Function to price a frame of configurations in one vectorized pass.
+# Each row holds the same fields as the Cost Estimator's project_params;
+# returns implementation cost, monthly OpEx and yearly OpEx per row.
+def price_scenarios(frame):
+    total_cost = (
+        BASE_COST
+        + DATA_SOURCE_COST * _data_source_count(frame)
+        + _lookup(frame, "transformation_complexity", COMPLEXITY_COST)
+        + COMPUTE_HOUR_COST * _numeric(frame, "compute_hours")
+        + _lookup(frame, "storage_needs", STORAGE_COST)
+    )
+    total_cost = total_cost * _lookup(frame, "data_retention", RETENTION_MULTIPLIER)
+    total_cost = total_cost + USER_COST * _numeric(frame, "users")
+
+    total_cost = total_cost + _lookup(frame, "security_level", SECURITY_COST)
+    total_cost = total_cost + _lookup(frame, "data_compliance", COMPLIANCE_COST)
+    for feature, cost in FEATURE_COST.items():
+        if feature in frame:
+            total_cost = total_cost + np.where(frame[feature].to_numpy(dtype=bool), cost, 0)
+    total_cost = total_cost + _lookup(frame, "monitoring", MONITORING_COST)
+    total_cost = total_cost + _lookup(frame, "support", SUPPORT_COST)
+    total_cost = total_cost + _lookup(frame, "training_sessions", TRAINING_COST)
+
+    monthly_opex = (
+        (COMPUTE_COST_PER_MONTH * _numeric(frame, "compute_hours") / 100)
+        + (STORAGE_COST_PER_MONTH * _lookup(frame, "storage_needs", STORAGE_OPEX_UNITS))
+    )
+    yearly_opex = monthly_opex * 12
+
+    return pd.DataFrame(
+        {"total_cost": total_cost, "monthly_opex": monthly_opex, "yearly_opex": yearly_opex},
+        index=frame.index,
+    )
+
+
+# Function to price a single Cost Estimator configuration
+def estimate_cost(project_params):
+    frame = pd.DataFrame([{**project_params, "data_source_count": len(project_params.get("data_sources", []))}])
+    costs = price_scenarios(frame.drop(columns=["data_sources"], errors="ignore")).iloc[0]
+    return costs["total_cost"], costs["monthly_opex"], costs["yearly_opex"]
+
+
+# Function to build every combination of the given axes around a base configuration.
+# Example: scenario_grid(params, storage_needs=list(STORAGE_COST), support=list(SUPPORT_COST))
+def scenario_grid(base_params, **axes):
+    names = list(axes)
+    combos = pd.DataFrame(list(itertools.product(*axes.values())), columns=names)
+    for key, value in base_params.items():
+        if key in names:
+            continue
+        if key == "data_sources":
+            combos["data_source_count"] = len(value)
+        else:
+            combos[key] = value
+    return combos
+
+
+# Function to price every combination of the given axes around a base configuration
+def sweep(base_params, **axes):
+    grid = scenario_grid(base_params, **axes)
+    return pd.concat([grid, price_scenarios(grid)], axis=1)
+
+
+# Inputs varied by the sensitivity analysis, each over its full widget range
+SENSITIVITY_AXES = {
+    "compute_hours": list(range(NUMERIC_RANGES["compute_hours"][0], NUMERIC_RANGES["compute_hours"][1] + 1)),
+    "users": list(range(NUMERIC_RANGES["users"][0], NUMERIC_RANGES["users"][1] + 1)),
+    "storage_needs": list(STORAGE_COST),
+    "data_retention": list(RETENTION_MULTIPLIER),
+    "support": list(SUPPORT_COST),
+    "security_level": list(SECURITY_COST),
+}
+
+# Fields of project_params that influence pricing
+PRICING_FIELDS = (
+    "data_sources", "transformation_complexity", "compute_hours", "storage_needs",
+    "data_retention", "users", "security_level", "data_compliance", "data_encryption",
+    "ai_integration", "api_access", "monitoring", "support", "training_sessions",
+)
+
+# Version of the pricing engine, salted into the keys of results cached across processes
+# and restarts (the shared cache): it changes with any table value, and PRICING_LOGIC_VERSION
+# is bumped by hand whenever the formulas below change
+PRICING_LOGIC_VERSION = 1
+PRICING_VERSION = hashlib.sha256(json.dumps([
+    PRICING_LOGIC_VERSION, BASE_COST, DATA_SOURCE_COST, COMPUTE_HOUR_COST, USER_COST,
+    COMPLEXITY_COST, STORAGE_COST, RETENTION_MULTIPLIER, SECURITY_COST, COMPLIANCE_COST,
+    MONITORING_COST, SUPPORT_COST, TRAINING_COST, FEATURE_COST, COMPUTE_COST_PER_MONTH,
+    STORAGE_COST_PER_MONTH, STORAGE_OPEX_UNITS, DEFAULTS, SENSITIVITY_AXES,
+], sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+# Function to keep only the project parameters that affect pricing
+def pricing_inputs(project_params):
+    return {key: project_params[key] for key in PRICING_FIELDS if key in project_params}
+
+
+# Function to vary each input on its own around a base configuration.
+# All variations are stacked into one frame and priced in a single pass.
+def sensitivity(base_params, axes=None):
+    axes = axes or SENSITIVITY_AXES
+    base = scenario_grid(base_params)
+    frames = []
+    for name, values in axes.items():
+        frame = base.loc[base.index.repeat(len(values))].reset_index(drop=True)
+        frame[name] = list(values)
+        frame["input"] = name
+        frame["value"] = pd.Series(list(values), dtype=object)
+        frames.append(frame)
+    grid = pd.concat(frames, ignore_index=True)
+    return pd.concat([grid[["input", "value"]], price_scenarios(grid)], axis=1)
+
+
+# Function to summarize a sensitivity sweep as low/high swings from the base value,
+# ordered from the smallest to the largest swing (tornado order)
+def tornado(sensitivity_frame, base_value, metric="total_cost"):
+    summary = sensitivity_frame.groupby("input", sort=False)[metric].agg(["min", "max"])
+    summary = pd.DataFrame({
+        "low": summary["min"] - base_value,
+        "high": summary["max"] - base_value,
+    })
+    summary["swing"] = summary["high"] - summary["low"]
+    return summary.sort_values("swing").reset_index()
@@ -0,0 +1,183 @@
+import json
+import math
+import re
+
+# Compact, canonical encoding of a Cost Estimator configuration for the description prompt.
+# Each field is written as "key=value", in a fixed order, separated by "; ". Fields whose
+# baseline (no sources, lowest tier, feature off) is stated once in the system prompt are
+# written only when they differ from it; the rest (None) are always written when set.
+# project_params field -> (prompt key, baseline). The baselines are the first entries of the
+# pricing tables, written out here so that importing this module (via layout, on every page)
+# does not pull in pandas and numpy.
+PROMPT_FIELDS = {
+    "data_sources": ("sources", []),
+    "etl_type": ("load", None),
+    "refresh_frequency": ("refresh", None),
+    "data_warehouse": ("warehouse", None),
+    "solution_type": ("solution", None),
+    "dashboard_required": ("bi", None),
+    "transformation_complexity": ("complexity", "Simple"),
+    "compute_hours": ("hours", None),
+    "storage_needs": ("storage", None),
+    "data_retention": ("retention", None),
+    "users": ("users", None),
+    "support": ("support", "Basic"),
+    "security_level": ("security", "Standard"),
+    "data_compliance": ("compliance", "None"),
+    "monitoring": ("monitoring", "Basic"),
+    "training_sessions": ("training", "None"),
+    "data_encryption": ("encryption", False),
+    "ai_integration": ("ai", False),
+    "api_access": ("api", False),
+    "iot_solution": ("iot", None),
+    "number_of_devices": ("devices", None),
+}
+
+SYSTEM_PROMPT = (
+    "You write concise high-level solution architecture descriptions (max 1000 characters) "
+    "from project specifications."
+)
+BATCH_SYSTEM_PROMPT = (
+    "You write concise high-level solution architecture descriptions (max 1000 characters each) "
+    "from numbered project specifications. Reply with only a JSON object mapping each number to "
+    'its description, e.g. {"1": "...", "2": "..."}.'
+)
+BASELINE_NOTE = "Options not listed are at their baseline (none, simple, basic, standard or off)."
+
+# Chat format overhead (cl100k models): tokens per message, and to prime the reply
+MESSAGE_TOKENS = 4
+REPLY_TOKENS = 3
+# Fallback token estimate when tiktoken is unavailable: one token per word (long words
+# split every few letters), digit group of up to three, pair of punctuation marks, and
+# whitespace run not absorbed by the word after it
+TOKEN_PATTERN = re.compile(r" ?[A-Za-z]+| ?\d{1,3}| ?[^\sA-Za-z\d]+|\s+")
+LETTERS_PER_TOKEN = 8
+PUNCTUATION_PER_TOKEN = 2
+
+
+# Function to encode one value canonically ("" when it is unset)
+def _encode_value(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, (list, tuple, set)):
+        return ",".join(sorted(" ".join(str(item).split()) for item in value)) or "none"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return " ".join(str(value).split())
+
+
+# Function to reduce project parameters to their non-baseline fields as prompt key -> encoded value.
+# Equivalent configurations (reordered sources, baselines given or left out) encode identically.
+def canonical_params(project_params):
+    encoded = {}
+    for field, (key, baseline) in PROMPT_FIELDS.items():
+        value = _encode_value(project_params.get(field))
+        if value and value != _encode_value(baseline):
+            encoded[key] = value
+    # Fields the prompt does not know yet are still passed on, after the known ones
+    for field in sorted(set(project_params) - set(PROMPT_FIELDS)):
+        value = _encode_value(project_params[field])
+        if value:
+            encoded[field] = value
+    return encoded
+
+
+# Function to render project parameters as one compact line ("baseline" when nothing differs)
+def encode_params(project_params):
+    return "; ".join(f"{key}={value}" for key, value in canonical_params(project_params).items()) or "baseline"
+
+
+def _system_message(prompt):
+    return {"role": "system", "content": f"{prompt} {BASELINE_NOTE}"}
+
+
+# Function to build the chat messages for one solution description
+def build_messages(project_params):
+    return [
+        _system_message(SYSTEM_PROMPT),
+        {"role": "user", "content": encode_params(project_params)},
+    ]
+
+
+# Function to build the chat messages for several descriptions in one completion,
+# with the scenarios numbered from 1
+def build_batch_messages(scenarios):
+    return [
+        _system_message(BATCH_SYSTEM_PROMPT),
+        {"role": "user", "content": "\n".join(f"{n}: {encode_params(params)}" for n, params in enumerate(scenarios, 1))},
+    ]
+
+
+# Function to split a batched completion back into one description per scenario
+# (None for any scenario the response leaves out or cannot be parsed for)
+def split_batch_response(text, count):
+    start, end = text.find("{"), text.rfind("}")
+    try:
+        parsed = json.loads(text[start:end + 1]) if 0 <= start < end else {}
+    except ValueError:
+        parsed = {}
+    if not isinstance(parsed, dict):
+        parsed = {}
+    descriptions = []
+    for number in range(1, count + 1):
+        value = parsed.get(str(number))
+        descriptions.append(value.strip() if isinstance(value, str) and value.strip() else None)
+    return descriptions
+
+
+# Function to count the tokens of a text locally: exact with tiktoken when it is
+# installed (optional), otherwise a close estimate
+def count_tokens(text, model="gpt-4"):
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return sum(map(_estimate_tokens, TOKEN_PATTERN.findall(text)))
+
+
+def _estimate_tokens(piece):
+    piece = piece.strip()
+    if not piece:
+        return 1
+    if piece.isalpha():
+        return math.ceil(len(piece) / LETTERS_PER_TOKEN)
+    if piece.isdigit():
+        return 1
+    return math.ceil(len(piece) / PUNCTUATION_PER_TOKEN)
+
+
+_ENCODINGS = {}
+
+
+def _encoding(model):
+    if model not in _ENCODINGS:
+        try:
+            import tiktoken
+            _ENCODINGS[model] = tiktoken.encoding_for_model(model)
+        except Exception:  # not installed, unknown model, or the encoding files cannot be fetched
+            _ENCODINGS[model] = None
+    return _ENCODINGS[model]
+
+
+# Function to count the prompt tokens of a list of chat messages, as the API bills them
+def count_message_tokens(messages, model="gpt-4"):
+    return sum(MESSAGE_TOKENS + count_tokens(message["content"], model) for message in messages) + REPLY_TOKENS
+
+
+# Function to group scenarios into batches that fit the model's context window: each batch
+# holds at most max_batch scenarios, and its prompt plus completion_tokens per scenario
+# stays within context_tokens. Returns lists of scenario positions.
+def plan_batches(scenarios, max_batch, context_tokens, completion_tokens, model="gpt-4"):
+    batches, batch, used = [], [], 0
+    base = count_message_tokens(build_batch_messages([]), model)
+    for position, params in enumerate(scenarios):
+        cost = count_tokens(f"\n{max_batch}: {encode_params(params)}", model) + completion_tokens
+        if batch and (len(batch) >= max_batch or base + used + cost > context_tokens):
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append(position)
+        used += cost
+    if batch:
+        batches.append(batch)
+    return batches
@@ -0,0 +1,51 @@
+"""Price a book of Cost Estimator configurations from CSV or Parquet, optionally with descriptions.
+
+    python scripts/batch_quote.py rfp_book.csv --out quotes.csv
+    python scripts/batch_quote.py rfp_book.parquet --out quotes.parquet --describe --concurrency 8 --batch-size 5
+    python scripts/batch_quote.py rfp_book.csv --out quotes.csv --describe --resume
+
+One row per configuration, with columns named like the estimator's fields (data_sources
+separated by ";" in CSV). Missing columns take the estimator's defaults; rows with unknown
+values are kept with an "error" and no costs. --describe reads the OpenAI key from
+OPENAI_API_KEY (or .streamlit/secrets.toml) and reuses the app's response cache.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_quotes import DESCRIPTION_CONCURRENCY, read_checkpoint, run_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="configurations (.csv or .parquet)")
+    parser.add_argument("--out", required=True, help="results (.csv file or .parquet directory)")
+    parser.add_argument("--describe", action="store_true", help="also generate a solution description per row")
+    parser.add_argument("--concurrency", type=int, default=DESCRIPTION_CONCURRENCY, help="descriptions in flight")
+    parser.add_argument("--batch-size", type=int, help="descriptions per request (1 gives each its own prompt)")
+    parser.add_argument("--chunk-rows", type=int, help="rows read, priced and written per chunk")
+    parser.add_argument("--resume", action="store_true", help="continue after the last completed chunk")
+    args = parser.parse_args()
+
+    if args.resume and read_checkpoint(args.out):
+        print(f"Resuming {args.out} after row {read_checkpoint(args.out)['rows']:,}")
+
+    def progress(rows):
+        print(f"\r{rows:,} rows written", end="", file=sys.stderr, flush=True)
+
+    summary = run_batch(
+        args.input, args.out, describe=args.describe, concurrency=args.concurrency,
+        chunk_rows=args.chunk_rows, resume=args.resume, progress=progress, batch_size=args.batch_size,
+    )
+    print(file=sys.stderr)
+    print(
+        f"Priced {summary['rows']:,} configurations in {summary['seconds']:.1f} s "
+        f"({summary['invalid']:,} with errors, {summary['skipped']:,} already done) to {args.out}"
+        + (f"; {summary['described']:,} descriptions, {summary['description_errors']:,} failed" if args.describe else "")
+    )
+
+
+if __name__ == "__main__":
+    main()
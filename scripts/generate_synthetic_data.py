@@ -0,0 +1,90 @@
+"""Generate synthetic client, activity and pipeline datasets in the partitioned Parquet layout.
+
+    python scripts/generate_synthetic_data.py --rows 1000000 --out data/1m
+    JLL_CLIENTS_PATH=data/1m/clients JLL_PIPELINE_PATH=data/1m/pipeline streamlit run app.py
+"""
+import argparse
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+import storage
+from activity import ACTIVITY_MONTHS, generate_activity
+
+SOLUTIONS = [
+    "Data Warehouse", "Tableau Dashboards", "ETL Pipeline", "Real-time Data Sync",
+    "Operational Reporting", "Machine Learning", "IoT Integration", "Data Lake",
+    "Data Pipeline", "Custom Visualizations", "AI/ML Integration",
+]
+STAGES = ["Prospecting", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]
+STAGE_PROBABILITY = {"Prospecting": 30, "Proposal": 60, "Negotiation": 70, "Closed Won": 100, "Closed Lost": 0}
+RENEWAL_LIKELIHOOD = ["High", "Medium", "Low"]
+CHUNK_ROWS = 1_000_000
+
+
+# Function to build synthetic client names
+def client_names(start, stop):
+    return [f"Client {i:08d}" for i in range(start, stop)]
+
+
+# Function to generate one chunk of clients
+def generate_clients(rng, start, stop):
+    n = stop - start
+    contract_start = pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 4 * 365, n), unit="D")
+    contract_end = contract_start + pd.to_timedelta(rng.integers(365, 4 * 365, n), unit="D")
+    solution_counts = rng.integers(1, 4, n)
+    solution_picks = rng.integers(0, len(SOLUTIONS), solution_counts.sum())
+    offsets = np.concatenate([[0], np.cumsum(solution_counts)])
+    return pd.DataFrame({
+        "Client Name": client_names(start, stop),
+        "Contract Start": contract_start.strftime("%Y-%m-%d"),
+        "Contract End": contract_end.strftime("%Y-%m-%d"),
+        "Solutions": [[SOLUTIONS[j] for j in solution_picks[offsets[i]:offsets[i + 1]]] for i in range(n)],
+        "CR Count": rng.integers(0, 10, n),
+        "Renewal Likelihood": np.asarray(RENEWAL_LIKELIHOOD)[rng.integers(0, 3, n)],
+    })
+
+
+# Function to generate one chunk of pipeline opportunities
+def generate_pipeline(rng, n, clients):
+    stages = np.asarray(STAGES)[rng.integers(0, len(STAGES), n)]
+    close_dates = pd.Timestamp("2023-09-01") + pd.to_timedelta(rng.integers(0, 2 * 365, n), unit="D")
+    return pd.DataFrame({
+        "Client Name": [f"Client {i:08d}" for i in rng.integers(0, clients, n)],
+        "Stage": stages,
+        "Estimated Value": rng.integers(50, 250, n) * 1000,
+        "Probability (%)": pd.Series(stages).map(STAGE_PROBABILITY).to_numpy(),
+        "Expected Close Date": close_dates,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="pipeline opportunities to generate")
+    parser.add_argument("--clients", type=int, help="clients to generate (default: rows / 10)")
+    parser.add_argument("--out", default="data/synthetic")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--as-of", type=datetime.date.fromisoformat, default=datetime.date.today(),
+                        help="last month of the activity history (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    clients = args.clients or max(10, args.rows // 10)
+    rng = np.random.default_rng(args.seed)
+    for chunk, start in enumerate(range(0, clients, CHUNK_ROWS)):
+        stop = min(start + CHUNK_ROWS, clients)
+        storage.write_dataset(generate_clients(rng, start, stop), os.path.join(args.out, "clients"), f"part-{chunk:04d}")
+        activity = generate_activity(client_names(start, stop), args.as_of).to_frame()
+        storage.write_dataset(activity, os.path.join(args.out, "activity"), f"part-{chunk:04d}")
+    for chunk, start in enumerate(range(0, args.rows, CHUNK_ROWS)):
+        n = min(CHUNK_ROWS, args.rows - start)
+        storage.write_dataset(generate_pipeline(rng, n, clients), os.path.join(args.out, "pipeline"), f"part-{chunk:04d}")
+    print(f"Wrote {clients:,} clients (with {ACTIVITY_MONTHS} months of activity) and {args.rows:,} opportunities to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
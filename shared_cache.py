@@ -0,0 +1,225 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+
+# Node-wide cache shared by every Streamlit process (replica) on the machine. Values
+# are pickled into one SQLite database in WAL mode, so readers never block the writer.
+SHARED_CACHE_PATH_ENV = "JLL_SHARED_CACHE_PATH"
+DEFAULT_CACHE_PATH = os.path.join(".cache", "shared.sqlite3")
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_LEASE_SECONDS = 60
+BUSY_TIMEOUT_SECONDS = 10
+PURGE_EVERY = 256  # writes between sweeps of expired entries and leases
+
+# Polling backoff while another process holds the lease for a key
+POLL_INITIAL_SECONDS = 0.005
+POLL_MAX_SECONDS = 0.2
+
+MISSING = object()
+
+
+# Function to build a stable key from any JSON-serializable parts (dict order does not matter)
+def make_key(*parts):
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Cross-process cache with leases for stampede protection: of all the processes and
+# threads that miss on a key at once, one computes it and the others wait for its result.
+# path=None gives a pass-through cache that always computes (for tests and single runs).
+class SharedCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.lease_seconds = lease_seconds
+        self._local = threading.local()
+        self._flights = weakref.WeakValueDictionary()
+        self._flights_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "computes": 0, "waits": 0}
+        self._writes = 0
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = self._connection()
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL, PRIMARY KEY (namespace, key))"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, owner TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+
+    # One connection per thread; autocommit, with explicit transactions where needed
+    def _connection(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def get(self, namespace, key):
+        entry = self.get_entry(namespace, key)
+        return MISSING if entry is MISSING else entry[0]
+
+    # Function to get an unexpired entry as (value, created_at), or MISSING
+    def get_entry(self, namespace, key):
+        if not self.path:
+            return MISSING
+        row = self._connection().execute(
+            "SELECT value, created_at FROM entries "
+            "WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (namespace, key, time.time()),
+        ).fetchone()
+        return MISSING if row is None else (pickle.loads(row[0]), row[1])
+
+    def set(self, namespace, key, value, ttl_seconds=MISSING):
+        if not self.path:
+            return
+        ttl_seconds = self.ttl_seconds if ttl_seconds is MISSING else ttl_seconds
+        now = time.time()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO entries (namespace, key, value, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+            (namespace, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), now,
+             None if ttl_seconds is None else now + ttl_seconds),
+        )
+        with self._stats_lock:
+            self._writes += 1
+            purge = self._writes % PURGE_EVERY == 0
+        if purge:
+            self.purge_expired()
+
+    # Function to take the lease on a key; returns an owner token, or None if another
+    # process or thread holds an unexpired lease
+    def try_lease(self, namespace, key, lease_seconds=None):
+        if not self.path:
+            return "local"
+        owner = uuid.uuid4().hex
+        now = time.time()
+        db = self._connection()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute(
+                "DELETE FROM leases WHERE namespace = ? AND key = ? AND expires_at <= ?", (namespace, key, now)
+            )
+            acquired = db.execute(
+                "INSERT OR IGNORE INTO leases (namespace, key, owner, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, owner, now + (lease_seconds or self.lease_seconds)),
+            ).rowcount == 1
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return owner if acquired else None
+
+    def release_lease(self, namespace, key, owner):
+        if self.path and owner is not None:
+            self._connection().execute(
+                "DELETE FROM leases WHERE namespace = ? AND key = ? AND owner = ?", (namespace, key, owner)
+            )
+
+    def _leased(self, namespace, key):
+        return self._connection().execute(
+            "SELECT 1 FROM leases WHERE namespace = ? AND key = ? AND expires_at > ?", (namespace, key, time.time())
+        ).fetchone() is not None
+
+    # Function to wait while another holder of the lease computes a key. Returns the value,
+    # or MISSING once the lease is released or expires without a value (the holder failed).
+    def wait(self, namespace, key, timeout=None):
+        self._count("waits")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = POLL_INITIAL_SECONDS
+        while True:
+            value = self.get(namespace, key)
+            if value is not MISSING or not self._leased(namespace, key):
+                return value
+            if deadline is not None and time.monotonic() >= deadline:
+                return MISSING
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_SECONDS)
+
+    # Function to get a value, computing and storing it on a miss. Threads of this process
+    # queue on a per-key lock; other processes are held off by the key's lease.
+    def get_or_compute(self, namespace, key, compute, ttl_seconds=MISSING, lease_seconds=None):
+        value = self.get(namespace, key)
+        if value is not MISSING:
+            self._count("hits")
+            return value
+        self._count("misses")
+
+        with self._flights_lock:
+            flight = self._flights.get((namespace, key))
+            if flight is None:
+                flight = self._flights[(namespace, key)] = threading.Lock()
+        with flight:
+            while True:
+                value = self.get(namespace, key)
+                if value is not MISSING:
+                    return value
+                owner = self.try_lease(namespace, key, lease_seconds)
+                if owner is not None:
+                    break
+                value = self.wait(namespace, key)
+                if value is not MISSING:
+                    return value
+            try:
+                self._count("computes")
+                value = compute()
+                self.set(namespace, key, value, ttl_seconds)
+            finally:
+                self.release_lease(namespace, key, owner)
+        return value
+
+    def purge_expired(self):
+        if not self.path:
+            return 0
+        now = time.time()
+        db = self._connection()
+        removed = db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,)).rowcount
+        db.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+        return removed
+
+    def clear(self, namespace=None):
+        if not self.path:
+            return
+        if namespace is None:
+            self._connection().execute("DELETE FROM entries")
+        else:
+            self._connection().execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / total if total else 0.0
+        return stats
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+# Function to get this process's handle on the node-wide cache (JLL_SHARED_CACHE_PATH;
+# set it to an empty string to turn the shared tier off)
+def default_cache():
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = SharedCache(os.environ.get(SHARED_CACHE_PATH_ENV, DEFAULT_CACHE_PATH) or None)
+    return _default
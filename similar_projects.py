@@ -0,0 +1,196 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from pricing import (
+    COMPLEXITY_COST, COMPLIANCE_COST, DASHBOARD_OPTIONS, DATA_SOURCES, DATA_WAREHOUSES, ETL_TYPES,
+    FEATURE_COST, MONITORING_COST, NUMERIC_RANGES, REFRESH_FREQUENCIES, RETENTION_MULTIPLIER,
+    SECURITY_COST, SOLUTION_TYPES, STORAGE_COST, SUPPORT_COST, TRAINING_COST,
+)
+
+# Feature layout for past projects; uses the Cost Estimator's widget options.
+# Unknown categorical values simply encode as all zeros.
+CATEGORICAL_FIELDS = {
+    "etl_type": ETL_TYPES,
+    "refresh_frequency": REFRESH_FREQUENCIES,
+    "data_warehouse": DATA_WAREHOUSES,
+    "solution_type": SOLUTION_TYPES,
+    "dashboard_required": DASHBOARD_OPTIONS,
+    "transformation_complexity": list(COMPLEXITY_COST),
+    "storage_needs": list(STORAGE_COST),
+    "data_retention": list(RETENTION_MULTIPLIER),
+    "support": list(SUPPORT_COST),
+    "security_level": list(SECURITY_COST),
+    "data_compliance": list(COMPLIANCE_COST),
+    "monitoring": list(MONITORING_COST),
+    "training_sessions": list(TRAINING_COST),
+}
+NUMERIC_FIELDS = {field: high for field, (low, high) in NUMERIC_RANGES.items()}  # scaled to [0, 1] by these maxima
+BOOLEAN_FIELDS = list(FEATURE_COST)
+
+FEATURE_COUNT = (
+    len(DATA_SOURCES)
+    + sum(len(options) for options in CATEGORICAL_FIELDS.values())
+    + len(NUMERIC_FIELDS)
+    + len(BOOLEAN_FIELDS)
+)
+
+# Corpora above this size are searched through the approximate index by default
+APPROXIMATE_THRESHOLD = 200_000
+QUERY_CACHE_SIZE = 1024
+
+GREEK = [
+    "Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Eta", "Theta", "Iota", "Kappa", "Lambda", "Mu",
+    "Nu", "Xi", "Omicron", "Pi", "Rho", "Sigma", "Tau", "Upsilon", "Phi", "Chi", "Psi", "Omega",
+]
+
+
+# Function to encode a frame of project parameters as a contiguous float32 feature matrix
+def encode_projects(frame):
+    n = len(frame)
+    matrix = np.zeros((n, FEATURE_COUNT), dtype=np.float32)
+    rows = np.arange(n)
+    column = 0
+
+    if "data_sources" in frame:
+        sources = frame["data_sources"]
+        for source in DATA_SOURCES:
+            matrix[:, column] = sources.map(lambda selected: source in selected).to_numpy(dtype=np.float32)
+            column += 1
+    else:
+        column += len(DATA_SOURCES)
+
+    for field, options in CATEGORICAL_FIELDS.items():
+        if field in frame:
+            codes = pd.Categorical(frame[field], categories=options).codes
+            known = codes >= 0
+            matrix[rows[known], column + codes[known]] = 1.0
+        column += len(options)
+
+    for field, maximum in NUMERIC_FIELDS.items():
+        if field in frame:
+            matrix[:, column] = np.clip(frame[field].to_numpy(dtype=np.float32) / maximum, 0.0, 1.0)
+        column += 1
+
+    for field in BOOLEAN_FIELDS:
+        if field in frame:
+            matrix[:, column] = frame[field].to_numpy(dtype=np.float32)
+        column += 1
+
+    return matrix
+
+
+# Function to encode a single project_params dict as a feature vector
+def encode_params(project_params):
+    return encode_projects(pd.DataFrame([project_params]))[0]
+
+
+# Function to compute squared Euclidean distances from one vector to every row
+def _squared_distances(matrix, norms, vector):
+    return norms - 2.0 * (matrix @ vector) + float(vector @ vector)
+
+
+# Function to return the indices of the k smallest distances, nearest first
+def _top_k(distances, k):
+    k = min(k, len(distances))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    candidates = np.argpartition(distances, k - 1)[:k]
+    return candidates[np.argsort(distances[candidates], kind="stable")]
+
+
+# Inverted-file index: k-means cells over the corpus, probing only the nearest cells
+class IVFIndex:
+    def __init__(self, matrix, n_lists=None, n_iter=8, seed=0):
+        n = len(matrix)
+        n_lists = n_lists or max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        centroids = matrix[rng.choice(n, n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            assignment = self._assign(matrix, centroids)
+            counts = np.bincount(assignment, minlength=n_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, matrix)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+        assignment = self._assign(matrix, centroids)
+        self.centroids = centroids
+        self.order = np.argsort(assignment, kind="stable")
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=n_lists))])
+
+    @staticmethod
+    def _assign(matrix, centroids, chunk=65536):
+        centroid_norms = (centroids * centroids).sum(axis=1)
+        assignment = np.empty(len(matrix), dtype=np.int64)
+        for start in range(0, len(matrix), chunk):
+            block = matrix[start:start + chunk]
+            distances = centroid_norms[None, :] - 2.0 * (block @ centroids.T)
+            assignment[start:start + chunk] = distances.argmin(axis=1)
+        return assignment
+
+    def candidates(self, vector, n_probe):
+        distances = ((self.centroids - vector) ** 2).sum(axis=1)
+        cells = _top_k(distances, n_probe)
+        return np.concatenate([self.order[self.offsets[c]:self.offsets[c + 1]] for c in cells])
+
+
+# Nearest-neighbour index over a corpus of past projects
+class ProjectIndex:
+    def __init__(self, corpus, approximate=None, n_probe=32):
+        self.corpus = corpus.reset_index(drop=True)
+        self.matrix = np.ascontiguousarray(encode_projects(self.corpus))
+        self.norms = (self.matrix * self.matrix).sum(axis=1)
+        if approximate is None:
+            approximate = len(self.corpus) > APPROXIMATE_THRESHOLD
+        self.ivf = IVFIndex(self.matrix) if approximate else None
+        self.n_probe = n_probe
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def search(self, vector, k=3):
+        vector = np.asarray(vector, dtype=np.float32)
+        key = (vector.tobytes(), k)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        if self.ivf is not None:
+            candidates = self.ivf.candidates(vector, self.n_probe)
+            distances = _squared_distances(self.matrix[candidates], self.norms[candidates], vector)
+            indices = candidates[_top_k(distances, k)]
+        else:
+            indices = _top_k(_squared_distances(self.matrix, self.norms, vector), k)
+
+        with self._lock:
+            self._cache[key] = indices
+            if len(self._cache) > QUERY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return indices
+
+    # Function to return the k most similar past projects as dicts with name and link
+    def query(self, project_params, k=3):
+        indices = self.search(encode_params(project_params), k)
+        return self.corpus.iloc[indices][["name", "link"]].to_dict("records")
+
+
+# Function to generate a synthetic corpus of past projects
+def generate_corpus(n, seed=0):
+    rng = np.random.default_rng(seed)
+    ids = np.arange(n)
+    corpus = {
+        "name": [f"Project {GREEK[i % len(GREEK)]}" + (f" {i // len(GREEK) + 1}" if i >= len(GREEK) else "") for i in ids],
+        "link": [f"https://example.com/projects/{i}" for i in ids],
+    }
+    source_mask = rng.random((n, len(DATA_SOURCES))) < 0.4
+    corpus["data_sources"] = [[s for s, chosen in zip(DATA_SOURCES, row) if chosen] for row in source_mask]
+    for field, options in CATEGORICAL_FIELDS.items():
+        corpus[field] = np.asarray(options, dtype=object)[rng.integers(0, len(options), n)]
+    for field, (low, high) in NUMERIC_RANGES.items():
+        corpus[field] = rng.integers(low, high + 1, n)
+    for field in BOOLEAN_FIELDS:
+        corpus[field] = rng.random(n) < 0.5
+    return pd.DataFrame(corpus)
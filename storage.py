@@ -0,0 +1,116 @@
+import functools
+import os
+import zlib
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+# Layout of the on-disk client/pipeline datasets: Hive-style directories
+# (client_bucket=N/) of Parquet files sorted by client name, so a lookup for one
+# client touches a single partition and row-group statistics skip the rest.
+PARTITION_COLUMN = "client_bucket"
+CLIENT_BUCKETS = 64
+ROWS_PER_GROUP = 64 * 1024
+
+# Memory-mapped local filesystem used for every read
+_filesystem = pafs.LocalFileSystem(use_mmap=True)
+
+
+# Function to compute the partition bucket of a client name
+def client_bucket(client_name, buckets=CLIENT_BUCKETS):
+    return zlib.crc32(client_name.encode("utf-8")) % buckets
+
+
+# Function to open a partitioned Parquet dataset through memory-mapping.
+# files restricts the dataset to some of its Parquet files (paths under root).
+def open_dataset(root, files=None):
+    return ds.dataset(
+        root if files is None else list(files),
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.int32())]), flavor="hive"),
+        partition_base_dir=None if files is None else root,
+        filesystem=_filesystem,
+    )
+
+
+# Function to list a dataset's Parquet files with their modification times, sorted by path
+def dataset_files(root):
+    files = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if name.endswith(".parquet"):
+                path = os.path.join(directory, name)
+                files.append((path, os.path.getmtime(path)))
+    return sorted(files)
+
+
+# Function to write a frame as a partitioned Parquet dataset.
+# part_name keeps repeated calls (e.g. chunked generation) from overwriting each other.
+def write_dataset(frame, root, part_name="part"):
+    if PARTITION_COLUMN not in frame:
+        frame = frame.assign(**{PARTITION_COLUMN: frame["Client Name"].map(client_bucket).astype("int32")})
+    frame = frame.sort_values([PARTITION_COLUMN, "Client Name"], kind="stable")
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.int32())]), flavor="hive"),
+        basename_template=part_name + "-{i}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=ROWS_PER_GROUP,
+    )
+
+
+# Function to read a dataset with column projection and an optional filter expression
+# pushed down to the Parquet reader. The partition column is dropped from the result.
+def read_dataset(root, columns=None, filter=None, files=None):
+    dataset = open_dataset(root, files)
+    if columns is None:
+        columns = [name for name in dataset.schema.names if name != PARTITION_COLUMN]
+    return dataset.to_table(columns=columns, filter=filter).to_pandas()
+
+
+# Function to get the row count of each row group of a Parquet file, from its footer
+# (cached per file version, so appending parts only reads the new footers)
+@functools.lru_cache(maxsize=4096)
+def row_group_sizes(path, mtime):
+    metadata = pq.read_metadata(path)
+    return tuple(metadata.row_group(i).num_rows for i in range(metadata.num_row_groups))
+
+
+# Function to read rows [start, stop) of a dataset, counting through its (path, mtime) files
+# in the order given (as listed by dataset_files). Only the row groups overlapping the
+# window are read. The partition column is not included.
+def read_dataset_rows(files, start, stop, columns=None):
+    tables, position = [], 0
+    for path, mtime in files:
+        for index, size in enumerate(row_group_sizes(path, mtime)):
+            if position < stop and position + size > start:
+                table = pq.ParquetFile(path, memory_map=True).read_row_group(index, columns=columns)
+                offset = max(start - position, 0)
+                tables.append(table.slice(offset, min(stop - position, size) - offset))
+            position += size
+        if position >= stop:
+            break
+    if not tables:
+        return pd.DataFrame(columns=columns)
+    return pa.concat_tables(tables).to_pandas()
+
+
+# Function to read only the rows for one client (one partition, pruned row groups)
+def read_client_rows(root, client_name, columns=None):
+    expression = (ds.field(PARTITION_COLUMN) == client_bucket(client_name)) & (
+        ds.field("Client Name") == client_name
+    )
+    return read_dataset(root, columns=columns, filter=expression)
+
+
+# Function to list the distinct client names in a dataset, reading only that column
+def read_client_names(root):
+    table = open_dataset(root).to_table(columns=["Client Name"])
+    return pc.unique(table.column("Client Name")).to_pylist()
@@ -0,0 +1,59 @@
+"""Typing and validation of uploaded configurations, and output assembly, in batch_quotes."""
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from batch_quotes import combine_parts, prepare_configurations, read_chunks, run_batch
+from pricing import DEFAULTS
+
+
+def prepare_file(path, frame):
+    if path.suffix == ".csv":
+        path.write_text(frame)
+    else:
+        frame.to_parquet(path, index=False)
+    return prepare_configurations(next(read_chunks(str(path))))
+
+
+def test_parquet_nulls_take_the_defaults(tmp_path):
+    frame, errors = prepare_file(tmp_path / "book.parquet", pd.DataFrame({
+        "transformation_complexity": ["Moderate", None],
+        "compute_hours": pd.array([10, None], dtype="Int64"),
+        "users": [5.0, np.nan],
+        "ai_integration": pd.array([True, None], dtype="boolean"),
+        "api_access": [True, None],
+    }))
+    assert errors.tolist() == ["", ""]
+    row = frame.iloc[1]
+    assert row["transformation_complexity"] == "Simple"
+    assert (row["compute_hours"], row["users"]) == (DEFAULTS["compute_hours"], DEFAULTS["users"])
+    assert (row["ai_integration"], row["api_access"]) == (DEFAULTS["ai_integration"], DEFAULTS["api_access"])
+
+
+def test_csv_blanks_take_the_defaults(tmp_path):
+    frame, errors = prepare_file(tmp_path / "book.csv", "compute_hours,users,ai_integration,storage_needs\n ,,,\n12, 3 ,yes, 1 TB\n")
+    assert errors.tolist() == ["", ""]
+    assert frame[["compute_hours", "users", "ai_integration", "storage_needs"]].values.tolist() == [
+        [0, 1, False, "10 GB"], [12, 3, True, "1 TB"],
+    ]
+
+
+def test_invalid_values_are_flagged(tmp_path):
+    _, errors = prepare_file(tmp_path / "book.csv", "compute_hours,users,ai_integration,support\n2.9,0,maybe,Gold\n")
+    assert errors[0] == (
+        "unknown support; invalid compute_hours (expected a whole number); users out of range (1-1000); "
+        "invalid ai_integration; "
+    )
+
+
+def test_parquet_parts_combine_into_one_file(tmp_path):
+    book = tmp_path / "book.csv"
+    book.write_text("compute_hours,users\n" + "".join(f"{i % 500},{i % 999 + 1}\n" for i in range(25)))
+    output = str(tmp_path / "quotes.parquet")
+    run_batch(str(book), output, chunk_rows=10)
+
+    combined = io.BytesIO(combine_parts(output))
+    assert pq.ParquetFile(combined).num_row_groups == 3
+    pd.testing.assert_frame_equal(pd.read_parquet(combined), pd.read_parquet(output))
@@ -0,0 +1,140 @@
+"""Coalescing, lease and cancel paths of descriptions.stream_description, against a stubbed
+ChatCompletion (no network or API key)."""
+import threading
+import time
+
+import openai
+import pytest
+
+import descriptions
+from llm_cache import ResponseCache
+from llm_gateway import LLMGateway
+from llm_jobs import CANCELLED, DONE, JobQueue
+from shared_cache import SharedCache
+
+PARAMS = {"data_sources": ["Corrigo"], "etl_type": "Batch", "compute_hours": 50, "users": 50}
+TIMEOUT = 5
+
+
+# Stubbed streaming ChatCompletion: sends "Hello", then holds the rest back until released
+class StubCompletion:
+    def __init__(self):
+        self.calls = 0
+        self.streaming = threading.Event()
+        self.release = threading.Event()
+
+    def create(self, stream=False, **kwargs):
+        self.calls += 1
+        return self._stream()
+
+    def _stream(self):
+        yield {"choices": [{"delta": {"content": "Hello"}}]}
+        self.streaming.set()
+        self.release.wait(2 * TIMEOUT)
+        yield {"choices": [{"delta": {"content": " world"}}]}
+
+
+@pytest.fixture
+def completion(monkeypatch):
+    stub = StubCompletion()
+    monkeypatch.setattr(openai.ChatCompletion, "create", stub.create)
+    return stub
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    gateway = LLMGateway(requests_per_second=100, burst=100)
+    monkeypatch.setattr(descriptions, "get_llm_gateway", lambda: gateway)
+    return gateway
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache()
+    monkeypatch.setattr(descriptions, "get_response_cache", lambda: cache)
+    return cache
+
+
+def wait_until(condition):
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def submit(queue):
+    return queue.get(queue.submit(descriptions.run_description_job, project_params=dict(PARAMS)))
+
+
+def test_identical_requests_share_one_completion(completion, gateway, cache):
+    queue = JobQueue(max_workers=2)
+    leader = submit(queue)
+    completion.streaming.wait(TIMEOUT)
+    follower = submit(queue)
+    wait_until(lambda: gateway.stats()["coalesced"] == 1)
+    completion.release.set()
+    wait_until(lambda: leader.finished and follower.finished)
+
+    assert (leader.status, follower.status) == (DONE, DONE)
+    assert leader.text == follower.text == "Hello world"
+    assert completion.calls == 1
+    assert cache.get(descriptions.description_cache_key(PARAMS)) == "Hello world"
+
+
+def test_leader_cancel_does_not_fail_followers(completion, gateway, cache):
+    queue = JobQueue(max_workers=2)
+    leader = submit(queue)
+    completion.streaming.wait(TIMEOUT)
+    follower = submit(queue)
+    wait_until(lambda: gateway.stats()["coalesced"] == 1)
+    queue.cancel(leader.id)
+    completion.release.set()
+    wait_until(lambda: leader.finished and follower.finished)
+
+    assert leader.status == CANCELLED
+    assert follower.status == DONE, follower.error
+    assert follower.text == "Hello world"
+    assert completion.calls == 2
+
+
+def test_follower_cancel_leaves_leader_running(completion, gateway, cache):
+    queue = JobQueue(max_workers=2)
+    leader = submit(queue)
+    completion.streaming.wait(TIMEOUT)
+    follower = submit(queue)
+    wait_until(lambda: gateway.stats()["coalesced"] == 1)
+    queue.cancel(follower.id)
+    wait_until(lambda: follower.finished)
+    completion.release.set()
+    wait_until(lambda: leader.finished)
+
+    assert follower.status == CANCELLED
+    assert (leader.status, leader.text) == (DONE, "Hello world")
+    assert completion.calls == 1
+
+
+@pytest.mark.parametrize("other_succeeds", [True, False])
+def test_waits_on_another_process_lease(tmp_path, monkeypatch, completion, gateway, other_succeeds):
+    # Two caches over one store stand in for two processes on the node
+    store = SharedCache(str(tmp_path / "shared.sqlite3"))
+    cache, other = ResponseCache(store), ResponseCache(store)
+    monkeypatch.setattr(descriptions, "get_response_cache", lambda: cache)
+    completion.release.set()
+    key = descriptions.description_cache_key(PARAMS)
+    owner = other.try_lease(key)
+    assert owner is not None
+
+    chunks = []
+    thread = threading.Thread(target=lambda: chunks.extend(descriptions.stream_description(PARAMS)))
+    thread.start()
+    wait_until(lambda: store.stats()["waits"] == 1)
+    if other_succeeds:
+        other.set(key, "From the other process")
+    other.release_lease(key, owner)
+    thread.join(TIMEOUT)
+
+    if other_succeeds:
+        assert (chunks, completion.calls) == (["From the other process"], 0)
+    else:
+        # The other process gave up (e.g. its user cancelled): this one requests it
+        assert ("".join(chunks), completion.calls) == ("Hello world", 1)
@@ -0,0 +1,32 @@
+"""Memoization of the Cost Estimator's dependency graph."""
+from estimator_graph import DependencyGraph, Node
+
+
+def make_graph(calls):
+    def record(name, value):
+        calls.append(name)
+        return value
+
+    return DependencyGraph([
+        Node("double", lambda params: record("double", params["x"] * 2), params=("x",)),
+        Node("lookup", lambda params, double, source: record("lookup", (double, source)), params=(),
+             depends_on=["double"], context=["source"]),
+    ])
+
+
+def test_unchanged_inputs_reuse_values():
+    calls, state = [], {}
+    graph = make_graph(calls)
+    graph.evaluate({"x": 1}, state, context={"source": "a"})
+    evaluation = graph.evaluate({"x": 1, "y": 2}, state, context={"source": "a"})
+    assert calls == ["double", "lookup"]
+    assert evaluation.values["lookup"] == (2, "a") and evaluation.recomputed == []
+
+
+def test_context_change_recomputes_only_its_nodes():
+    calls, state = [], {}
+    graph = make_graph(calls)
+    graph.evaluate({"x": 1}, state, context={"source": "a"})
+    evaluation = graph.evaluate({"x": 1}, state, context={"source": ("b", 2)})
+    assert calls == ["double", "lookup", "lookup"]
+    assert evaluation.values["lookup"] == (2, ("b", 2))